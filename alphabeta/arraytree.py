@@ -0,0 +1,226 @@
+import numpy as np
+from collections import deque
+
+NO_SCORE = -128 #int8 stand-in for a None score
+
+def _ChildIndex(offsets, nodes):
+    #Indices into the children array of every child of nodes, grouped by node in order
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    first = np.cumsum(counts) - counts
+    return np.repeat(starts - first, counts) + np.arange(counts.sum()), counts
+
+def _Levels(offsets, children, root=0):
+    #Node indices of the subtree under root, one array per depth below it
+    levels = []
+    level = np.array([root], dtype=np.int64)
+    while len(level):
+        levels.append(level)
+        child_index, _ = _ChildIndex(offsets, level)
+        level = children[child_index].astype(np.int64)
+    return levels
+
+def _Depths(offsets, children, num_nodes):
+    depth = np.zeros(num_nodes, dtype=np.int32)
+    for current_depth, level in enumerate(_Levels(offsets, children)):
+        depth[level] = current_depth
+    return depth
+
+class ArrayTree:
+    #Contiguous core for a Tree. Node id n lives at index n-1 and the root is node 1. The children of
+    #index i are children[offsets[i]:offsets[i+1]] (CSR), parent is -1 for the root and scores use NO_SCORE for None
+    def __init__(self, parent, offsets, children, scores):
+        self.parent = np.asarray(parent, dtype=np.int32)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.children = np.asarray(children, dtype=np.int32)
+        self.scores = np.asarray(scores, dtype=np.int8)
+        self.depth = _Depths(self.offsets, self.children, len(self.parent))
+
+    @classmethod
+    def FromParents(cls, parent, scores=None):
+        #Children keep their index order, which is generation order for BFS-numbered trees
+        parent = np.asarray(parent, dtype=np.int32)
+        num_nodes = len(parent)
+        if num_nodes == 0 or parent[0] != -1:
+            raise ValueError("the root must be the first node")
+        counts = np.bincount(parent[1:], minlength=num_nodes)
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        children = np.argsort(parent, kind="stable")[1:]
+        if scores is None:
+            scores = np.full(num_nodes, NO_SCORE, dtype=np.int8)
+        return cls(parent, offsets, children, scores)
+
+    @classmethod
+    def FromEdges(cls, edges_dict, scores):
+        num_nodes = max(max(scores, default=1), max((max(kids) for kids in edges_dict.values()), default=1))
+        counts = np.zeros(num_nodes, dtype=np.int64)
+        children = []
+        for node in range(1, num_nodes + 1):
+            kids = edges_dict.get(node, ())
+            counts[node-1] = len(kids)
+            children.extend(kids)
+        children = np.array(children, dtype=np.int64) - 1
+        parent = np.full(num_nodes, -1, dtype=np.int32)
+        parent[children] = np.repeat(np.arange(num_nodes), counts)
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(counts)
+        array_tree = cls(parent, offsets, children, np.full(num_nodes, NO_SCORE, dtype=np.int8))
+        array_tree.SetScores(scores)
+        return array_tree
+
+    @property
+    def num_nodes(self):
+        return len(self.parent)
+
+    def ChildCounts(self):
+        return np.diff(self.offsets)
+
+    def IsLeaf(self):
+        return self.offsets[1:] == self.offsets[:-1]
+
+    def Levels(self, node=1):
+        return _Levels(self.offsets, self.children, node-1)
+
+    def SetScores(self, scores):
+        for node, score in scores.items():
+            self.scores[node-1] = NO_SCORE if score is None else score
+
+    #Views in the shapes Tree has always used
+    def EdgesList(self):
+        parents = np.repeat(np.arange(1, self.num_nodes + 1), self.ChildCounts())
+        return list(zip(parents.tolist(), (self.children + 1).tolist()))
+
+    def EdgesDict(self):
+        children = (self.children + 1).tolist()
+        offsets = self.offsets.tolist()
+        return {node+1: tuple(children[offsets[node]:offsets[node+1]]) for node in np.flatnonzero(self.ChildCounts()).tolist()}
+
+    def ScoresDict(self, values=None):
+        values = self.scores if values is None else values
+        return {node+1: (None if score == NO_SCORE else score) for node, score in enumerate(values.tolist())}
+
+def Evaluate(array_tree: ArrayTree, node=1, minimax=False):
+    #Scores the subtree under node bottom up, a whole depth level per step, so deep trees don't recurse.
+    #Minimax maximises at node and alternates by depth, negamax maximises the negated child scores everywhere
+    values = array_tree.scores.astype(np.int16)
+    is_leaf = array_tree.IsLeaf()
+    levels = array_tree.Levels(node)
+    for relative_depth in range(len(levels) - 1, -1, -1):
+        parents = levels[relative_depth][~is_leaf[levels[relative_depth]]]
+        if len(parents) == 0:
+            continue
+        child_index, counts = _ChildIndex(array_tree.offsets, parents)
+        child_values = values[array_tree.children[child_index]]
+        starts = np.cumsum(counts) - counts
+        if not minimax:
+            values[parents] = np.maximum.reduceat(-child_values, starts)
+        elif relative_depth % 2 == 0:
+            values[parents] = np.maximum.reduceat(child_values, starts)
+        else:
+            values[parents] = np.minimum.reduceat(child_values, starts)
+    return values
+
+def MinimaxLeaves(array_tree: ArrayTree, side_to_move=1, node=1):
+    #Turns negamax leaf scores under node into minimax ones by flipping the sign on the opponent's plies
+    values = array_tree.scores.astype(np.int16)
+    is_leaf = array_tree.IsLeaf()
+    for relative_depth, level in enumerate(array_tree.Levels(node)):
+        leaves = level[is_leaf[level] & (values[level] != NO_SCORE)]
+        values[leaves] *= side_to_move if relative_depth % 2 == 0 else -side_to_move
+    return values
+
+def _Branching(rng, avg_branching_factor, budget, fixed_depth):
+    #Poisson branching like GenerateTree, clipped to what the leaf budget allows. A node with more than
+    #one leaf to place can't stop, so only fixed depth trees (which pass single leaves down) may take 1 child
+    branching_factor = rng.poisson(avg_branching_factor)
+    return int(min(max(branching_factor, 1 if fixed_depth else 2), budget))
+
+def GenerateLeafBoundedTree(rng, num_leaves, max_depth, avg_branching_factor, fixed_depth=False):
+    #Builds a tree with exactly num_leaves leaves (or a count drawn from a (low, high) range) in one pass.
+    #Every node carries a budget of leaves that is split between its children, so nothing is ever retried
+    if not isinstance(num_leaves, int):
+        num_leaves = int(rng.integers(num_leaves[0], num_leaves[1] + 1))
+    if num_leaves < 1 or (max_depth <= 1 and num_leaves > 1):
+        raise ValueError(f"can't fit {num_leaves} leaves in a tree of depth {max_depth}")
+
+    parent = [-1]
+    queue = deque([(0, num_leaves, 1)]) #(node index, leaf budget, depth)
+    while queue:
+        node, budget, depth = queue.popleft()
+        if depth >= max_depth or (budget == 1 and not fixed_depth):
+            continue
+        if depth == max_depth - 1:
+            branching_factor = budget
+        else:
+            branching_factor = _Branching(rng, avg_branching_factor, budget, fixed_depth)
+        budgets = 1 + rng.multinomial(budget - branching_factor, np.full(branching_factor, 1 / branching_factor))
+        for child_budget in budgets.tolist():
+            queue.append((len(parent), child_budget, depth + 1))
+            parent.append(node)
+
+    array_tree = ArrayTree.FromParents(parent)
+    is_leaf = array_tree.IsLeaf()
+    array_tree.scores[is_leaf] = rng.integers(-9, 10, size=int(is_leaf.sum()))
+    return array_tree
+
+def GenerateTrees(rng, count, avg_branching_factor, max_depth, fixed_depth=False):
+    #Same distribution as GenerateTree, but for count trees at once: every BFS level of the whole batch
+    #takes a single Poisson draw. Nodes are numbered in BFS order within each tree
+    banned = 0 if fixed_depth else 1
+    frontier_tree = np.arange(count, dtype=np.int64)
+    frontier_node = np.zeros(count, dtype=np.int64)
+    sizes = np.ones(count, dtype=np.int64)
+    level_trees, level_parents, level_nodes = [], [], []
+    depth = 1
+    while len(frontier_tree) and depth < max_depth:
+        branching_factors = rng.poisson(avg_branching_factor, size=len(frontier_tree))
+        redraw = branching_factors == banned
+        while redraw.any():
+            branching_factors[redraw] = rng.poisson(avg_branching_factor, size=int(redraw.sum()))
+            redraw = branching_factors == banned
+
+        #frontier is sorted by tree, so the children come out grouped by tree too
+        child_tree = np.repeat(frontier_tree, branching_factors)
+        child_parent = np.repeat(frontier_node, branching_factors)
+        new_per_tree = np.bincount(child_tree, minlength=count)
+        first_in_tree = np.cumsum(new_per_tree) - new_per_tree
+        child_node = sizes[child_tree] + np.arange(len(child_tree)) - first_in_tree[child_tree]
+        sizes += new_per_tree
+
+        level_trees.append(child_tree)
+        level_parents.append(child_parent)
+        level_nodes.append(child_node)
+        frontier_tree, frontier_node = child_tree, child_node
+        depth += 1
+
+    trees = np.concatenate([np.arange(count)] + level_trees)
+    parents = np.concatenate([np.full(count, -1)] + level_parents)
+    order = np.argsort(trees, kind="stable")
+    tree_offsets = np.zeros(count + 1, dtype=np.int64)
+    tree_offsets[1:] = np.cumsum(sizes)
+    return _SplitCorpus(tree_offsets, parents[order], None, rng)
+
+def _SplitCorpus(tree_offsets, parent, scores, rng=None):
+    array_trees = []
+    for start, end in zip(tree_offsets[:-1].tolist(), tree_offsets[1:].tolist()):
+        array_tree = ArrayTree.FromParents(parent[start:end], None if scores is None else scores[start:end])
+        if scores is None:
+            is_leaf = array_tree.IsLeaf()
+            array_tree.scores[is_leaf] = rng.integers(-9, 10, size=int(is_leaf.sum()))
+        array_trees.append(array_tree)
+    return array_trees
+
+#A corpus is every tree's parent and score arrays laid end to end, with tree_offsets marking where each one starts
+def SaveCorpus(path, array_trees):
+    tree_offsets = np.zeros(len(array_trees) + 1, dtype=np.int64)
+    tree_offsets[1:] = np.cumsum([array_tree.num_nodes for array_tree in array_trees])
+    np.savez_compressed(path,
+        tree_offsets=tree_offsets,
+        parent=np.concatenate([array_tree.parent for array_tree in array_trees]),
+        scores=np.concatenate([array_tree.scores for array_tree in array_trees])
+    )
+
+def LoadCorpus(path):
+    with np.load(path) as corpus:
+        return _SplitCorpus(corpus["tree_offsets"], corpus["parent"], corpus["scores"])
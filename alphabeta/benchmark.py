@@ -0,0 +1,165 @@
+#Times the tree routines and writes the results as JSON so runs from different commits can be diffed.
+#Run from this folder: python benchmark.py --mode pure --sizes 1000 100000 --output pure.json
+#"pure" only touches scores and arrays and runs without manim, "labels" also builds the Graphs and MathTex labels
+#FillTree returns, so only that mode imports tree.py
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+import numpy as np
+import random as Rand
+from arraytree import ArrayTree, GenerateTrees, GenerateLeafBoundedTree, Evaluate, MinimaxLeaves
+from fixtures import FIXTURES, GenerateTree, RejectionTree
+from search import CorpusTree, TTNegamax, Aspiration, PVS, PROBE, RESEARCH, CompareOrderings, IterativeDeepening
+
+def Measure(setup, routine, repeat):
+    #Best wall time over repeat runs, then one more run under tracemalloc for the peak, since tracing slows everything down
+    best = None
+    for _ in range(repeat):
+        argument = setup()
+        start = time.perf_counter()
+        routine(argument)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    argument = setup()
+    tracemalloc.start()
+    result = routine(argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}, result
+
+#Setups hand the routines a fresh ArrayTree, and the routines that need Tree or the search views build them
+def FixtureSetup(name):
+    fixture = FIXTURES[name]
+    return lambda: ArrayTree.FromEdges(fixture["edges_dict"], fixture["scores"])
+
+def SyntheticSetup(num_leaves, max_depth, branching_factor, seed):
+    array_tree = GenerateLeafBoundedTree(np.random.default_rng(seed), num_leaves, max_depth, branching_factor)
+    scores = array_tree.scores.copy()
+    def Setup():
+        array_tree.scores[:] = scores
+        return array_tree
+    return Setup
+
+def SearchRoutines(mode):
+    #GetMinimaxTree and the Evaluate rows are the array work Tree does for them, without the dict views
+    routines = {
+        "GetMinimaxTree": lambda array_tree: MinimaxLeaves(array_tree),
+        "Evaluate/minimax": lambda array_tree: Evaluate(array_tree, minimax=True),
+        "Evaluate/negamax": lambda array_tree: Evaluate(array_tree),
+        "TTNegamax": lambda array_tree: TTNegamax(CorpusTree(array_tree), record_trace=False),
+    }
+    if mode == "labels":
+        from tree import Tree, FillTree
+        routines = {
+            "labels": lambda array_tree: Tree.FromArrayTree(array_tree).labels,
+            "FillTree/minimax": lambda array_tree: FillTree(Tree.FromArrayTree(array_tree), is_minimax=True),
+            "FillTree/negamax": lambda array_tree: FillTree(Tree.FromArrayTree(array_tree), is_minimax=False),
+            "FillTree/alphabeta": lambda array_tree: FillTree(Tree.FromArrayTree(array_tree), is_minimax=False, alphabeta=True),
+        }
+    return routines
+
+def GenerationRoutines(args):
+    def Legacy(_):
+        np.random.seed(args.seed)
+        Rand.seed(args.seed)
+        return GenerateTree(args.branching_factor, args.max_depth, False)
+
+    def Rejection(_):
+        np.random.seed(args.seed)
+        Rand.seed(args.seed)
+        return len(RejectionTree(args.branching_factor, args.max_depth)[2])
+
+    #The leaf range Tree.RandomTree asks for when it's only given a seed
+    leaf_offset = max(0, args.max_depth - 4)
+
+    #Each routine returns how many nodes it generated
+    return {
+        "GenerateTree": lambda _: len(Legacy(_)[2]),
+        "RandomTree/rejection": Rejection,
+        "RandomTree/seeded": lambda _: GenerateLeafBoundedTree(np.random.default_rng(args.seed), (8 + leaf_offset, 10 + leaf_offset), args.max_depth, args.branching_factor).num_nodes,
+        f"GenerateTrees/{args.batch}": lambda _: sum(array_tree.num_nodes for array_tree in GenerateTrees(np.random.default_rng(args.seed), args.batch, args.branching_factor, args.max_depth)),
+    }
+
+def Run(args):
+    results = []
+    def Record(tree_name, nodes, routine_name, measurement):
+        results.append({"tree": tree_name, "nodes": nodes, "routine": routine_name, **measurement})
+        print(f"{tree_name:>16} {nodes:>9} {routine_name:<24} {measurement['seconds']*1000:10.3f} ms {measurement['peak_bytes']/1024:10.1f} KiB")
+
+    for routine_name, routine in GenerationRoutines(args).items():
+        measurement, nodes = Measure(lambda: None, routine, args.repeat)
+        Record("generated", nodes, routine_name, measurement)
+
+    setups = [(name, FixtureSetup(name)) for name in FIXTURES]
+    for num_leaves in args.sizes:
+        if args.mode == "labels" and num_leaves > args.label_limit:
+            continue
+        setups.append((f"synthetic/{num_leaves}", SyntheticSetup(num_leaves, args.synthetic_depth, args.branching_factor, args.seed)))
+
+    for tree_name, setup in setups:
+        nodes = setup().num_nodes
+        for routine_name, routine in SearchRoutines(args.mode).items():
+            Record(tree_name, nodes, routine_name, Measure(setup, routine, args.repeat)[0])
+        if args.mode == "pure":
+            #Node counts rather than times, to see what each widening policy saves over a full window search
+            for widening in ("linear", "exponential", "full"):
+                aspiration = Aspiration(CorpusTree(setup()), guess=args.aspiration_guess, window=args.aspiration_window, widening=widening, compare=True)
+                results.append({"tree": tree_name, "nodes": nodes, "routine": f"Aspiration/{widening}", "attempts": len(aspiration.attempts), "nodes_searched": aspiration.nodes, "full_window_nodes": aspiration.full_window_nodes})
+                print(f"{tree_name:>16} {nodes:>9} {'Aspiration/' + widening:<24} {len(aspiration.attempts):>3} searches {aspiration.nodes:>9} nodes vs {aspiration.full_window_nodes} full window")
+            pvs = PVS(CorpusTree(setup()), compare=True)
+            probes = list(pvs.probes.values())
+            results.append({"tree": tree_name, "nodes": nodes, "routine": "PVS", "nodes_searched": pvs.nodes, "alphabeta_nodes": pvs.alphabeta_nodes, "null_window_probes": probes.count(PROBE), "re_searches": probes.count(RESEARCH)})
+            print(f"{tree_name:>16} {nodes:>9} {'PVS':<24} {pvs.nodes:>9} nodes vs {pvs.alphabeta_nodes} alpha-beta, {probes.count(RESEARCH)}/{len(probes)} null windows re-searched")
+            for row in CompareOrderings([CorpusTree(setup())]):
+                results.append({"tree": tree_name, "nodes": nodes, "routine": f"AlphaBeta/{row['ordering']}", "nodes_searched": row["nodes"], "cutoffs": row["cutoffs"]})
+                print(f"{tree_name:>16} {nodes:>9} {'AlphaBeta/' + row['ordering']:<24} {row['nodes']:>9} nodes {row['cutoffs']:>9} cutoffs")
+            for iteration in IterativeDeepening(CorpusTree(setup())).iterations:
+                results.append({"tree": tree_name, "nodes": nodes, "routine": f"IterativeDeepening/{iteration.depth}", "seconds": iteration.seconds, "nodes_searched": iteration.nodes, "branching_factor": iteration.branching_factor})
+                print(f"{tree_name:>16} {nodes:>9} {'IterativeDeepening/' + str(iteration.depth):<24} {iteration.seconds*1000:10.3f} ms {iteration.nodes:>9} nodes")
+
+    if args.mode == "labels":
+        from labels import LABELS
+        results.append({"tree": "all", "routine": "LABELS", **LABELS.Stats()})
+    return results
+
+def Commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark tree generation and search")
+    parser.add_argument("--mode", choices=["pure", "labels"], default="pure")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[100, 1000, 10000, 100000], help="leaf counts of the synthetic trees")
+    parser.add_argument("--synthetic-depth", type=int, default=12)
+    parser.add_argument("--max-depth", type=int, default=5, help="depth used by the generators")
+    parser.add_argument("--branching-factor", type=float, default=2.5)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument("--label-limit", type=int, default=1000, help="largest synthetic tree built with labels")
+    parser.add_argument("--aspiration-guess", type=float, default=0)
+    parser.add_argument("--aspiration-window", type=float, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+    if not args.aspiration_window >= 1:
+        parser.error("--aspiration-window must be at least 1")
+
+    report = {
+        "commit": Commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "mode": args.mode,
+        "arguments": vars(args),
+        "results": Run(args),
+    }
+    if args.output is None:
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
@@ -0,0 +1,93 @@
+#The fixed trees the scenes and the benchmark share, and the dict-based random tree generator, kept apart from
+#tree.py so they can be used without manim. A tree's size is one more than its node count, like Tree.size
+import numpy as np
+import random as Rand
+from collections import deque
+
+FIXTURES = {
+    "minimax": {
+        "edges_list": [(1,2),(1,3),(2,4),(2,5),(3,6),(3,7)],
+        "edges_dict": {1: (2, 3), 2: (4, 5), 3: (6, 7)},
+        "scores": {1: None, 2: None, 3: None, 4: 6, 5: -4, 6: 7, 7: 2},
+    },
+    "ab": {
+        "edges_list": [(1, 2), (1, 3), (3, 4), (3, 5), (4, 6), (4, 7), (4, 8), (6, 9), (6, 10), (6, 11), (7, 12), (7, 13), (7, 14), (8, 15), (8, 16), (8, 17)],
+        "edges_dict": {1: (2, 3), 3: (4, 5), 4: (6, 7, 8), 6: (9, 10, 11), 7: (12, 13, 14), 8: (15, 16, 17)},
+        "scores": {1: None, 2: -6, 3: None, 4: None, 5: 3, 6: None, 7: None, 8: None, 9: -4, 10: 9, 11: 7, 12: 7, 13: -4, 14: 9, 15: 9, 16: 7, 17: -4},
+    },
+    "asp": {
+        "edges_list": [(1, 2), (1, 3), (2, 4), (2, 5), (3, 6), (3, 7), (4, 8), (4, 9), (8, 10), (8, 11), (8, 12), (8, 13), (8, 14), (9, 15), (9, 16), (9, 17)],
+        "edges_dict": {1: (2, 3), 2: (4, 5), 3: (6, 7), 4: (8, 9), 8: (10, 11, 12, 13, 14), 9: (15, 16, 17)},
+        "scores": {1: None, 2: None, 3: None, 4: None, 5: -1, 6: 6, 7: 2, 8: None, 9: None, 10: 3, 11: 4, 12: -9, 13: 7, 14: 2, 15: -6, 16: 6, 17: 7},
+    },
+    "ab_intro": {
+        "edges_list": [(1, 2), (1, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (3, 9), (3, 10), (4, 11), (4, 12), (4, 13), (5, 14), (5, 15), (6, 16), (6, 17), (7, 18), (7, 19), (7, 20), (7, 21), (7, 22), (8, 23), (8, 24), (8, 25), (8, 26), (9, 27), (9, 28), (9, 29), (10, 30), (10, 31), (10, 32), (10, 33), (11, 34), (11, 35), (12, 36), (12, 37), (12, 38), (12, 39), (12, 40), (12, 41), (13, 42), (13, 43), (13, 44), (13, 45), (13, 46), (13, 47), (13, 48), (14, 49), (14, 50), (14, 51), (14, 52), (14, 53), (14, 54), (14, 55), (15, 56), (15, 57), (15, 58), (16, 59), (16, 60), (16, 61), (16, 62), (16, 63), (17, 64), (17, 65), (17, 66), (18, 67), (18, 68), (18, 69), (19, 70), (19, 71), (19, 72), (19, 73), (19, 74), (19, 75), (19, 76), (19, 77), (19, 78), (19, 79), (19, 80), (19, 81), (20, 82), (20, 83), (21, 84), (21, 85), (21, 86), (22, 87), (22, 88), (22, 89), (22, 90), (23, 91), (23, 92), (23, 93), (23, 94), (24, 95), (24, 96), (24, 97), (24, 98), (24, 99), (25, 100), (25, 101), (25, 102), (25, 103), (25, 104), (26, 105), (26, 106), (27, 107), (27, 108), (27, 109), (28, 110), (28, 111), (29, 112), (29, 113), (29, 114), (29, 115), (30, 116), (30, 117), (31, 118), (31, 119), (31, 120), (32, 121), (33, 122), (33, 123), (33, 124)],
+        "edges_dict": {1: (2, 3), 2: (4, 5, 6, 7, 8), 3: (9, 10), 4: (11, 12, 13), 5: (14, 15), 6: (16, 17), 7: (18, 19, 20, 21, 22), 8: (23, 24, 25, 26), 9: (27, 28, 29), 10: (30, 31, 32, 33), 11: (34, 35), 12: (36, 37, 38, 39, 40, 41), 13: (42, 43, 44, 45, 46, 47, 48), 14: (49, 50, 51, 52, 53, 54, 55), 15: (56, 57, 58), 16: (59, 60, 61, 62, 63), 17: (64, 65, 66), 18: (67, 68, 69), 19: (70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81), 20: (82, 83), 21: (84, 85, 86), 22: (87, 88, 89, 90), 23: (91, 92, 93, 94), 24: (95, 96, 97, 98, 99), 25: (100, 101, 102, 103, 104), 26: (105, 106), 27: (107, 108, 109), 28: (110, 111), 29: (112, 113, 114, 115), 30: (116, 117), 31: (118, 119, 120), 32: (121,), 33: (122, 123, 124)},
+        "scores": {1: -1, 2: 7, 3: 1, 4: -6, 5: -6, 6: -7, 7: -3, 8: 7, 9: -1, 10: 8, 11: 6, 12: 9, 13: 8, 14: 6, 15: 8, 16: 7, 17: 7, 18: 8, 19: 9, 20: 3, 21: None, 22: None, 23: 9, 24: 9, 25: 7, 26: -7, 27: 8, 28: 9, 29: 1, 30: -8, 31: None, 32: None, 33: None, 34: -6, 35: 3, 36: -9, 37: -3, 38: 6, 39: -7, 40: 6, 41: -8, 42: 7, 43: 2, 44: 6, 45: -1, 46: 8, 47: 2, 48: -8, 49: -6, 50: 1, 51: 2, 52: -3, 53: 9, 54: 3, 55: 6, 56: -1, 57: -8, 58: -6, 59: 3, 60: -2, 61: -3, 62: -7, 63: 4, 64: -7, 65: 7, 66: -3, 67: -8, 68: -2, 69: -7, 70: 0, 71: -5, 72: -5, 73: 2, 74: 3, 75: 0, 76: -3, 77: 2, 78: 4, 79: -2, 80: -9, 81: 1, 82: -3, 83: 4, 84: -3, 85: 6, 86: 9, 87: -9, 88: 0, 89: 1, 90: 7, 91: -9, 92: -8, 93: 1, 94: 7, 95: 5, 96: -3, 97: 2, 98: 7, 99: -9, 100: 1, 101: -1, 102: -7, 103: 9, 104: 7, 105: 7, 106: 9, 107: -8, 108: 7, 109: 3, 110: -2, 111: -9, 112: 2, 113: -1, 114: 3, 115: 1, 116: 9, 117: 8, 118: 6, 119: -5, 120: 6, 121: 8, 122: 1, 123: 5, 124: -3},
+    },
+}
+
+def GenerateTree(avgBranchingFactor, max_depth, fixed_depth: bool):
+    edges_list = []
+    edges_dict = {}
+    depths = {1: 0} #root at 0, like ArrayTree.depth
+    children = []
+    node_counter = 2  # 1 is the root 1 is current node
+    queue = deque()
+    queue.append((1, 1))  # (nodeID, currentDepth)
+
+    #Generate edges
+    while queue:
+        parentID, depth = queue.popleft()
+
+        if depth >= max_depth:
+            continue
+
+        branchingFactor = np.random.poisson(avgBranchingFactor)
+
+        if fixed_depth:
+            while (branchingFactor == 0):
+                branchingFactor = np.random.poisson(avgBranchingFactor)
+
+        elif not fixed_depth:
+            while (branchingFactor == 1):
+                branchingFactor = np.random.poisson(avgBranchingFactor)
+
+        for _ in range(branchingFactor):
+            childID = node_counter
+            node_counter += 1
+            if parentID in edges_dict:
+                children.append(childID)
+            else:
+                children = [childID]
+            edges_dict[parentID] = children
+            edges_list.append((parentID, childID))
+            depths[childID] = depth
+            queue.append((childID, depth + 1))
+
+    for edge in edges_dict:
+        edges_dict[edge] = tuple(edges_dict[edge])
+
+    #Generate scores
+    scores = {}
+    if len(list(edges_dict.keys())) == 0:
+        return edges_list, edges_dict, {1: None}, depths
+    max_node = edges_dict[list(edges_dict.keys())[-1]][-1]
+    for nodeID in range(1, max_node+1):
+        if nodeID in edges_dict: #parent node
+            scores[nodeID] = None
+        else: #child node
+            scores[nodeID] = Rand.randint(-9, 9)
+
+    return edges_list, edges_dict, scores, depths
+
+def RejectionTree(avg_branching_factor, max_depth, fixed_depth=False):
+    #GenerateTree until the tree has between 8 and 10 leaves (more for deeper trees), what Tree.RandomTree has always done
+    leaf_offset = max(0, max_depth - 4)
+    if fixed_depth:
+        leaf_offset = 0
+    num_leaves = 0
+    while num_leaves < (8 + leaf_offset) or num_leaves > (10 + leaf_offset):
+        edges_list, edges_dict, scores, depths = GenerateTree(avg_branching_factor, max_depth, fixed_depth)
+        num_leaves = sum(score is not None for score in scores.values())
+    return edges_list, edges_dict, scores, depths
@@ -0,0 +1,32 @@
+from manim import MathTex, UP
+
+class LabelFactory:
+    #Tree labels only ever show a handful of strings (-9..9, blanks and infinities), so each one is
+    #parsed from TeX once and every later request gets a copy. Graphs get flipped after they're built, so
+    #their labels come pre-flipped, while a TreeMobject is laid out the right way round and wants them upright
+    def __init__(self):
+        self.labels = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, text, flipped=True):
+        key = (str(text), flipped)
+        if key in self.labels:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.labels[key] = MathTex(key[0]).flip(axis=UP) if flipped else MathTex(key[0])
+        return self.labels[key].copy()
+
+    def Stats(self):
+        return {"hits": self.hits, "misses": self.misses, "distinct": len(self.labels)}
+
+    def Clear(self):
+        self.labels = {}
+        self.hits = 0
+        self.misses = 0
+
+LABELS = LabelFactory()
+
+def Label(text, flipped=True):
+    return LABELS(text, flipped)
@@ -0,0 +1,159 @@
+import numpy as np
+
+#Tree layouts without going through networkx. The placement is the same greedy tidy tree manim's layout="tree"
+#uses (SageMath's): children are placed bottom up, a parent sits over the mean of its children, and a subtree that
+#would overlap the nodes already placed on its levels slides right. manim slides by walking the whole subtree, so
+#here a slide only adds to the subtree root's mod (Walker's trick), which is pushed down to the descendants in one
+#pass at the end. Every level's rightmost node always belongs to the subtree that just finished, so a slide also
+#moves the obstructions on all the subtree's levels by the same amount. That's a range update over the levels, kept
+#in a Fenwick tree so it costs O(log H) instead of the subtree's height, and the whole layout is O(N log H) for N
+#nodes and H levels, even for combs where nearly every node slides. This isn't Walker's or Reingold-Tilford's
+#algorithm, which are linear but only compare contours and so place nodes differently from manim.
+#Positions match manim's to rounding, so swapping it in doesn't move anything on screen
+
+def _Children(edges_list, root):
+    #Same child order as manim, which takes the neighbours in the order their edges were added
+    neighbours = {}
+    for u, v in edges_list:
+        neighbours.setdefault(u, []).append(v)
+        neighbours.setdefault(v, []).append(u)
+    children = {root: neighbours.get(root, [])}
+    order = [root]
+    for node in order:
+        for child in children[node]:
+            children[child] = [neighbour for neighbour in neighbours[child] if neighbour != node]
+            order.append(child)
+    return children
+
+class _Obstructions:
+    #Where the next node on each level may go, as a Fenwick tree over the differences between consecutive levels, so
+    #adding to a range of levels and reading one level are both O(log H)
+    def __init__(self, levels):
+        self.tree = [0.0] * (levels + 2)
+
+    def _Add(self, level, amount):
+        index = level + 1
+        while index < len(self.tree):
+            self.tree[index] += amount
+            index += index & -index
+
+    def __getitem__(self, level):
+        total = 0.0
+        index = level + 1
+        while index > 0:
+            total += self.tree[index]
+            index -= index & -index
+        return total
+
+    def __setitem__(self, level, value):
+        self.AddRange(level, level, value - self[level])
+
+    def AddRange(self, first, last, amount):
+        self._Add(first, amount)
+        self._Add(last + 1, -amount)
+
+def TidyTree(edges_list, root=1):
+    #Unscaled (x, depth) of every node, before manim's centring and scaling
+    children = _Children(edges_list, root)
+    x = {}
+    mod = {}
+    height = {}
+    depth = {root: 0}
+    order = [root]
+    for node in order:
+        for child in children[node]:
+            depth[child] = depth[node] + 1
+            order.append(child)
+    obstruction = _Obstructions(max(depth.values()) + 1)
+
+    #Iterative post order, last child first, which is the order manim's stack pops them in
+    stack = [(root, False)]
+    while stack:
+        node, finished = stack.pop()
+        if not finished:
+            stack.append((node, True))
+            for child in children[node]:
+                stack.append((child, False))
+            continue
+
+        level = depth[node]
+        mod[node] = 0.0
+        node_children = children[node]
+        if not node_children:
+            height[node] = 0
+            x[node] = obstruction[level]
+        else:
+            height[node] = 1 + max(height[child] for child in node_children)
+            x[node] = sum(x[child] for child in node_children) / float(len(node_children))
+            shift = obstruction[level] - x[node]
+            if shift > 0:
+                x[node] += shift
+                mod[node] = shift
+                obstruction.AddRange(level+1, level+height[node], shift)
+        obstruction[level] = x[node] + 1
+
+    #Push the mods down, each node's children were placed relative to it before any of its slides
+    positions = {}
+    pending = [(root, 0.0)]
+    while pending:
+        node, offset = pending.pop()
+        positions[node] = (x[node] + offset, depth[node])
+        for child in children[node]:
+            pending.append((child, offset + mod[node]))
+    return positions
+
+def _Scale(positions, layout_scale, flip, shift):
+    #manim's centring and layout_scale, then .flip(axis=UP).move_to(shift) for a layout centred on the origin
+    nodes = list(positions)
+    points = np.array([positions[node] for node in nodes], dtype=float)
+    points = np.column_stack([points[:, 0], -points[:, 1], np.zeros(len(nodes))])
+    low = points.min(axis=0)
+    high = points.max(axis=0)
+    width, height = (high - low)[:2]
+    if isinstance(layout_scale, (int, float)) and (width > 0 or height > 0):
+        scale = 2*layout_scale / max(width, height)
+    elif isinstance(layout_scale, tuple):
+        scale = np.array([
+            2*layout_scale[0] / width if layout_scale[0] is not None and width > 0 else 1,
+            2*layout_scale[1] / height if layout_scale[1] is not None and height > 0 else 1,
+            0
+        ])
+    else:
+        scale = 1
+    points = (points - (low + high)/2) * scale
+    if flip:
+        points[:, 0] *= -1
+    points += np.asarray(shift, dtype=float)
+    return dict(zip(nodes, points))
+
+class LayoutCache:
+    #Scenes lay the same few trees out over and over, so layouts are kept by edge list, root, scale and transform
+    def __init__(self):
+        self.layouts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, edges_list, root=1, layout_scale=2, flip=False, shift=(0, 0, 0)):
+        key = (tuple(map(tuple, edges_list)), root, tuple(layout_scale) if isinstance(layout_scale, (list, tuple)) else layout_scale, flip, tuple(np.asarray(shift, dtype=float)))
+        if key in self.layouts:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.layouts[key] = _Scale(TidyTree(edges_list, root), key[2], flip, shift)
+        #Copies, since Graph keeps hold of the layout it's given
+        return {node: point.copy() for node, point in self.layouts[key].items()}
+
+    def Stats(self):
+        return {"hits": self.hits, "misses": self.misses, "distinct": len(self.layouts)}
+
+    def Clear(self):
+        self.layouts = {}
+        self.hits = 0
+        self.misses = 0
+
+LAYOUTS = LayoutCache()
+
+def TreeLayout(edges_list, root=1, layout_scale=2, flip=False, shift=(0, 0, 0)):
+    #Positions for Graph(..., layout=TreeLayout(...)). flip and shift do what .flip(axis=UP).move_to(shift) does to
+    #the finished Graph, for when only the positions are needed
+    return LAYOUTS(edges_list, root, layout_scale, flip, shift)
@@ -0,0 +1,145 @@
+#Renders one scene across several processes and stitches the pieces back together.
+#Run from this folder: python render.py scene.py AB --workers 32 -q h
+#A dry run first records which play each next_section starts at, with every animation skipped so no frames are drawn,
+#and compiles the scene's LaTeX and text into the shared caches before any worker starts. Every worker then renders a
+#range of plays with manim's from/upto animation numbers, replaying everything before its range with animations skipped.
+#The RNGs are seeded the same way in every process, so each range starts from exactly the state a serial render would have.
+#Sections marked skip_animations=True are rendered too, since this is for the finished video, unless --skip-marked asks
+#for only what a plain manim render would draw.
+#For a SectionedScene the dry run also snapshots every section, and workers resume from their section's snapshot
+#instead of replaying the whole scene up to it
+import argparse
+import importlib
+import json
+import math
+import os
+import random as Rand
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+import numpy as np
+from manim import config, DefaultSectionType
+
+QUALITIES = {"l": "low_quality", "m": "medium_quality", "h": "high_quality", "p": "production_quality", "k": "fourk_quality"}
+
+def LoadScene(scene_file, scene_name):
+    #The scenes import their neighbours (tree, search, ...) by plain module name
+    sys.path.insert(0, os.path.dirname(os.path.abspath(scene_file)))
+    module = importlib.import_module(os.path.splitext(os.path.basename(scene_file))[0])
+    return getattr(module, scene_name)
+
+def SectionRecorder(scene_class, section_log, include_skipped=True):
+    #Same scene, but every next_section notes the play it starts at. marked_skip is the skip_animations the scene asked
+    #for and skip whether the section is left out of this render, whatever the recording renderer itself is skipping
+    class Recorder(scene_class):
+        def next_section(self, name="unnamed", section_type=DefaultSectionType.NORMAL, skip_animations=False):
+            section_log.append({"name": name, "start": self.renderer.num_plays, "marked_skip": skip_animations, "skip": skip_animations and not include_skipped})
+            super().next_section(name, section_type, skip_animations and not include_skipped)
+
+    Recorder.__name__ = scene_class.__name__
+    Recorder.__qualname__ = scene_class.__qualname__
+    return Recorder
+
+def Seed(seed):
+    Rand.seed(seed)
+    np.random.seed(seed)
+
+def CacheDirs(work_dir):
+    #Every process compiles into the same LaTeX and text caches. The dry run fills them before the workers start, so the
+    #workers only ever read from them and never race each other writing the same files
+    config.tex_dir = os.path.join(work_dir, "Tex")
+    config.text_dir = os.path.join(work_dir, "texts")
+
+def DryRun(scene_file, scene_name, work_dir, include_skipped, seed):
+    config.dry_run = True
+    config.media_dir = os.path.join(work_dir, "dry_run")
+    CacheDirs(work_dir)
+    section_log = [{"name": "start", "start": 0, "marked_skip": False, "skip": False}]
+    Seed(seed)
+    #skip_animations on the scene itself, so the renderer skips every play and draws no frames whatever the sections ask
+    scene = SectionRecorder(LoadScene(scene_file, scene_name), section_log, include_skipped)(skip_animations=True)
+    scene.render()
+    total_plays = scene.renderer.num_plays
+    for section, next_section in zip(section_log, section_log[1:] + [{"start": total_plays}]):
+        section["end"] = next_section["start"]
+    return section_log, total_plays
+
+def Chunks(sections, chunk_plays):
+    #Play ranges to render. They never cross a section boundary, so sections left out of the render are never drawn
+    chunks = []
+    for section in sections:
+        if section["skip"]:
+            continue
+        for start in range(section["start"], section["end"], chunk_plays):
+            chunks.append((section["name"], start, min(start + chunk_plays, section["end"])))
+    return chunks
+
+def RenderChunk(job):
+    scene_file, scene_name, index, section, start, end, work_dir, quality, include_skipped, seed = job
+    #Pool processes are reused, so this is set for every job. Workers only read the dry run's snapshots
+    os.environ["RESUME_SECTION"] = section if section != "start" else ""
+    os.environ["SNAPSHOTS"] = "0"
+    config.quality = quality
+    config.media_dir = os.path.join(work_dir, f"chunk_{index:04}")
+    CacheDirs(work_dir)
+    config.from_animation_number = start
+    config.upto_animation_number = end - 1
+    config.output_file = f"{scene_name}_{index:04}"
+    Seed(seed)
+
+    started = time.perf_counter()
+    scene = SectionRecorder(LoadScene(scene_file, scene_name), [], include_skipped)()
+    scene.render()
+    return str(scene.renderer.file_writer.movie_file_path), time.perf_counter() - started
+
+def Concatenate(movie_files, output, work_dir):
+    list_file = os.path.join(work_dir, "chunks.txt")
+    with open(list_file, "w") as file:
+        for movie_file in movie_files:
+            file.write(f"file '{os.path.abspath(movie_file)}'\n")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", output], check=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a sectioned scene in parallel")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-plays", type=int, default=0, help="most plays per worker job, 0 spreads the plays evenly over the workers")
+    parser.add_argument("-q", "--quality", choices=QUALITIES.keys(), default="h")
+    parser.add_argument("--skip-marked", action="store_true", help="leave out sections marked skip_animations=True, like a plain manim render")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--work-dir", default=os.path.join("media", "parallel"))
+    parser.add_argument("--output", default=None)
+    args = parser.parse_args()
+
+    work_dir = os.path.abspath(os.path.join(args.work_dir, args.scene_name))
+    output = args.output or os.path.join("media", "videos", f"{args.scene_name}.mp4")
+    #Set before the pool starts so the workers read the snapshots the dry run writes
+    os.environ["SNAPSHOT_DIR"] = os.path.join(work_dir, "snapshots")
+    os.environ["SNAPSHOTS"] = "1"
+    include_skipped = not args.skip_marked
+    sections, total_plays = DryRun(args.scene_file, args.scene_name, work_dir, include_skipped, args.seed)
+    rendered_plays = sum(section["end"] - section["start"] for section in sections if not section["skip"])
+    chunk_plays = args.chunk_plays or max(1, math.ceil(rendered_plays / args.workers))
+    chunks = Chunks(sections, chunk_plays)
+    print(f"{args.scene_name}: {total_plays} plays, {rendered_plays} rendered in {len(chunks)} chunks")
+
+    jobs = [(args.scene_file, args.scene_name, index, section, start, end, work_dir, QUALITIES[args.quality], include_skipped, args.seed) for index, (section, start, end) in enumerate(chunks)]
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=get_context("spawn")) as executor:
+        rendered = list(executor.map(RenderChunk, jobs))
+    Concatenate([movie_file for movie_file, _ in rendered], output, work_dir)
+
+    report = {
+        "scene": args.scene_name,
+        "output": output,
+        "seconds": time.perf_counter() - started,
+        "sections": sections,
+        "chunks": [{"section": name, "start": start, "end": end, "seconds": seconds} for (name, start, end), (_, seconds) in zip(chunks, rendered)],
+    }
+    with open(os.path.join(work_dir, "report.json"), "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Wrote {output} in {report['seconds']:.1f}s")
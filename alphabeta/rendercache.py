@@ -0,0 +1,205 @@
+#Render cache keyed on what a segment shows rather than on every mobject in the scene.
+#manim names each partial movie after a hash of the whole scene state, so any edit re-renders everything after it
+#and leaves the old partials behind. Inside a Segment, a play is named after the semantic inputs given to it (tree
+#contents, step, window values, ...), the source of every function, class and constant it draws with, a Chain hash of
+#everything put on screen before it, plus the animation types and the output settings. Unchanged segments keep their
+#partial movie across edits and are shared between scenes. Outside a Segment manim's own hash is used.
+#A scene opts in with rendercache.Install(self) in its setup, and every other scene renders the way manim always does.
+#Every render is recorded in media_dir/render_cache.json, and Collect deletes the partials no latest render uses,
+#least recently used first, until the rest fit under the size cap.
+#Run from this folder to clean a media folder: python rendercache.py ../tictactoe/media --max-size 200M
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+import manim
+from manim import config, logger
+from manim.renderer import cairo_renderer
+from manim.scene.scene_file_writer import SceneFileWriter
+
+MANIFEST = "render_cache.json"
+SIZE_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+_original_hash = cairo_renderer.get_hash_from_play_call
+_original_finish = SceneFileWriter.finish
+_segments = {}  #scene -> (inputs, play the segment started at)
+_keys = {}      #hash -> semantic inputs it was made from, until the render is recorded
+_writers = set() #file writers of the scenes that opted in
+_index = {}     #manifest path -> {hash: partial movie with that hash}, loaded once per render
+_max_bytes = None
+
+def ParseSize(size):
+    size = str(size).strip().upper()
+    if size[-1:] in SIZE_UNITS:
+        return int(float(size[:-1]) * SIZE_UNITS[size[-1]])
+    return int(size)
+
+def ManifestPath(media_dir=None):
+    return os.path.join(media_dir or config.get_dir("media_dir"), MANIFEST)
+
+def LoadManifest(media_dir=None):
+    path = ManifestPath(media_dir)
+    if not os.path.exists(path):
+        return {"files": {}, "renders": {}}
+    with open(path) as file:
+        return json.load(file)
+
+def SaveManifest(manifest, media_dir=None):
+    path = ManifestPath(media_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "w") as file:
+        json.dump(manifest, file, indent=1)
+    os.replace(path + ".tmp", path)
+
+def _Source(code):
+    #Functions and classes by their source, constants by their value
+    return inspect.getsource(code) if callable(code) else repr(code)
+
+def Chain(previous, *items):
+    #Hash of previous followed by items. Chaining every step's inputs gives each step a key for everything drawn
+    #before it, so a change upstream invalidates every segment after it
+    digest = hashlib.sha256((previous or "").encode())
+    for item in items:
+        digest.update(json.dumps(item, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+@contextmanager
+def Segment(scene, code=(), **inputs):
+    #Every play inside is keyed on inputs and the source or value of everything in code, so anything else that
+    #changes what the segment looks like (the tree's contents, helpers, constants, what's already on screen) has to be
+    #in one of them
+    inputs["code"] = hashlib.sha256("".join(_Source(item) for item in code).encode()).hexdigest()
+    outer = _segments.get(scene)
+    _segments[scene] = (inputs, scene.renderer.num_plays)
+    try:
+        yield
+    finally:
+        if outer is None:
+            del _segments[scene]
+        else:
+            _segments[scene] = outer
+
+def SemanticHash(scene_object, camera_object, animations_list, current_mobjects_list, *args, **kwargs):
+    if scene_object not in _segments:
+        return _original_hash(scene_object, camera_object, animations_list, current_mobjects_list, *args, **kwargs)
+
+    inputs, start = _segments[scene_object]
+    key = {
+        "inputs": inputs,
+        "play": scene_object.renderer.num_plays - start,
+        "animations": [(type(animation).__name__, animation.run_time, animation.rate_func.__name__) for animation in animations_list],
+        "output": [config.pixel_width, config.pixel_height, config.frame_rate, str(config.background_color), config.movie_file_extension, manim.__version__],
+    }
+    hash_play = "s" + hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()[:40]
+    _keys[hash_play] = key
+    _Link(scene_object.renderer.file_writer, hash_play)
+    return hash_play
+
+def _Link(file_writer, hash_play):
+    #Another scene may already have rendered this segment, in which case it only needs linking into this scene's partials
+    path = os.path.join(file_writer.partial_movie_directory, f"{hash_play}{config.movie_file_extension}")
+    if os.path.exists(path):
+        return
+    cached_path = _Index().get(hash_play)
+    if cached_path is not None and os.path.exists(cached_path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            os.link(cached_path, path)
+        except OSError:
+            shutil.copyfile(cached_path, path)
+        logger.info(f"Reusing {cached_path} for segment {hash_play}")
+
+def _Index():
+    #The manifest is read the first time a render misses, instead of on every miss. Recording the render drops it
+    manifest_path = ManifestPath()
+    if manifest_path not in _index:
+        files = LoadManifest()["files"]
+        _index[manifest_path] = {entry["hash"]: cached_path for cached_path, entry in files.items() if os.path.exists(cached_path)}
+    return _index[manifest_path]
+
+def RecordingFinish(file_writer, *args, **kwargs):
+    if file_writer not in _writers:
+        return _original_finish(file_writer, *args, **kwargs)
+    #manim's own cap on the number of partials is replaced by Collect's size cap, for this scene only
+    max_files_cached = config.max_files_cached
+    if _max_bytes is not None:
+        config.max_files_cached = -1
+    try:
+        result = _original_finish(file_writer, *args, **kwargs)
+    finally:
+        config.max_files_cached = max_files_cached
+    partial_movie_files = [os.path.abspath(path) for path in getattr(file_writer, "partial_movie_files", []) if path is not None]
+    if not partial_movie_files:
+        return result
+
+    manifest = LoadManifest()
+    now = time.time()
+    manifest["renders"][os.path.abspath(file_writer.partial_movie_directory)] = partial_movie_files
+    for path in partial_movie_files:
+        if not os.path.exists(path):
+            continue
+        hash_play = os.path.splitext(os.path.basename(path))[0]
+        entry = manifest["files"].setdefault(path, {"hash": hash_play, "key": None})
+        entry["key"] = _keys.get(hash_play, entry["key"])
+        entry["size"] = os.path.getsize(path)
+        entry["last_used"] = now
+    SaveManifest(manifest)
+    _index.pop(ManifestPath(), None)
+    if _max_bytes is not None:
+        Collect(config.get_dir("media_dir"), _max_bytes)
+    return result
+
+def PartialMovies(media_dir):
+    for root, _, files in os.walk(os.path.join(media_dir, "videos")):
+        if "partial_movie_files" in root.split(os.sep):
+            for name in files:
+                if not name.endswith(".txt"):
+                    yield os.path.abspath(os.path.join(root, name))
+
+def Collect(media_dir, max_bytes=0):
+    #Partials used by the latest render of a scene are always kept. The rest, including ones from before the cache
+    #was installed, are deleted least recently used first until everything fits in max_bytes
+    manifest = LoadManifest(media_dir)
+    referenced = {path for paths in manifest["renders"].values() for path in paths}
+    files = {}
+    for path in PartialMovies(media_dir):
+        entry = manifest["files"].get(path, {})
+        files[path] = (entry.get("last_used", os.path.getmtime(path)), os.path.getsize(path))
+
+    total = sum(size for _, size in files.values())
+    removed = []
+    for path in sorted((path for path in files if path not in referenced), key=lambda path: files[path][0]):
+        if total <= max_bytes:
+            break
+        os.remove(path)
+        total -= files[path][1]
+        removed.append(path)
+
+    manifest["files"] = {path: entry for path, entry in manifest["files"].items() if path in files and path not in removed}
+    SaveManifest(manifest, media_dir)
+    logger.info(f"Render cache: removed {len(removed)} partial movies, {total/1024**2:.1f} MiB left")
+    return removed, total
+
+def Install(scene, max_size=None):
+    #Opts scene into the cache. manim's play hash and file writer are patched the first time, and the patches leave
+    #every scene that hasn't opted in to manim
+    global _max_bytes
+    cairo_renderer.get_hash_from_play_call = SemanticHash
+    SceneFileWriter.finish = RecordingFinish
+    _writers.add(scene.renderer.file_writer)
+    max_size = max_size or os.environ.get("RENDER_CACHE_MAX_SIZE")
+    if max_size is not None:
+        _max_bytes = ParseSize(max_size)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete partial movies no latest render uses")
+    parser.add_argument("media_dir", nargs="?", default="media")
+    parser.add_argument("--max-size", default="0", help="keep unused partials up to this size, like 500M or 2G")
+    args = parser.parse_args()
+
+    removed, total = Collect(args.media_dir, ParseSize(args.max_size))
+    print(f"Removed {len(removed)} partial movies, {total/1024**2:.1f} MiB left")
@@ -1,5 +1,15 @@
 from manim import *
 from tree import *
+import tree
+import labels
+import search
+from search import AlphaBeta
+import timeline
+from timeline import PlanMinimax, PlanAlphaBeta, PlayStep, PlaySteps
+from sections import SectionedScene
+from layout import TreeLayout
+from widgets import AlphaBetaWindow, ScoreStrip
+import rendercache
 import numpy as np
 import random as Rand
 from collections import deque
@@ -43,40 +53,36 @@ class AnimateMinimax(Scene):
     LAYOUT_SCALE = (6, 3)
 
     def Minimax(self, displayed_tree: Graph, internal_tree: Tree, current_node: int, is_maximiser: bool):
-        displayed_node = displayed_tree[current_node]
+        scores_above_node = {}
 
-        if current_node not in internal_tree.edges_dict: #checks if current_node is a leaf
-            return internal_tree.scores[current_node]
-        
+        def Open(step):
+            scores_above_node[step.node] = MathTex(NumToStr(step.value))
+            self.play(Write(scores_above_node[step.node].next_to(displayed_tree[step.node], UP)))
 
-        if is_maximiser:
-            initial_score_above_node = MathTex(r"-\infty")
-            self.play(Write(initial_score_above_node.next_to(displayed_node, UP)))
-            best_so_far = -10
-            for children_node in internal_tree.edges_dict[current_node]:
-                self.play(Indicate(displayed_tree.edges[(current_node, children_node)]))
-                child_score = self.Minimax(displayed_tree, internal_tree, children_node, False)
-                compared_score_above_node = MathTex(NumToStr(best_so_far) + r"\ vs\ " + NumToStr(child_score)).next_to(displayed_node, UP)
-                best_so_far = max(best_so_far, child_score)
-                self.play(Transform(initial_score_above_node, compared_score_above_node))
-                self.wait(0.3)
-                self.play(Transform(initial_score_above_node, MathTex(NumToStr(best_so_far)).next_to(displayed_node, UP)))
-        else:
-            best_so_far = 10
-            initial_score_above_node = MathTex(r"\infty")
-            self.play(Write(initial_score_above_node.next_to(displayed_node, UP)))
-            for children_node in internal_tree.edges_dict[current_node]:
-                self.play(Indicate(displayed_tree.edges[(current_node, children_node)]))
-                child_score = self.Minimax(displayed_tree, internal_tree, children_node, True)
-                compared_score_above_node = MathTex(NumToStr(best_so_far) + r"\ vs\ " + NumToStr(child_score)).next_to(displayed_node, UP)
-                best_so_far = min(best_so_far, child_score)
-                self.play(Transform(initial_score_above_node, compared_score_above_node))
-                self.wait(0.3)
-                self.play(Transform(initial_score_above_node, MathTex(NumToStr(best_so_far)).next_to(displayed_node, UP)))
+        def Edge(step):
+            self.play(Indicate(displayed_tree.edges[(step.parent, step.node)]))
 
-        self.play(Unwrite(initial_score_above_node))
-        self.play(FadeIn(MathTex(NumToStr(best_so_far)).move_to(displayed_node), scale=1.5))
-        return best_so_far
+        def Compare(step):
+            compared_score_above_node = MathTex(NumToStr(step.previous) + r"\ vs\ " + NumToStr(step.value)).next_to(displayed_tree[step.node], UP)
+            self.play(Transform(scores_above_node[step.node], compared_score_above_node))
+            self.wait(0.3)
+
+        def Best(step):
+            self.play(Transform(scores_above_node[step.node], MathTex(NumToStr(step.value)).next_to(displayed_tree[step.node], UP)))
+
+        def Return(step):
+            self.play(Unwrite(scores_above_node[step.node]))
+            self.play(FadeIn(MathTex(NumToStr(step.value)).move_to(displayed_tree[step.node]), scale=1.5))
+
+        result = search.Minimax(internal_tree, current_node, is_maximiser)
+        PlaySteps(PlanMinimax(result.trace, is_maximiser), {
+            timeline.OPEN: Open,
+            timeline.EDGE: Edge,
+            timeline.COMPARE: Compare,
+            timeline.BEST: Best,
+            timeline.RETURN: Return,
+        })
+        return result.value
             
     def construct(self):
         
@@ -94,9 +100,7 @@ class AnimateMinimax(Scene):
 
         displayed_minimax_tree = Graph([i for i in range(1, minimax_tree.size)],
             minimax_tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=self.LAYOUT_SCALE,
+            layout=TreeLayout(minimax_tree.edges_list, layout_scale=self.LAYOUT_SCALE),
             vertex_config=self.VERTEX_CONFIG,
             labels=minimax_tree.labels
         ).flip(axis=UP).move_to(RIGHT*0.5)
@@ -162,9 +166,7 @@ class AnimateNegamaxTree(Scene):
         FillTree(internal_tree, is_minimax=False)
         displayed_negamax_tree = Graph([i for i in range(1, internal_tree.size)],
             internal_tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=self.LAYOUT_SCALE,
+            layout=TreeLayout(internal_tree.edges_list, layout_scale=self.LAYOUT_SCALE),
             vertex_config=self.VERTEX_CONFIG,
             labels=internal_tree.labels
         ).flip(axis=UP).move_to(RIGHT*0.5)
@@ -173,9 +175,7 @@ class AnimateNegamaxTree(Scene):
         FillTree(minimax_tree, is_minimax=True)
         displayed_minimax_tree = Graph([i for i in range(1, minimax_tree.size)],
             minimax_tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=self.LAYOUT_SCALE,
+            layout=TreeLayout(minimax_tree.edges_list, layout_scale=self.LAYOUT_SCALE),
             vertex_config=self.VERTEX_CONFIG,
             labels=minimax_tree.labels
         ).flip(axis=UP).move_to(RIGHT*0.5)
@@ -203,9 +203,7 @@ class AnimateNegamaxTree(Scene):
         FillTree(my_POV_tree, is_minimax=True)
         displayed_my_POV_tree = Graph([i for i in range(1, my_POV_tree.size)],
             my_POV_tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=self.LAYOUT_SCALE,
+            layout=TreeLayout(my_POV_tree.edges_list, layout_scale=self.LAYOUT_SCALE),
             vertex_config=self.VERTEX_CONFIG,
             labels=my_POV_tree.labels
         ).flip(axis=UP).move_to(RIGHT*0.5)
@@ -218,13 +216,10 @@ class AnimateNegamaxTree(Scene):
         opponent_POV_tree = my_POV_tree
         for node in opponent_POV_tree.scores:
             opponent_POV_tree.scores[node] *= -1 
-            opponent_POV_tree.labels[node] = MathTex(NumToStr(opponent_POV_tree.scores[node])).flip(axis=UP)
         print(opponent_POV_tree)
         displayed_opponent_POV_tree = Graph([i for i in range(1, opponent_POV_tree.size)],
             opponent_POV_tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=self.LAYOUT_SCALE,
+            layout=TreeLayout(opponent_POV_tree.edges_list, layout_scale=self.LAYOUT_SCALE),
             vertex_config=self.VERTEX_CONFIG,
             labels=opponent_POV_tree.labels
         ).flip(axis=UP).move_to(RIGHT*0.5)
@@ -579,33 +574,24 @@ class Minimax(Scene):
         self.next_section("section_4", skip_animations=True)
 
         def Minimax(displayed_tree: Graph, internal_tree: Tree, current_node: int, is_maximiser: bool):
-            displayed_node = displayed_tree[current_node]
-
-            if current_node not in internal_tree.edges_dict: #checks if current_node is a leaf
-                return internal_tree.scores[current_node]
-            
-            if is_maximiser:
-                best_so_far = -10
-                for children_node in internal_tree.edges_dict[current_node]:
-                    self.play(ShowPassingFlash(displayed_tree.edges[(current_node, children_node)].copy().set_stroke(width=5,color=YELLOW)))
-                    child_score = Minimax(displayed_tree, internal_tree, children_node, False)
-                    best_so_far = max(best_so_far, child_score)
-            else:
-                best_so_far = 10
-                for children_node in internal_tree.edges_dict[current_node]:
-                    self.play(ShowPassingFlash(displayed_tree.edges[(current_node, children_node)].copy().set_stroke(width=5,color=YELLOW)))
-                    child_score = Minimax(displayed_tree, internal_tree, children_node, True)
-                    best_so_far = min(best_so_far, child_score)
-            self.play(Write(MathTex(NumToStr(best_so_far)).move_to(displayed_node), scale=1.5))
-            return best_so_far
+            def Edge(step):
+                self.play(ShowPassingFlash(displayed_tree.edges[(step.parent, step.node)].copy().set_stroke(width=5,color=YELLOW)))
+
+            def Return(step):
+                self.play(Write(MathTex(NumToStr(step.value)).move_to(displayed_tree[step.node]), scale=1.5))
+
+            result = search.Minimax(internal_tree, current_node, is_maximiser)
+            PlaySteps(PlanMinimax(result.trace, is_maximiser, compare=False, run_times={timeline.RETURN: 1}), {
+                timeline.EDGE: Edge,
+                timeline.RETURN: Return,
+            })
+            return result.value
         
         internal_tree = Tree("minimax")
         displayed_tree_base = Graph(
             vertices=[i for i in range(1,internal_tree.size)],
             edges=internal_tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=(3, 3),
+            layout=TreeLayout(internal_tree.edges_list, layout_scale=(3, 3)),
             vertex_config=VERTEX_CONFIG,
             labels=internal_tree.labels
         ).flip(axis=UP).move_to(RIGHT*3.5)
@@ -760,10 +746,40 @@ class Minimax(Scene):
         self.next_section("section_7", skip_animations=False)
         
 
-class AB(Scene):
-    def construct(self):
-        self.next_section("Intro_to_ab", skip_animations=False)
+class AB(SectionedScene):
+    SECTIONS = [("Intro_to_ab", False), ("window_ab", False), ("fail_low_fail_high", True), ("ab_code", True), ("ab_tree", True), ("ab_properties", True)]
+    TOP_WINDOW = 0
+    BOTTOM_WINDOW = 1
+
+    def setup(self):
+        #ab_tree's steps are rendered through the segment cache
+        rendercache.Install(self)
+
+    #Flashing arrows
+    def ArrowAnimation(self, pos, direction, arrow_width=0.5, arrow_length = 0.8, arrow_tip_length = 0.4, arrow_shown_size = 0.25,run_time=1):
+        (arrow_aligned_edge, rect_aligned_edge) = (UP, DOWN) if direction == -1 else (DOWN, UP)
+        arrow = Polygon(
+            (-arrow_width/2,0,0),
+            (arrow_width/2,0,0),
+            (arrow_width/2,arrow_length*direction,0),
+            (arrow_width,arrow_length*direction,0),
+            (0,(arrow_tip_length+arrow_length)*direction,0),
+            (-arrow_width,arrow_length*direction,0),
+            (-arrow_width/2,arrow_length*direction,0)
+        ).move_to(pos, aligned_edge=arrow_aligned_edge).set_fill(WHITE, opacity=1)
+        intersection_shift = ValueTracker()
+        intersection_rectangle = Rectangle(height=arrow_shown_size, width=2*arrow_width)
+        arrow_animation = always_redraw(lambda: Intersection(arrow, 
+                                                             intersection_rectangle.move_to(
+                                                                 pos+(0,intersection_shift.get_value(),0),
+                                                                 aligned_edge=rect_aligned_edge)).set_fill(WHITE, opacity=1))
+        self.add(arrow_animation)
+        self.play(
+            intersection_shift.animate.set_value((arrow_tip_length+arrow_length+arrow_shown_size)*direction), 
+            run_time=run_time
+            )
 
+    def Intro_to_ab(self):
         # chapter_3 = Tex(r"\textbf{\underline{\Large Chapter 3}}\\")
         # ab_chapter_text = Tex(r"Alpha-Beta Pruning", substrings_to_isolate=("Alpha","Beta")).next_to(chapter_3, DOWN)
         # self.play(FadeIn(chapter_3, scale=3), FadeIn(ab_chapter_text, shift=UP*2, scale=3), run_time=3)
@@ -803,59 +819,20 @@ class AB(Scene):
         # self.play(ReplacementTransform(ab_group_2[1], beta_text_3), run_time=3)
         # self.wait(5)      
 
-        alpha_beta_tex = Tex("Alpha-beta pruning").shift(UP*3)
-        alpha_beta_tex[0][0:5].set_color(RED)
-        internal_tree = Tree()
-        internal_tree.edges_list = [(1, 2), (1, 3), (2, 4), (2, 5), (2, 6), (2, 7), (2, 8), (3, 9), (3, 10), (4, 11), (4, 12), (4, 13), (5, 14), (5, 15), (6, 16), (6, 17), (7, 18), (7, 19), (7, 20), (7, 21), (7, 22), (8, 23), (8, 24), (8, 25), (8, 26), (9, 27), (9, 28), (9, 29), (10, 30), (10, 31), (10, 32), (10, 33), (11, 34), (11, 35), (12, 36), (12, 37), (12, 38), (12, 39), (12, 40), (12, 41), (13, 42), (13, 43), (13, 44), (13, 45), (13, 46), (13, 47), (13, 48), (14, 49), (14, 50), (14, 51), (14, 52), (14, 53), (14, 54), (14, 55), (15, 56), (15, 57), (15, 58), (16, 59), (16, 60), (16, 61), (16, 62), (16, 63), (17, 64), (17, 65), (17, 66), (18, 67), (18, 68), (18, 69), (19, 70), (19, 71), (19, 72), (19, 73), (19, 74), (19, 75), (19, 76), (19, 77), (19, 78), (19, 79), (19, 80), (19, 81), (20, 82), (20, 83), (21, 84), (21, 85), (21, 86), (22, 87), (22, 88), (22, 89), (22, 90), (23, 91), (23, 92), (23, 93), (23, 94), (24, 95), (24, 96), (24, 97), (24, 98), (24, 99), (25, 100), (25, 101), (25, 102), (25, 103), (25, 104), (26, 105), (26, 106), (27, 107), (27, 108), (27, 109), (28, 110), (28, 111), (29, 112), (29, 113), (29, 114), (29, 115), (30, 116), (30, 117), (31, 118), (31, 119), (31, 120), (32, 121), (33, 122), (33, 123), (33, 124)]
-        internal_tree.edges_dict = {1: (2, 3), 2: (4, 5, 6, 7, 8), 3: (9, 10), 4: (11, 12, 13), 5: (14, 15), 6: (16, 17), 7: (18, 19, 20, 21, 22), 8: (23, 24, 25, 26), 9: (27, 28, 29), 10: (30, 31, 32, 33), 11: (34, 35), 12: (36, 37, 38, 39, 40, 41), 13: (42, 43, 44, 45, 46, 47, 48), 14: (49, 50, 51, 52, 53, 54, 55), 15: (56, 57, 58), 16: (59, 60, 61, 62, 63), 17: (64, 65, 66), 18: (67, 68, 69), 19: (70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81), 20: (82, 83), 21: (84, 85, 86), 22: (87, 88, 89, 90), 23: (91, 92, 93, 94), 24: (95, 96, 97, 98, 99), 25: (100, 101, 102, 103, 104), 26: (105, 106), 27: (107, 108, 109), 28: (110, 111), 29: (112, 113, 114, 115), 30: (116, 117), 31: (118, 119, 120), 32: (121,), 33: (122, 123, 124)}
-        internal_tree.labels={1:MathTex('-1').flip(axis=UP),2:MathTex('7').flip(axis=UP),3:MathTex('1').flip(axis=UP),4:MathTex('-6').flip(axis=UP),5:MathTex('-6').flip(axis=UP),6:MathTex('-7').flip(axis=UP),7:MathTex('-3').flip(axis=UP),8:MathTex('7').flip(axis=UP),9:MathTex('-1').flip(axis=UP),10:MathTex('8').flip(axis=UP),11:MathTex('6').flip(axis=UP),12:MathTex('9').flip(axis=UP),13:MathTex('8').flip(axis=UP),14:MathTex('6').flip(axis=UP),15:MathTex('8').flip(axis=UP),16:MathTex('7').flip(axis=UP),17:MathTex('7').flip(axis=UP),18:MathTex('8').flip(axis=UP),19:MathTex('9').flip(axis=UP),20:MathTex('3').flip(axis=UP),21:MathTex('').flip(axis=UP),22:MathTex('').flip(axis=UP),23:MathTex('9').flip(axis=UP),24:MathTex('9').flip(axis=UP),25:MathTex('7').flip(axis=UP),26:MathTex('-7').flip(axis=UP),27:MathTex('8').flip(axis=UP),28:MathTex('9').flip(axis=UP),29:MathTex('1').flip(axis=UP),30:MathTex('-8').flip(axis=UP),31:MathTex('').flip(axis=UP),32:MathTex('').flip(axis=UP),33:MathTex('').flip(axis=UP),34:MathTex('-6').flip(axis=UP),35:MathTex('3').flip(axis=UP),36:MathTex('-9').flip(axis=UP),37:MathTex('-3').flip(axis=UP),38:MathTex('6').flip(axis=UP),39:MathTex('-7').flip(axis=UP),40:MathTex('6').flip(axis=UP),41:MathTex('-8').flip(axis=UP),42:MathTex('7').flip(axis=UP),43:MathTex('2').flip(axis=UP),44:MathTex('6').flip(axis=UP),45:MathTex('-1').flip(axis=UP),46:MathTex('8').flip(axis=UP),47:MathTex('2').flip(axis=UP),48:MathTex('-8').flip(axis=UP),49:MathTex('-6').flip(axis=UP),50:MathTex('1').flip(axis=UP),51:MathTex('2').flip(axis=UP),52:MathTex('-3').flip(axis=UP),53:MathTex('9').flip(axis=UP),54:MathTex('3').flip(axis=UP),55:MathTex('6').flip(axis=UP),56:MathTex('-1').flip(axis=UP),57:MathTex('-8').flip(axis=UP),58:MathTex('-6').flip(axis=UP),59:MathTex('3').flip(axis=UP),60:MathTex('-2').flip(axis=UP),61:MathTex('-3').flip(axis=UP),62:MathTex('-7').flip(axis=UP),63:MathTex('4').flip(axis=UP),64:MathTex('-7').flip(axis=UP),65:MathTex('7').flip(axis=UP),66:MathTex('-3').flip(axis=UP),67:MathTex('-8').flip(axis=UP),68:MathTex('-2').flip(axis=UP),69:MathTex('-7').flip(axis=UP),70:MathTex('0').flip(axis=UP),71:MathTex('-5').flip(axis=UP),72:MathTex('-5').flip(axis=UP),73:MathTex('2').flip(axis=UP),74:MathTex('3').flip(axis=UP),75:MathTex('0').flip(axis=UP),76:MathTex('-3').flip(axis=UP),77:MathTex('2').flip(axis=UP),78:MathTex('4').flip(axis=UP),79:MathTex('-2').flip(axis=UP),80:MathTex('-9').flip(axis=UP),81:MathTex('1').flip(axis=UP),82:MathTex('-3').flip(axis=UP),83:MathTex('4').flip(axis=UP),84:MathTex('-3').flip(axis=UP),85:MathTex('6').flip(axis=UP),86:MathTex('9').flip(axis=UP),87:MathTex('-9').flip(axis=UP),88:MathTex('0').flip(axis=UP),89:MathTex('1').flip(axis=UP),90:MathTex('7').flip(axis=UP),91:MathTex('-9').flip(axis=UP),92:MathTex('-8').flip(axis=UP),93:MathTex('1').flip(axis=UP),94:MathTex('7').flip(axis=UP),95:MathTex('5').flip(axis=UP),96:MathTex('-3').flip(axis=UP),97:MathTex('2').flip(axis=UP),98:MathTex('7').flip(axis=UP),99:MathTex('-9').flip(axis=UP),100:MathTex('1').flip(axis=UP),101:MathTex('-1').flip(axis=UP),102:MathTex('-7').flip(axis=UP),103:MathTex('9').flip(axis=UP),104:MathTex('7').flip(axis=UP),105:MathTex('7').flip(axis=UP),106:MathTex('9').flip(axis=UP),107:MathTex('-8').flip(axis=UP),108:MathTex('7').flip(axis=UP),109:MathTex('3').flip(axis=UP),110:MathTex('-2').flip(axis=UP),111:MathTex('-9').flip(axis=UP),112:MathTex('2').flip(axis=UP),113:MathTex('-1').flip(axis=UP),114:MathTex('3').flip(axis=UP),115:MathTex('1').flip(axis=UP),116:MathTex('9').flip(axis=UP),117:MathTex('8').flip(axis=UP),118:MathTex('6').flip(axis=UP),119:MathTex('-5').flip(axis=UP),120:MathTex('6').flip(axis=UP),121:MathTex('8').flip(axis=UP),122:MathTex('1').flip(axis=UP),123:MathTex('5').flip(axis=UP),124:MathTex('-3').flip(axis=UP),}
-        internal_tree.scores = {1: -1, 2: 7, 3: 1, 4: -6, 5: -6, 6: -7, 7: -3, 8: 7, 9: -1, 10: 8, 11: 6, 12: 9, 13: 8, 14: 6, 15: 8, 16: 7, 17: 7, 18: 8, 19: 9, 20: 3, 21: None, 22: None, 23: 9, 24: 9, 25: 7, 26: -7, 27: 8, 28: 9, 29: 1, 30: -8, 31: None, 32: None, 33: None, 34: -6, 35: 3, 36: -9, 37: -3, 38: 6, 39: -7, 40: 6, 41: -8, 42: 7, 43: 2, 44: 6, 45: -1, 46: 8, 47: 2, 48: -8, 49: -6, 50: 1, 51: 2, 52: -3, 53: 9, 54: 3, 55: 6, 56: -1, 57: -8, 58: -6, 59: 3, 60: -2, 61: -3, 62: -7, 63: 4, 64: -7, 65: 7, 66: -3, 67: -8, 68: -2, 69: -7, 70: 0, 71: -5, 72: -5, 73: 2, 74: 3, 75: 0, 76: -3, 77: 2, 78: 4, 79: -2, 80: -9, 81: 1, 82: -3, 83: 4, 84: -3, 85: 6, 86: 9, 87: -9, 88: 0, 89: 1, 90: 7, 91: -9, 92: -8, 93: 1, 94: 7, 95: 5, 96: -3, 97: 2, 98: 7, 99: -9, 100: 1, 101: -1, 102: -7, 103: 9, 104: 7, 105: 7, 106: 9, 107: -8, 108: 7, 109: 3, 110: -2, 111: -9, 112: 2, 113: -1, 114: 3, 115: 1, 116: 9, 117: 8, 118: 6, 119: -5, 120: 6, 121: 8, 122: 1, 123: 5, 124: -3}    
-        internal_tree.size = 125
-
-        crosses = VGroup()
-        def Negamax(internal_tree: Tree, displayed_tree: Graph, current_node: int, side_to_move: int, alpha:int, beta:int):
-            best_so_far = -10
-            beta_cutoff = False
-
-            if current_node not in internal_tree.edges_dict: #checks if current_node is a leaf
-                best_so_far = max(best_so_far, internal_tree.scores[current_node])
-                return best_so_far
+        self.alpha_beta_tex = Tex("Alpha-beta pruning").shift(UP*3)
+        self.alpha_beta_tex[0][0:5].set_color(RED)
+        internal_tree = Tree(type="ab_intro")
 
-            best_so_far = -10
-            for children_node in internal_tree.edges_dict[current_node]:
-                best_so_far = max(best_so_far, -Negamax(internal_tree, displayed_tree, children_node, -side_to_move, -beta, -alpha))
-                alpha = max(best_so_far, alpha)
-                internal_tree.scores[current_node] = best_so_far
-                internal_tree.labels[current_node] = MathTex(f"{best_so_far}").flip(axis=UP)
-                if best_so_far > beta:
-                    beta_cutoff = True
-                    break
-
-            if beta_cutoff == True:
-                children_node += 1
-                while(children_node in internal_tree.edges_dict[current_node]):
-                    crosses.add((Cross(scale_factor=RADIUS-0.1).move_to(displayed_tree.edges[(current_node, children_node)])))
-                    children_node += 1
-                return best_so_far
-
-            return best_so_far
-
-        displayed_tree = Graph([i for i in range(1, internal_tree.size)],
-            internal_tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=(6,2.5),
-            vertex_config=VERTEX_CONFIG,
-            labels=internal_tree.labels
-        ).flip(axis=UP).shift(DOWN*0.5)
-        Negamax(internal_tree, displayed_tree, 1, 1, -10, 10)
+        displayed_tree = TreeMobject(internal_tree, (6,2.5), VERTEX_CONFIG, DOWN*0.5)
+        result = search.CachedSearch(search.TracePath("AB_intro"), AlphaBeta, internal_tree, cutoff_at_beta=False)
+        crosses = VGroup(*[Cross(scale_factor=RADIUS-0.1).move_to(displayed_tree.edges[(event.parent, event.node)]) for event in result.trace if event.kind == search.PRUNE])
 
-        alpha_beta_tex[0][6:10].set_color(BLUE)
+        self.alpha_beta_tex[0][6:10].set_color(BLUE)
         opponent_POV = Tex("Opponent POV:").to_corner(UL).shift(DOWN*1.5+RIGHT*0.5)
         blist = BulletedList("Don't allow position", "Get rekt").next_to(opponent_POV, DOWN).shift(RIGHT)
         # dont_allow = Tex("Don't allow position").next_to(opponent_POV, DR)
         # get_rekt = Tex("Get rekt").next_to(dont_allow, DOWN)
-        self.play(Succession(Write(alpha_beta_tex), Create(displayed_tree)), run_time=3)
+        self.play(Succession(Write(self.alpha_beta_tex), Create(displayed_tree)), run_time=3)
         self.wait(2.1)
         self.play(Create(crosses), run_time=2.4)
         self.wait(2.8)
@@ -870,54 +847,29 @@ class AB(Scene):
         self.wait(0.7)
         self.play(Write(blist[1]), run_time=2)
         self.wait(4.5)
-        self.next_section("window_ab", skip_animations=False)
 
+    def window_ab(self):
         arrow_tip_length = 0.25
         rect = Rectangle(height=4, width=3, stroke_width=1).set_color(GREEN)
 
         #Windows
         exact_window = rect.copy().set_fill(GREEN_E, opacity=0.3)
-        non_exact_windows = [
+        self.non_exact_windows = [
             Rectangle(height=2, width=3, stroke_width=1).shift(UP*3).set_color(RED).set_fill(RED, opacity=0.2), 
             Rectangle(height=2, width=3, stroke_width=1).shift(DOWN*3).set_color(RED).set_fill(RED, opacity=0.2)
             ]
-        TOP_WINDOW = 0
-        BOTTOM_WINDOW = 1
-
-        #Flashing arrows
-        def ArrowAnimation(pos, direction, arrow_width=0.5, arrow_length = 0.8, arrow_tip_length = 0.4, arrow_shown_size = 0.25,run_time=1):
-            (arrow_aligned_edge, rect_aligned_edge) = (UP, DOWN) if direction == -1 else (DOWN, UP)
-            arrow = Polygon(
-                (-arrow_width/2,0,0),
-                (arrow_width/2,0,0),
-                (arrow_width/2,arrow_length*direction,0),
-                (arrow_width,arrow_length*direction,0),
-                (0,(arrow_tip_length+arrow_length)*direction,0),
-                (-arrow_width,arrow_length*direction,0),
-                (-arrow_width/2,arrow_length*direction,0)
-            ).move_to(pos, aligned_edge=arrow_aligned_edge).set_fill(WHITE, opacity=1)
-            intersection_shift = ValueTracker()
-            intersection_rectangle = Rectangle(height=arrow_shown_size, width=2*arrow_width)
-            arrow_animation = always_redraw(lambda: Intersection(arrow, 
-                                                                 intersection_rectangle.move_to(
-                                                                     pos+(0,intersection_shift.get_value(),0),
-                                                                     aligned_edge=rect_aligned_edge)).set_fill(WHITE, opacity=1))
-            self.add(arrow_animation)
-            self.play(
-                intersection_shift.animate.set_value((arrow_tip_length+arrow_length+arrow_shown_size)*direction), 
-                run_time=run_time
-                )
+
         
         #Text
-        alpha = alpha_beta_tex[0][0:5].copy()
-        beta = alpha_beta_tex[0][6:10].copy()
+        alpha = self.alpha_beta_tex[0][0:5].copy()
+        beta = self.alpha_beta_tex[0][6:10].copy()
         alpha_tex = MathTex(r"\alpha", color=RED).next_to(rect, DOWN)
         beta_tex = MathTex(r"\beta", color=BLUE).next_to(rect, UP)
         exact_text = Tex("Exact scores", font_size=48).move_to((4.8,1,0))
         non_exact_text = Tex("Non-exact scores", font_size=48).move_to((4.8,1,0))
         true_score_text = Tex("True score", font_size=48, color=GREEN).next_to(exact_window, RIGHT)
-        upper_bound_score_text = Tex("Upper bound", font_size=48, color=RED).next_to(non_exact_windows[BOTTOM_WINDOW], RIGHT)
-        lower_bound_score_text = Tex("Lower bound", font_size=48, color=RED).next_to(non_exact_windows[TOP_WINDOW], RIGHT)
+        upper_bound_score_text = Tex("Upper bound", font_size=48, color=RED).next_to(self.non_exact_windows[self.BOTTOM_WINDOW], RIGHT)
+        self.lower_bound_score_text = Tex("Lower bound", font_size=48, color=RED).next_to(self.non_exact_windows[self.TOP_WINDOW], RIGHT)
                 
         #Arrows
         exact_arrow = Arrow(
@@ -970,8 +922,8 @@ class AB(Scene):
             LaggedStart(
                 AnimationGroup(
                     dot_tracker.animate.set_value(-3.6), 
-                    DrawBorderThenFill(non_exact_windows[TOP_WINDOW]), 
-                    DrawBorderThenFill(non_exact_windows[BOTTOM_WINDOW]), 
+                    DrawBorderThenFill(self.non_exact_windows[self.TOP_WINDOW]), 
+                    DrawBorderThenFill(self.non_exact_windows[self.BOTTOM_WINDOW]), 
                     FadeOut(exact_window), 
                     alpha_tex.animate.move_to(exact_window.get_corner(DL)).shift(LEFT*0.5), 
                     beta_tex.animate.move_to(exact_window.get_corner(UL)).shift(LEFT*0.5)
@@ -991,33 +943,32 @@ class AB(Scene):
         self.play(FadeIn(exact_window), dot_tracker.animate.set_value(0), FadeOut(non_exact_arrow[0]), FadeOut(non_exact_arrow[1]), run_time=1.6)
         self.play(ReplacementTransform(non_exact_text, true_score_text), run_time=1.7)
         self.wait(2)
-        self.play(Write(upper_bound_score_text), Write(lower_bound_score_text), run_time=2.5)
+        self.play(Write(upper_bound_score_text), Write(self.lower_bound_score_text), run_time=2.5)
         self.wait(1.5)
         self.play(dot_tracker.animate.set_value(-2.5), run_time=1.6)
         self.wait()
         self.play(Wiggle(upper_bound_score_text), run_time=1.9)
         self.wait(1.7)
-        ArrowAnimation(score_dot.get_center()+0.15*DOWN, -1)
+        self.ArrowAnimation(score_dot.get_center()+0.15*DOWN, -1)
         self.wait(1.4)
         self.play(dot_tracker.animate.set_value(2.5), run_time=1.3)
         self.wait(0.2)
-        ArrowAnimation(score_dot.get_center()+0.15*UP, 1)
+        self.ArrowAnimation(score_dot.get_center()+0.15*UP, 1)
         self.wait(1.2)
         self.wait(2.9)
         self.play(FadeOut(score_dot), run_time=1.6)
         self.wait(1.2)
-        self.play(*[non_exact_window.animate.set_fill(opacity=0.5) for non_exact_window in non_exact_windows], run_time=1.6)
+        self.play(*[non_exact_window.animate.set_fill(opacity=0.5) for non_exact_window in self.non_exact_windows], run_time=1.6)
         self.wait(1.4)
         dot_tracker.set_value(0)
         self.play(FadeIn(score_dot), run_time=1.4)
         self.wait()
         self.play(ShowPassingFlash(exact_window.copy().set_fill(opacity=0).set_stroke(GREEN,5), time_width=0.2), run_time=1.3)
         self.wait(1.2)
-        self.play(Unwrite(score_dot), *[non_exact_window.animate.set_fill(opacity=0.2) for non_exact_window in non_exact_windows])
+        self.play(Unwrite(score_dot), *[non_exact_window.animate.set_fill(opacity=0.2) for non_exact_window in self.non_exact_windows])
         self.wait(5)
 
-        self.next_section("fail_low_fail_high", skip_animations=True)
-
+    def fail_low_fail_high(self):
         #Score dots
         score_dots_exact = VGroup(
             Dot((0, -1.0, 0)),
@@ -1069,7 +1020,7 @@ class AB(Scene):
         self.play(Write(stop_searching_arrow), run_time=1.9)
         self.play(Write(stop_searching_text), run_time=1.9)
         self.wait(2)
-        self.play(ShowPassingFlash(non_exact_windows[TOP_WINDOW].copy().set_stroke(width=5).set_fill(opacity=0)), run_time=1.3)
+        self.play(ShowPassingFlash(self.non_exact_windows[self.TOP_WINDOW].copy().set_stroke(width=5).set_fill(opacity=0)), run_time=1.3)
         self.wait(2.3)
         self.play(LaggedStart(*[score_dots_fail_high[i].animate(rate_func=rate_functions.wiggle).shift(RIGHT*0.2) for i in [1,3,2,0]]), run_time=2.4)
         self.wait(4)
@@ -1077,9 +1028,9 @@ class AB(Scene):
         self.wait(5)
         self.play(score_dots_fail_high[:-1].animate.set_opacity(0.2), run_time=1.5)
         self.wait(0.7)
-        ArrowAnimation(score_dots_fail_high[-1].get_center()+UP*0.15, 1, run_time=1.8)
+        self.ArrowAnimation(score_dots_fail_high[-1].get_center()+UP*0.15, 1, run_time=1.8)
         self.wait(2.4)
-        self.play(Wiggle(lower_bound_score_text), run_time=2)
+        self.play(Wiggle(self.lower_bound_score_text), run_time=2)
         self.wait()
         self.play(Unwrite(score_dots_fail_high), Unwrite(stop_searching_arrow), Unwrite(stop_searching_text), Unwrite(fail_high_text))
         self.play(LaggedStart(*[SpiralIn(dot) for dot in score_dots_exact[:2]], lag_ratio=0.5), run_time=1.2)
@@ -1089,8 +1040,7 @@ class AB(Scene):
         self.play(Flash(score_dots_exact[5]), run_time=1.5)
         self.wait(5)
 
-        self.next_section("ab_code", skip_animations=True)
-
+    def ab_code(self):
         code_negamax = '''def Negamax(depth, current_node, side_to_move):
     if depth == 0:
         return GetScore(current_node) * side_to_move
@@ -1223,261 +1173,267 @@ class AB(Scene):
         self.wait(2)
         self.wait(5)
 
-
-        self.next_section("ab_tree", skip_animations=True)
-
+    def ab_tree(self):
         RECT=0
         ALPHA_TEX=1
         BETA_TEX=2
         NEGATIVE_ALPHA_TEX=3
         NEGATIVE_BETA_TEX=4
-        global_window_group_list = []
-        global_crosses_list = []
+        #Narrated steps run longer than the default step times
+        AB_TREE_RUN_TIMES = {(timeline.ENTER, 1): 23.7, (timeline.ENTER, 2): 4.5, (timeline.RETURN, 2): 13.2, (timeline.RETURN, 9): 19.3}
 
-        def ABNegamax(displayed_tree: Graph, internal_tree: Tree, parent_node:int, current_node: int, side_to_move: int, alpha=-10, beta=10):
-            
-            def AddWindow(displayed_node, current_node, alpha, beta):
-                window_height = (RADIUS/10)*abs(beta-alpha)
+        def AddWindow(displayed_node, current_node, alpha, beta):
+            window_height = (RADIUS/10)*abs(beta-alpha)
 
-                window = Rectangle(width=RADIUS, height=window_height, stroke_width=1, fill_opacity=0.5).set_color(
-                    GREEN).next_to(displayed_node, LEFT*0.5).shift((0,(RADIUS/10)*((alpha+beta)/2),0))
-                
-                (alpha_pos, beta_pos) = (window.get_bottom()+0.1*DOWN, window.get_top()+0.1*UP) if alpha < beta else (window.get_top()+0.1*UP, window.get_bottom()+0.1*DOWN)
-                
-                
-                alpha_tex = MathTex(fr"\alpha:{NumToStr(alpha)}", substrings_to_isolate=(r"\alpha",":","-")).scale(0.35).move_to(alpha_pos)
-                alpha_tex.set_color_by_tex(r"\alpha", RED)
-                beta_tex = MathTex(fr"\beta:{NumToStr(beta)}", substrings_to_isolate=(r"\beta",":","-")).scale(0.35).move_to(beta_pos)
-                beta_tex.set_color_by_tex(r"\beta", BLUE)
-                negative_alpha_tex = MathTex(fr"-\alpha:{NumToStr(beta)}", substrings_to_isolate=(r"\alpha",":","-")).scale(0.35).move_to(beta_pos)
-                negative_alpha_tex.set_color_by_tex(r"\alpha", RED)
-                negative_beta_tex = MathTex(fr"-\beta:{NumToStr(alpha)}", substrings_to_isolate=(r"\beta",":","-")).scale(0.35).move_to(alpha_pos)
-                negative_beta_tex.set_color_by_tex(r"\beta", BLUE)
-
-                window_group = VGroup(window, alpha_tex, beta_tex, negative_alpha_tex, negative_beta_tex)
-                global_window_group_list[current_node] = window_group
-
-            def AnimateAlphaBeta(parent_node, child_node, run_time=1):
-                current_window_group = global_window_group_list[parent_node].copy()
-                child_window_group = global_window_group_list[child_node]
+            window = Rectangle(width=RADIUS, height=window_height, stroke_width=1, fill_opacity=0.5).set_color(
+                GREEN).next_to(displayed_node, LEFT*0.5).shift((0,(RADIUS/10)*((alpha+beta)/2),0))
 
-                self.play(
-                    ShowPassingFlash(displayed_tree.edges[(parent_node, child_node)].copy().set_stroke(width=5,color=YELLOW)),
-                    ReplacementTransform(current_window_group[RECT], child_window_group[RECT]),
-                    TransformMatchingTex(current_window_group[ALPHA_TEX], child_window_group[BETA_TEX]),
-                    TransformMatchingTex(current_window_group[BETA_TEX], child_window_group[ALPHA_TEX]),
-                    run_time=run_time
-                )
+            (alpha_pos, beta_pos) = (window.get_bottom()+0.1*DOWN, window.get_top()+0.1*UP) if alpha < beta else (window.get_top()+0.1*UP, window.get_bottom()+0.1*DOWN)
 
-            def AnimateReturnAlphaBeta(parent_node, child_node, best_so_far, displayed_best_so_far, exact=False, run_time=1):
-                if parent_node == child_node:
-                    return
-                
-                orig_parent_window_group = global_window_group_list[parent_node]
-                new_parent_window_group = global_window_group_list[parent_node+internal_tree.size]
-
-                color = RED if best_so_far > 0 else BLUE
-
-                dot = Dot(radius=0.04, color=color).next_to(displayed_tree[parent_node]).shift((0,(RADIUS/10)*(-best_so_far),0))
-                dot.move_to((orig_parent_window_group[RECT].get_x(), dot.get_y(), 0))
-                dot_tex = Tex(f"{-best_so_far}", font_size=10, color=color).next_to(dot, LEFT)
-                dot_group = VGroup(dot, dot_tex)
-
-
-                if exact:
-                    self.play(
-                        ShowPassingFlash(displayed_tree.edges[(parent_node, child_node)].copy().reverse_direction().set_stroke(width=5,color=YELLOW)),
-                        Write(
-                            Line(
-                                start=orig_parent_window_group[RECT].get_corner(DL), 
-                                end=orig_parent_window_group[RECT].get_corner(DR), 
-                                color=GREEN).set_z_index(-10)
-                        ),
-                        Transform(orig_parent_window_group[RECT], new_parent_window_group[RECT]),
-                        ReplacementTransform(displayed_best_so_far.copy(), dot_group),
-                        run_time=run_time
-                    )
-                else:
-                    self.play(
-                        ShowPassingFlash(displayed_tree.edges[(parent_node, child_node)].copy().reverse_direction().set_stroke(width=5,color=YELLOW)),
-                        ReplacementTransform(displayed_best_so_far.copy(), dot_group), 
-                        run_time=run_time
-                    )
 
-            displayed_node = displayed_tree[current_node]
-            AddWindow(displayed_node, current_node, alpha, beta)
-            exact = False
-
-            #Start negamaxing
-            if current_node == 1:
-                self.wait(8)
-                self.play(Write(global_window_group_list[current_node][RECT]))
-                self.wait()
-                self.play(Write(global_window_group_list[current_node][ALPHA_TEX]))
-                self.wait()
-                self.play(Write(global_window_group_list[current_node][BETA_TEX]))
-                self.wait(10.7)
-            elif current_node == 2:
-                current_window_group = global_window_group_list[parent_node].copy()
-                child_window_group = global_window_group_list[current_node]
+            alpha_tex = MathTex(fr"\alpha:{NumToStr(alpha)}", substrings_to_isolate=(r"\alpha",":","-")).scale(0.35).move_to(alpha_pos)
+            alpha_tex.set_color_by_tex(r"\alpha", RED)
+            beta_tex = MathTex(fr"\beta:{NumToStr(beta)}", substrings_to_isolate=(r"\beta",":","-")).scale(0.35).move_to(beta_pos)
+            beta_tex.set_color_by_tex(r"\beta", BLUE)
+            negative_alpha_tex = MathTex(fr"-\alpha:{NumToStr(beta)}", substrings_to_isolate=(r"\alpha",":","-")).scale(0.35).move_to(beta_pos)
+            negative_alpha_tex.set_color_by_tex(r"\alpha", RED)
+            negative_beta_tex = MathTex(fr"-\beta:{NumToStr(alpha)}", substrings_to_isolate=(r"\beta",":","-")).scale(0.35).move_to(alpha_pos)
+            negative_beta_tex.set_color_by_tex(r"\beta", BLUE)
 
+            window_group = VGroup(window, alpha_tex, beta_tex, negative_alpha_tex, negative_beta_tex)
+            self.global_window_group_list[current_node] = window_group
+
+        def AnimateAlphaBeta(parent_node, child_node, run_time=1):
+            current_window_group = self.global_window_group_list[parent_node].copy()
+            child_window_group = self.global_window_group_list[child_node]
+
+            self.play(
+                ShowPassingFlash(self.displayed_tree.edges[(parent_node, child_node)].copy().set_stroke(width=5,color=YELLOW)),
+                ReplacementTransform(current_window_group[RECT], child_window_group[RECT]),
+                TransformMatchingTex(current_window_group[ALPHA_TEX], child_window_group[BETA_TEX]),
+                TransformMatchingTex(current_window_group[BETA_TEX], child_window_group[ALPHA_TEX]),
+                run_time=run_time
+            )
+
+        def AnimateReturnAlphaBeta(parent_node, child_node, best_so_far, displayed_best_so_far, exact=False, run_time=1):
+            if parent_node == child_node:
+                return
+
+            orig_parent_window_group = self.global_window_group_list[parent_node]
+            new_parent_window_group = self.global_window_group_list[parent_node+self.internal_tree.size]
+
+            color = RED if best_so_far > 0 else BLUE
+
+            dot = Dot(radius=0.04, color=color).next_to(self.displayed_tree[parent_node]).shift((0,(RADIUS/10)*(-best_so_far),0))
+            dot.move_to((orig_parent_window_group[RECT].get_x(), dot.get_y(), 0))
+            dot_tex = Tex(f"{-best_so_far}", font_size=10, color=color).next_to(dot, LEFT)
+            dot_group = VGroup(dot, dot_tex)
+
+
+            if exact:
                 self.play(
-                    ShowPassingFlash(displayed_tree.edges[(parent_node, current_node)].copy().set_stroke(width=5,color=YELLOW)),
-                    ReplacementTransform(current_window_group[RECT], child_window_group[RECT]),
-                    current_window_group[ALPHA_TEX].animate.move_to(child_window_group[BETA_TEX]),
-                    current_window_group[BETA_TEX].animate.move_to(child_window_group[ALPHA_TEX]),
-                    run_time=1.5
-                )
-                self.play(
-                    TransformMatchingTex(current_window_group[ALPHA_TEX], child_window_group[NEGATIVE_ALPHA_TEX]),
-                    TransformMatchingTex(current_window_group[BETA_TEX], child_window_group[NEGATIVE_BETA_TEX]),
-                    run_time=1.5
+                    ShowPassingFlash(self.displayed_tree.edges[(parent_node, child_node)].copy().reverse_direction().set_stroke(width=5,color=YELLOW)),
+                    Write(
+                        Line(
+                            start=orig_parent_window_group[RECT].get_corner(DL), 
+                            end=orig_parent_window_group[RECT].get_corner(DR), 
+                            color=GREEN).set_z_index(-10)
+                    ),
+                    Transform(orig_parent_window_group[RECT], new_parent_window_group[RECT]),
+                    ReplacementTransform(displayed_best_so_far.copy(), dot_group),
+                    run_time=run_time
                 )
+            else:
                 self.play(
-                    TransformMatchingTex(child_window_group[NEGATIVE_ALPHA_TEX], child_window_group[BETA_TEX]),
-                    TransformMatchingTex(child_window_group[NEGATIVE_BETA_TEX], child_window_group[ALPHA_TEX]),
-                    run_time=1.5
+                    ShowPassingFlash(self.displayed_tree.edges[(parent_node, child_node)].copy().reverse_direction().set_stroke(width=5,color=YELLOW)),
+                    ReplacementTransform(displayed_best_so_far.copy(), dot_group), 
+                    run_time=run_time
                 )
-            else:
-                AnimateAlphaBeta(parent_node, current_node)
-            best_so_far = -10
-
-            if current_node not in internal_tree.edges_dict: #checks if current_node is a leaf
-                best_so_far = internal_tree.scores[current_node]
-                color = RED
-                dot = Dot(radius=0.04, color=color).next_to(displayed_tree[current_node]).shift((0,(RADIUS/10)*(best_so_far),0))
-                dot.move_to((global_window_group_list[current_node][RECT].get_x(), dot.get_y(), 0))
-                dot_tex = Tex(f"{best_so_far}", font_size=10, color=color).next_to(dot, LEFT)
-                dot_group = VGroup(dot, dot_tex)
-                displayed_best_so_far = MathTex(NumToStr(best_so_far)).move_to(displayed_node)
-                self.play(ReplacementTransform(displayed_best_so_far.copy(), dot_group))
-                if best_so_far > alpha and best_so_far < beta:
-                    exact = True
-                AddWindow(displayed_tree[parent_node], parent_node+internal_tree.size, -best_so_far, -alpha)
-                if current_node == 2:
-                    dot = Dot(radius=0.04, color=RED).next_to(displayed_tree[parent_node]).shift((0,(RADIUS/10)*(-best_so_far),0))
-                    dot.move_to((global_window_group_list[parent_node][RECT].get_x(), dot.get_y(), 0))
-                    six_tex = Tex("6", font_size=10, color=RED).next_to(dot, LEFT)
-                    dot_group = VGroup(dot, six_tex)
-                    self.play(
-                        ShowPassingFlash(displayed_tree.edges[(parent_node, current_node)].copy().reverse_direction().set_stroke(width=5,color=YELLOW)),
-                        ReplacementTransform(displayed_best_so_far.copy(), dot_group)
-                    )
-                    self.wait(1.7)
-                    self.wait(3)
-                    line_start = global_window_group_list[parent_node][RECT].get_corner(DL)
-                    line_end = global_window_group_list[parent_node][RECT].get_corner(DR)
-                    self.play(
-                        ReplacementTransform(global_window_group_list[parent_node][RECT], global_window_group_list[parent_node+internal_tree.size][RECT]),
-                        run_time=2
-                    )
-                    self.wait(1.2)
-                    self.play(GrowFromCenter(
-                            Line(
-                                start=line_start,
-                                end=line_end, 
-                                color=GREEN
-                            )
-                        ),
-                        run_time=1.5
-                    )
-                    self.wait(2.8)
-                    return best_so_far
-                if current_node == 9:
-                    self.next_section("beta_cutoff", skip_animations=True)
-                    dot = Dot(radius=0.04, color=RED).next_to(displayed_tree[parent_node]).shift((0,(RADIUS/10)*(-best_so_far),0))
-                    dot.move_to((global_window_group_list[parent_node][RECT].get_x(), dot.get_y(), 0))
-                    eight_tex = Tex("8", font_size=10, color=RED).next_to(dot, LEFT)
-                    dot_group = VGroup(dot, eight_tex)
-                    six_tex = Tex("6 for us", substrings_to_isolate=("6",)).move_to((-1,2.5,0))
-                    six_tex.set_color_by_tex("6", YELLOW)
-                    six_arrow = Arrow(
-                        start=six_tex.get_bottom(), 
-                        end=displayed_tree[2].get_left(), 
-                        max_tip_length_to_length_ratio=0.1, 
-                        max_stroke_width_to_length_ratio=2.5
-                    )
-                    six_group = VGroup(six_arrow, six_tex)
 
-                    self.play(
-                        ShowPassingFlash(displayed_tree.edges[(parent_node, current_node)].copy().reverse_direction().set_stroke(width=5,color=YELLOW)),
-                        ReplacementTransform(displayed_best_so_far.copy(), dot_group)
-                    )
-                    self.wait(3.9)
-                    self.play(
-                        Write(six_group),
-                        displayed_tree.edges[(1,2)].animate.set_color(YELLOW),
-                        displayed_tree.edges[(1,3)].animate.set_color(YELLOW),
-                        displayed_tree.edges[(3,4)].animate.set_color(YELLOW),
-                        displayed_tree.edges[(4,6)].animate.set_color(YELLOW),
-                        displayed_tree.edges[(6,9)].animate.set_color(YELLOW),
-                        displayed_tree[9][1].animate.set_color(YELLOW),
-                        run_time=1.5
-                    )
-                    self.wait(4.2)
-                    self.wait(6.7)
-                    self.play(
-                        Unwrite(six_group), 
-                        dot_group.animate.set_color(BLUE), 
-                        displayed_tree.edges[(1,2)].animate.set_color(WHITE),
-                        displayed_tree.edges[(1,3)].animate.set_color(WHITE),
-                        displayed_tree.edges[(3,4)].animate.set_color(WHITE),
-                        displayed_tree.edges[(4,6)].animate.set_color(WHITE),
-                        displayed_tree.edges[(6,9)].animate.set_color(WHITE),
-                        displayed_tree[9][1].animate.set_color(WHITE),
-                        run_time=1.5
-                    )
-                    self.wait(0.5)
-                    return best_so_far
-                AnimateReturnAlphaBeta(parent_node, current_node, best_so_far, displayed_best_so_far, exact)
-                return best_so_far
-            
-            for children_node in internal_tree.edges_dict[current_node]:
-                best_so_far = max(best_so_far, -ABNegamax(displayed_tree, internal_tree, current_node, children_node, -side_to_move, -beta, -alpha))
-                AddWindow(displayed_node, current_node+internal_tree.size, -best_so_far, beta)
-                if best_so_far > alpha:
-                    alpha = best_so_far
-                    exact = True
-                beta_cutoff = False
-                if alpha >= beta:
-                    beta_cutoff = True
-                    exact = False
-                    break
-                
-            displayed_best_so_far = MathTex(NumToStr(best_so_far)).move_to(displayed_node)
-            self.play(FadeIn(displayed_best_so_far, scale=1.5))
-
-            if beta_cutoff:
-                children_node += 1
-                while(children_node in internal_tree.edges_dict[current_node]):
-                    global_crosses_list.append(Cross(scale_factor=RADIUS-0.1).move_to(displayed_tree.edges[(current_node, children_node)]))
-                    self.play(Create(global_crosses_list[-1]))
-                    children_node += 1
-                            
-            AnimateReturnAlphaBeta(parent_node, current_node, best_so_far, displayed_best_so_far, exact)
-
-            return best_so_far
-                
-        internal_tree = Tree(type="ab")
-        displayed_tree = Graph([i for i in range(1, internal_tree.size)],
-            internal_tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=LAYOUT_SCALE,
-            vertex_config=VERTEX_CONFIG,
-            labels=internal_tree.labels
-        ).flip(axis=UP).move_to(RIGHT*0.5)
+        def Window(step):
+            AddWindow(self.displayed_tree[step.node], step.node, step.alpha, step.beta)
+
+        def UpdatedWindow(step):
+            AddWindow(self.displayed_tree[step.node], step.node+self.internal_tree.size, step.alpha, step.beta)
+
+        def Enter(step):
+            AnimateAlphaBeta(step.parent, step.node)
+
+        def Leaf(step):
+            color = RED
+            dot = Dot(radius=0.04, color=color).next_to(self.displayed_tree[step.node]).shift((0,(RADIUS/10)*(step.value),0))
+            dot.move_to((self.global_window_group_list[step.node][RECT].get_x(), dot.get_y(), 0))
+            dot_tex = Tex(f"{step.value}", font_size=10, color=color).next_to(dot, LEFT)
+            dot_group = VGroup(dot, dot_tex)
+            self.displayed_scores[step.node] = MathTex(NumToStr(step.value)).move_to(self.displayed_tree[step.node])
+            self.play(ReplacementTransform(self.displayed_scores[step.node].copy(), dot_group))
+
+        def Score(step):
+            self.displayed_scores[step.node] = MathTex(NumToStr(step.value)).move_to(self.displayed_tree[step.node])
+            self.play(FadeIn(self.displayed_scores[step.node], scale=1.5))
+
+        def CrossOut(step):
+            self.global_crosses_list.append(Cross(scale_factor=RADIUS-0.1).move_to(self.displayed_tree.edges[(step.parent, step.node)]))
+            self.play(Create(self.global_crosses_list[-1]))
+
+        def Return(step):
+            AnimateReturnAlphaBeta(step.parent, step.node, step.value, self.displayed_scores[step.node], step.exact)
+
+        #Steps that get their own narration
+        def EnterRoot(step):
+            self.wait(8)
+            self.play(Write(self.global_window_group_list[step.node][RECT]))
+            self.wait()
+            self.play(Write(self.global_window_group_list[step.node][ALPHA_TEX]))
+            self.wait()
+            self.play(Write(self.global_window_group_list[step.node][BETA_TEX]))
+            self.wait(10.7)
+
+        def EnterFirstChild(step):
+            current_window_group = self.global_window_group_list[step.parent].copy()
+            child_window_group = self.global_window_group_list[step.node]
 
-        self.play(*[FadeOut(submobject) for submobject in self.mobjects], run_time=3.5)
-        self.play(Write(displayed_tree))
-
-        global_window_group_list = [None for _ in range(1, 2*(internal_tree.size+1))]
-        ABNegamax(displayed_tree, internal_tree, parent_node=1, current_node=1, side_to_move=1)
-        self.wait(5)
+            self.play(
+                ShowPassingFlash(self.displayed_tree.edges[(step.parent, step.node)].copy().set_stroke(width=5,color=YELLOW)),
+                ReplacementTransform(current_window_group[RECT], child_window_group[RECT]),
+                current_window_group[ALPHA_TEX].animate.move_to(child_window_group[BETA_TEX]),
+                current_window_group[BETA_TEX].animate.move_to(child_window_group[ALPHA_TEX]),
+                run_time=1.5
+            )
+            self.play(
+                TransformMatchingTex(current_window_group[ALPHA_TEX], child_window_group[NEGATIVE_ALPHA_TEX]),
+                TransformMatchingTex(current_window_group[BETA_TEX], child_window_group[NEGATIVE_BETA_TEX]),
+                run_time=1.5
+            )
+            self.play(
+                TransformMatchingTex(child_window_group[NEGATIVE_ALPHA_TEX], child_window_group[BETA_TEX]),
+                TransformMatchingTex(child_window_group[NEGATIVE_BETA_TEX], child_window_group[ALPHA_TEX]),
+                run_time=1.5
+            )
 
+        def ReturnFirstChild(step):
+            dot = Dot(radius=0.04, color=RED).next_to(self.displayed_tree[step.parent]).shift((0,(RADIUS/10)*(-step.value),0))
+            dot.move_to((self.global_window_group_list[step.parent][RECT].get_x(), dot.get_y(), 0))
+            six_tex = Tex("6", font_size=10, color=RED).next_to(dot, LEFT)
+            dot_group = VGroup(dot, six_tex)
+            self.play(
+                ShowPassingFlash(self.displayed_tree.edges[(step.parent, step.node)].copy().reverse_direction().set_stroke(width=5,color=YELLOW)),
+                ReplacementTransform(self.displayed_scores[step.node].copy(), dot_group)
+            )
+            self.wait(1.7)
+            self.wait(3)
+            line_start = self.global_window_group_list[step.parent][RECT].get_corner(DL)
+            line_end = self.global_window_group_list[step.parent][RECT].get_corner(DR)
+            self.play(
+                ReplacementTransform(self.global_window_group_list[step.parent][RECT], self.global_window_group_list[step.parent+self.internal_tree.size][RECT]),
+                run_time=2
+            )
+            self.wait(1.2)
+            self.play(GrowFromCenter(
+                    Line(
+                        start=line_start,
+                        end=line_end, 
+                        color=GREEN
+                    )
+                ),
+                run_time=1.5
+            )
+            self.wait(2.8)
+
+        def ReturnFirstCutoff(step):
+            self.next_section("beta_cutoff", skip_animations=True)
+            dot = Dot(radius=0.04, color=RED).next_to(self.displayed_tree[step.parent]).shift((0,(RADIUS/10)*(-step.value),0))
+            dot.move_to((self.global_window_group_list[step.parent][RECT].get_x(), dot.get_y(), 0))
+            eight_tex = Tex("8", font_size=10, color=RED).next_to(dot, LEFT)
+            dot_group = VGroup(dot, eight_tex)
+            six_tex = Tex("6 for us", substrings_to_isolate=("6",)).move_to((-1,2.5,0))
+            six_tex.set_color_by_tex("6", YELLOW)
+            six_arrow = Arrow(
+                start=six_tex.get_bottom(), 
+                end=self.displayed_tree[2].get_left(), 
+                max_tip_length_to_length_ratio=0.1, 
+                max_stroke_width_to_length_ratio=2.5
+            )
+            six_group = VGroup(six_arrow, six_tex)
 
-        self.next_section("ab_properties", skip_animations=True)
+            self.play(
+                ShowPassingFlash(self.displayed_tree.edges[(step.parent, step.node)].copy().reverse_direction().set_stroke(width=5,color=YELLOW)),
+                ReplacementTransform(self.displayed_scores[step.node].copy(), dot_group)
+            )
+            self.wait(3.9)
+            self.play(
+                Write(six_group),
+                self.displayed_tree.edges[(1,2)].animate.set_color(YELLOW),
+                self.displayed_tree.edges[(1,3)].animate.set_color(YELLOW),
+                self.displayed_tree.edges[(3,4)].animate.set_color(YELLOW),
+                self.displayed_tree.edges[(4,6)].animate.set_color(YELLOW),
+                self.displayed_tree.edges[(6,9)].animate.set_color(YELLOW),
+                self.displayed_tree[9][1].animate.set_color(YELLOW),
+                run_time=1.5
+            )
+            self.wait(4.2)
+            self.wait(6.7)
+            self.play(
+                Unwrite(six_group), 
+                dot_group.animate.set_color(BLUE), 
+                self.displayed_tree.edges[(1,2)].animate.set_color(WHITE),
+                self.displayed_tree.edges[(1,3)].animate.set_color(WHITE),
+                self.displayed_tree.edges[(3,4)].animate.set_color(WHITE),
+                self.displayed_tree.edges[(4,6)].animate.set_color(WHITE),
+                self.displayed_tree.edges[(6,9)].animate.set_color(WHITE),
+                self.displayed_tree[9][1].animate.set_color(WHITE),
+                run_time=1.5
+            )
+            self.wait(0.5)
+
+        #Resuming at beta_cutoff restores the tree, the windows and where the steps got to from the snapshot
+        if self.resumed_section != "beta_cutoff":
+            self.internal_tree = Tree(type="ab")
+            self.displayed_tree = TreeMobject(self.internal_tree, LAYOUT_SCALE, VERTEX_CONFIG, RIGHT*0.5)
+
+            self.play(*[FadeOut(submobject) for submobject in self.mobjects], run_time=3.5)
+            self.play(Write(self.displayed_tree))
+
+            self.global_window_group_list = [None for _ in range(1, 2*(self.internal_tree.size+1))]
+            self.global_crosses_list = []
+            self.displayed_scores = {}
+            self.ab_steps = PlanAlphaBeta(search.CachedSearch(search.TracePath("AB_ab_tree"), AlphaBeta, self.internal_tree).trace, run_times=AB_TREE_RUN_TIMES)
+            self.ab_step_index = 0
+            #Segments are keyed on the tree's contents and, through the chain, on every step played before them
+            self.ab_tree_fingerprint = search.TreeFingerprint(self.internal_tree)
+            self.ab_plan_hash = rendercache.Chain(None, self.ab_tree_fingerprint)
+
+        handlers = {
+            timeline.WINDOW: Window,
+            timeline.UPDATED_WINDOW: UpdatedWindow,
+            timeline.ENTER: Enter,
+            timeline.LEAF: Leaf,
+            timeline.SCORE: Score,
+            timeline.CROSS: CrossOut,
+            timeline.RETURN: Return,
+        }
+        overrides = {
+            (timeline.ENTER, 1): EnterRoot,
+            (timeline.ENTER, 2): EnterFirstChild,
+            (timeline.RETURN, 2): ReturnFirstChild,
+            (timeline.RETURN, 9): ReturnFirstCutoff,
+        }
+        #Everything the steps draw with. The handlers and narrated steps are inside ab_tree, and TreeMobject's labels
+        #come from Tree.Labels, which formats them with tree.py's own NumToStr
+        segment_code = (AB.ab_tree, PlayStep, TreeMobject, TreeEdges, TreeReveal, TreeLayout, AlphaBetaWindow, ScoreStrip, NumToStr, RADIUS, VERTEX_CONFIG, LAYOUT_SCALE,
+            Tree.Labels, tree.NumToStr, labels.Label, labels.LabelFactory)
+        #One step at a time so a snapshot taken mid-search knows which step to pick up from
+        while self.ab_step_index < len(self.ab_steps):
+            step = self.ab_steps[self.ab_step_index]
+            #A step's plays depend on the tree, the step and what the steps before it left on screen, so they stay
+            #cached when other sections change
+            with rendercache.Segment(self, code=segment_code, tree=self.ab_tree_fingerprint, step=step._asdict(), before=self.ab_plan_hash):
+                PlayStep(step, handlers, overrides)
+            self.ab_plan_hash = rendercache.Chain(self.ab_plan_hash, step._asdict())
+            self.ab_step_index += 1
+        self.wait(5)
 
+    def ab_properties(self):
         fail_high_text = Tex("Fail high", font_size=24, color=BLUE)
         fail_low_text = Tex("Fail low", font_size=24, color=RED)
         exact_text = Tex("Exact", font_size=24, color=GREEN)
@@ -1485,63 +1441,43 @@ class AB(Scene):
         question_marks = []
 
         window_tracker = ValueTracker(2)
-        exact_window = always_redraw(lambda: Rectangle(height=window_tracker.get_value()*2, width=3, stroke_width=1, color=GREEN_E, fill_opacity=0.3))
-        non_exact_windows = always_redraw(
-            lambda: VGroup(
-                Rectangle(height=4-window_tracker.get_value(), width=3, stroke_width=1, color=RED, fill_opacity=0.2).shift(UP*(2+(window_tracker.get_value())/2)),Rectangle(height=4-window_tracker.get_value(), width=3, stroke_width=1, color=RED, fill_opacity=0.2).shift(DOWN*(2+(window_tracker.get_value())/2))
-                )
-            ),
-        alpha_tex = always_redraw(lambda: MathTex(r"\alpha", color=RED).next_to(exact_window,LEFT).shift(DOWN*window_tracker.get_value()))
-        beta_tex = always_redraw(lambda: MathTex(r"\beta", color=BLUE).next_to(exact_window,LEFT).shift(UP*window_tracker.get_value()))
-        dot = Dot()
-        def dot_updater(mobj):
-            if -window_tracker.get_value() <= mobj.get_center()[1] < window_tracker.get_value():
-                mobj.set_color(GREEN)
-            else:
-                mobj.set_color(RED)
-        dot.add_updater(dot_updater)
-        score_dots = VGroup(
-            dot.copy().move_to((0, dot_y, 0)).set_color(GREEN if -2 < dot_y < 2 else RED) 
-            for dot_y in [0, -1, -0.5, -1.2, 3, 3.8, 1.5, -2.5, -1.8, 2.1, -1.9, 1.2, 0.5, 0.8, -2.8, -3.8, -3, 1]
-        )
+        ab_window = AlphaBetaWindow(lambda: -window_tracker.get_value(), window_tracker)
+        score_dots = ScoreStrip([0, -1, -0.5, -1.2, 3, 3.8, 1.5, -2.5, -1.8, 2.1, -1.9, 1.2, 0.5, 0.8, -2.8, -3.8, -3, 1], lambda: -window_tracker.get_value(), window_tracker)
 
         self.wait(3.4)
-        self.play(*[Circumscribe(displayed_tree[i], fade_out=True) for i in [9,13,17]], run_time=1.5)
+        self.play(*[Circumscribe(self.displayed_tree[i], fade_out=True) for i in [9,13,17]], run_time=1.5)
         self.wait(1.2)
-        self.play(*[Indicate(global_crosses_list[i], fade_out=True) for i in [0,1,2]], run_time=1.5)
+        self.play(*[Indicate(self.global_crosses_list[i], fade_out=True) for i in [0,1,2]], run_time=1.5)
         self.wait(1.1)
         self.wait(9.3)
         for node in range(9,18):
-            displayed_tree[node][1].save_state()
-            question_marks.append(Tex("?").move_to(displayed_tree[node][1]))
-        self.play(*[Transform(displayed_tree[node][1], question_marks[node-9]) for node in range(9,18)])    
+            self.displayed_tree[node][1].save_state()
+            question_marks.append(Tex("?").move_to(self.displayed_tree[node][1]))
+        self.play(*[Transform(self.displayed_tree[node][1], question_marks[node-9]) for node in range(9,18)])    
         self.wait(3.5)
         self.wait(2.9)
         for node in range(9,18):
-            displayed_tree[node][1].restore().set_opacity(0.5)
-        self.play(*[Write(displayed_tree[node][1]) for node in range(9,18)], *[question_marks[node].animate.set_opacity(0.75) for node in range(9)])
+            self.displayed_tree[node][1].restore().set_opacity(0.5)
+        self.play(*[Write(self.displayed_tree[node][1]) for node in range(9,18)], *[question_marks[node].animate.set_opacity(0.75) for node in range(9)])
         self.wait(3.2)
-        self.play(*[Restore(displayed_tree[node][1]) for node in range(9,18)], *[Uncreate(question_marks[node]) for node in range(9)])
+        self.play(*[Restore(self.displayed_tree[node][1]) for node in range(9,18)], *[Uncreate(question_marks[node]) for node in range(9)])
         self.wait(1.3)
         self.play(
-            Write(fail_high_text.copy().next_to(displayed_tree[7], UP).shift(LEFT*0.5)), 
-            Write(fail_high_text.copy().next_to(displayed_tree[3], UP).shift(RIGHT*0.2)), 
-            *[Write(fail_high_text.copy().next_to(displayed_tree[i], UP)) for i in [6,8]], 
-            Write(fail_low_text.copy().next_to(displayed_tree[4], UP)),
-            *[Write(fail_low_text.copy().next_to(displayed_tree[i], DOWN)) for i in [9,13,17]], 
-            *[Write(exact_text.copy().next_to(displayed_tree[i], UP)) for i in [1,2]],
-            *[Write(exact_text.copy().next_to(displayed_tree[i], DOWN)) for i in [12,15,16]], 
-            Write(not_searched_text.copy().next_to(displayed_tree[5], DOWN).shift(LEFT*0.1)),
-            *[Write(not_searched_text.copy().next_to(displayed_tree[i], DOWN)) for i in [10,11,14]], 
+            Write(fail_high_text.copy().next_to(self.displayed_tree[7], UP).shift(LEFT*0.5)), 
+            Write(fail_high_text.copy().next_to(self.displayed_tree[3], UP).shift(RIGHT*0.2)), 
+            *[Write(fail_high_text.copy().next_to(self.displayed_tree[i], UP)) for i in [6,8]], 
+            Write(fail_low_text.copy().next_to(self.displayed_tree[4], UP)),
+            *[Write(fail_low_text.copy().next_to(self.displayed_tree[i], DOWN)) for i in [9,13,17]], 
+            *[Write(exact_text.copy().next_to(self.displayed_tree[i], UP)) for i in [1,2]],
+            *[Write(exact_text.copy().next_to(self.displayed_tree[i], DOWN)) for i in [12,15,16]], 
+            Write(not_searched_text.copy().next_to(self.displayed_tree[5], DOWN).shift(LEFT*0.1)),
+            *[Write(not_searched_text.copy().next_to(self.displayed_tree[i], DOWN)) for i in [10,11,14]], 
             run_time=3
         )
         self.wait(15.2)
         self.clear()
         self.play(
-            DrawBorderThenFill(exact_window), 
-            DrawBorderThenFill(non_exact_windows[0]), 
-            Write(alpha_tex), 
-            Write(beta_tex),
+            ab_window.Draw(),
             Create(score_dots),
             window_tracker.animate.set_value(2)
         )
@@ -1567,16 +1503,10 @@ class AB(Scene):
         self.wait(8.4)
         self.clear()
         window_tracker.set_value(2)
-        exact_window.update(1/self.camera.frame_rate)
-        non_exact_windows[0].update(1/self.camera.frame_rate)
-        alpha_tex.update(1/self.camera.frame_rate)
-        beta_tex.update(1/self.camera.frame_rate)
+        ab_window.update(1/self.camera.frame_rate)
         score_dots.update(1/self.camera.frame_rate)
         self.play(
-            DrawBorderThenFill(exact_window), 
-            DrawBorderThenFill(non_exact_windows[0]), 
-            Write(alpha_tex), 
-            Write(beta_tex),
+            ab_window.Draw(),
             Create(score_dots),
             Create(true_score)
         )
@@ -1591,58 +1521,18 @@ class PVS(Scene):
         beta_value = ValueTracker(1)
         right_shift = ValueTracker(0)
 
-        exact_window = always_redraw(
-            lambda: Rectangle(
-                height=(beta_value.get_value()-alpha_value.get_value()),
-                width=3, 
-                stroke_width=1, 
-                color=GREEN_E, 
-                fill_opacity=0.3
-            ).shift(RIGHT*right_shift.get_value()+UP*(beta_value.get_value()+alpha_value.get_value())/2)
-        )
-        non_exact_windows = always_redraw(
-            lambda: VGroup(
-                Rectangle(
-                    height=4-beta_value.get_value(), 
-                    width=3, 
-                    stroke_width=1, 
-                    color=RED, 
-                    fill_opacity=0.2
-                ).shift(UP*(2+(beta_value.get_value())/2)+RIGHT*right_shift.get_value()),
-                Rectangle(
-                    height=4+alpha_value.get_value(), 
-                    width=3, 
-                    stroke_width=1, 
-                    color=RED, 
-                    fill_opacity=0.2
-                ).shift(UP*(-2+(alpha_value.get_value())/2)+RIGHT*right_shift.get_value())
-            )
-        ),
-        alpha_tex = always_redraw(lambda: MathTex(r"\alpha", color=RED).next_to(exact_window, DL))
-        beta_tex = always_redraw(lambda: MathTex(r"\beta", color=BLUE).next_to(exact_window, UL))
-        dot = Dot()
-        def dot_updater(mobj):
-            if alpha_value.get_value() <= mobj.get_center()[1] < beta_value.get_value():
-                mobj.set_color(GREEN)
-            else:
-                mobj.set_color(RED)
-        dot.add_updater(dot_updater)      
-        score_dots = VGroup(
-            dot.copy().move_to((0, dot_y, 0))
-            for dot_y in [-3.8, -3, -2.8, -2.5, -1.9, -1.8, -1.2, -1, -0.5, 0, 0.5, 1, 1.2, 1.5, 2.1, 3, 3.8]
-        )
-        
-        ab_window = VGroup(exact_window, non_exact_windows[0], alpha_tex, beta_tex)
+        ab_window = AlphaBetaWindow(alpha_value, beta_value, x=right_shift, label_directions=(DL, UL))
+        score_dots = ScoreStrip([-3.8, -3, -2.8, -2.5, -1.9, -1.8, -1.2, -1, -0.5, 0, 0.5, 1, 1.2, 1.5, 2.1, 3, 3.8], alpha_value, beta_value)
 
         score_dots.update(1/self.camera.frame_rate)
         true_score = VGroup(Dot(color=YELLOW).move_to([0,0.8,0]), Tex("True score", color=YELLOW, font_size=24).next_to(Dot(), UP*0.25))
         question_mark = Tex("?", color=YELLOW)
         moving_exact_dot_tracker = ValueTracker(-1)
-        moving_exact_dot = always_redraw(lambda: Dot(color=YELLOW, fill_opacity=0.5).move_to([0,moving_exact_dot_tracker.get_value(),0]))
+        moving_exact_dot = Dot(color=YELLOW, fill_opacity=0.5).add_updater(lambda m: m.move_to([0,moving_exact_dot_tracker.get_value(),0]), call_updater=True)
         principal_variation_search_text = Tex("Principal Variation Search", substrings_to_isolate=("P","V","S",))
         pvs_text = Tex("PVS", substrings_to_isolate=("P","V","S",))
 
-        self.add(exact_window, non_exact_windows[0], alpha_tex, beta_tex, score_dots, true_score)
+        self.add(ab_window, score_dots, true_score)
         self.wait(3.2)
         self.play(Wiggle(true_score))
         self.wait(3.9)
@@ -1739,18 +1629,13 @@ class PVS(Scene):
 
         ab_window.update(1/self.camera.frame_rate)
 
-        pvs_dots = VGroup(
-            *[dot.copy().move_to((3.5, dot_y, 0))
-            for dot_y in [0, -1.5, -3]],
-            Dot(color=YELLOW).move_to([3.5, 2.5, 0])
-        )
-        pvs_dots.update(1/self.camera.frame_rate)
+        pvs_dots = ScoreStrip([0, -1.5, -3], alpha_value, beta_value, x=3.5)
+        pvs_true_score = Dot(color=YELLOW).move_to([3.5, 2.5, 0])
 
+        pvs_edges = {(1,2), (1,3), (1,4), (2,5), (2,6), (2,7), (3,8), (3,9), (3,10), (3,11), (4,12) ,(4,13), (4,14)}
         graph = Graph([1,2,3,4,5,6,7,8,9,10,11,12,13,14],
-                {(1,2), (1,3), (1,4), (2,5), (2,6), (2,7), (3,8), (3,9), (3,10), (3,11), (4,12) ,(4,13), (4,14)},
-                layout="tree",
-                layout_config={"root_vertex":1},
-                layout_scale=(3,3),
+                pvs_edges,
+                layout=TreeLayout(pvs_edges, layout_scale=(3,3)),
                 labels=False
             )
         labeleddot = LabeledDot(stroke_width=2, stroke_color=WHITE, radius=0.35, color=BLACK, fill_opacity=1, label="")
@@ -1795,14 +1680,16 @@ class PVS(Scene):
 
         self.play(FadeOut(displayed_tree), FadeOut(alpha), FadeOut(parent_window), ReplacementTransform(full_window, ab_window), run_time=1.3)
         self.play(Write(pvs_dots[0]), alpha_value.animate.set_value(0), run_time=1.6)
+        #Only the first dot is in the scene so far, the others take the new alpha before they're written
+        pvs_dots.update()
         self.play(Succession(*[Write(pvs_dots[i]) for i in range(1,3)]), lag_ratio=0.75)
         self.wait(0.7)
-        self.play(Write(pvs_dots[3], run_time=0.7))
+        self.play(Write(pvs_true_score, run_time=0.7))
         self.wait(1.6)
-        self.play(Unwrite(pvs_dots[3], run_time=0.7))
+        self.play(Unwrite(pvs_true_score, run_time=0.7))
         self.wait()
 
-        self.remove(*[pvs_dot for pvs_dot in pvs_dots])
+        self.remove(*pvs_dots, pvs_true_score)
         displayed_tree = displayed_tree_template.copy()
         full_window = full_window_template.copy()
         parent_window = parent_window_template.copy()
@@ -1872,7 +1759,7 @@ class PVS(Scene):
             beta_value.animate.set_value(1.5),
             run_time=1.3
         )
-        dots = [Dot(color=GREEN if -1.5 <= dot_y < 1.5 else RED).move_to([3.5, dot_y, 0]) for dot_y in [-2.5, 1, -0.6, 0.2, -2, -3, -3.4, -2.3, -1.5, 0.8, -1, 0, -0.8]]
+        dots = ScoreStrip([-2.5, 1, -0.6, 0.2, -2, -3, -3.4, -2.3, -1.5, 0.8, -1, 0, -0.8], -1.5, 1.5, x=3.5)
         self.wait()
         self.play(Succession(*[Write(dot) for dot in dots], run_time=12.5))
         self.wait(0.5)
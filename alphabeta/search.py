@@ -0,0 +1,756 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import time
+from collections import Counter, namedtuple
+
+#Headless versions of the searches the scenes animate. They only read tree.edges_dict and tree.scores,
+#never touch manim, and record what happened as a flat trace of events for the scenes to play back
+
+ENTER = "enter"     #node entered with the window (alpha, beta)
+LEAF = "leaf"       #leaf node reached, value is its score
+UPDATE = "update"   #child node returned to parent, value is the parent's best so far and the window is the parent's updated one
+CUTOFF = "cutoff"   #parent stops searching after child node, value is the parent's best so far
+PRUNE = "prune"     #child node of parent was never searched
+RETURN = "return"   #node returns value to parent, the window is the one node was entered with
+HORIZON = "horizon" #depth limit reached at a node with children, value is evaluate's score for it
+HIT = "hit"         #node's value came straight from the transposition table, value is the stored score
+PROBE = "probe"     #null window search of child node settled it without a re-search: at or below alpha it's no better, and at or above beta it cuts off
+RESEARCH = "research" #null window search of child node came back between alpha and beta, value is its score and node is searched again in the full window
+
+Event = namedtuple("Event", ["kind", "parent", "node", "value", "alpha", "beta"], defaults=(None, None, None))
+#pv is the principal variation, the line of best children from the node the search started at
+SearchResult = namedtuple("SearchResult", ["value", "scores", "trace", "nodes", "cutoffs", "pv"], defaults=((),))
+#probes maps every child searched with a null window to PROBE (settled by the null window, failing low or high) or RESEARCH
+PVSResult = namedtuple("PVSResult", SearchResult._fields + ("probes", "alphabeta_nodes"))
+
+#Transposition table bounds. A search that failed low only knows an upper bound on the value and one that
+#failed high only a lower bound
+EXACT = "exact"
+LOWER = "lower"
+UPPER = "upper"
+
+TTEntry = namedtuple("TTEntry", ["key", "value", "bound", "best_child", "work"])
+
+class _Search:
+    def __init__(self, tree, ordering=None):
+        self.edges_dict = getattr(tree, "edges_dict", {})
+        self.leaf_scores = getattr(tree, "scores", {})
+        self.ordering = ordering
+        self.scores = {}
+        self.best_children = {}
+        self.trace = []
+        self.nodes = 0
+        self.cutoffs = 0
+
+    def Result(self, value, node=None):
+        return SearchResult(value, self.scores, self.trace, self.nodes, self.cutoffs, self.PrincipalVariation(node))
+
+    def PrincipalVariation(self, node):
+        pv = []
+        while node is not None:
+            pv.append(node)
+            node = self.best_children.get(node)
+        return tuple(pv)
+
+    def Children(self, node, ply):
+        #Children in the order the move ordering wants them searched, generation order without one
+        if self.ordering is None:
+            return self.edges_dict[node]
+        return self.ordering.Order(node, ply)
+
+    def Enter(self, parent, node, alpha=None, beta=None):
+        self.nodes += 1
+        self.trace.append(Event(ENTER, parent, node, None, alpha, beta))
+
+    def Leaf(self, parent, node, alpha=None, beta=None):
+        score = self.leaf_scores[node]
+        self.trace.append(Event(LEAF, parent, node, score, alpha, beta))
+        return score
+
+    def Prune(self, node, children_node, children=None):
+        #Crosses out every child after the one that caused the cutoff
+        children = self.edges_dict[node] if children is None else children
+        for pruned_node in children[children.index(children_node)+1:]:
+            self.trace.append(Event(PRUNE, node, pruned_node))
+
+def Minimax(tree, node=1, is_maximiser=True):
+    search = _Search(tree)
+
+    def Search(parent, node, is_maximiser):
+        search.Enter(parent, node)
+        if node not in search.edges_dict: #checks if node is a leaf
+            best_so_far = search.Leaf(parent, node)
+        else:
+            best_so_far = -10 if is_maximiser else 10
+            for children_node in search.edges_dict[node]:
+                child_score = Search(node, children_node, not is_maximiser)
+                best_so_far = max(best_so_far, child_score) if is_maximiser else min(best_so_far, child_score)
+                search.scores[node] = best_so_far
+                search.trace.append(Event(UPDATE, node, children_node, best_so_far))
+        search.trace.append(Event(RETURN, parent, node, best_so_far))
+        return best_so_far
+
+    return search.Result(Search(0, node, is_maximiser))
+
+def Negamax(tree, node=1):
+    search = _Search(tree)
+
+    def Search(parent, node):
+        search.Enter(parent, node)
+        if node not in search.edges_dict: #checks if node is a leaf
+            best_so_far = search.Leaf(parent, node)
+        else:
+            best_so_far = -10
+            for children_node in search.edges_dict[node]:
+                best_so_far = max(best_so_far, -Search(node, children_node))
+                search.scores[node] = best_so_far
+                search.trace.append(Event(UPDATE, node, children_node, best_so_far))
+        search.trace.append(Event(RETURN, parent, node, best_so_far))
+        return best_so_far
+
+    return search.Result(Search(0, node))
+
+def AlphaBeta(tree, node=1, alpha=-10, beta=10, cutoff_at_beta=True, ordering=None, depth=None, evaluate=None):
+    #cutoff_at_beta=False only cuts once best_so_far > beta, which is what FillTree and the intro tree have always drawn.
+    #ordering is a MoveOrdering deciding which children are searched first. With a depth, nodes that many plies down
+    #are scored by evaluate(node) (StaticEvaluation by default) instead of being searched
+    search = _Search(tree, ordering)
+    evaluate = evaluate or (lambda node: StaticEvaluation(tree, node))
+
+    def Search(parent, node, alpha, beta, ply):
+        search.Enter(parent, node, alpha, beta)
+        if node not in search.edges_dict: #checks if node is a leaf
+            best_so_far = search.Leaf(parent, node, alpha, beta)
+            search.trace.append(Event(RETURN, parent, node, best_so_far, alpha, beta))
+            return best_so_far
+        if depth is not None and ply >= depth:
+            best_so_far = evaluate(node)
+            search.trace.append(Event(HORIZON, parent, node, best_so_far, alpha, beta))
+            search.trace.append(Event(RETURN, parent, node, best_so_far, alpha, beta))
+            return best_so_far
+
+        entry_alpha = alpha
+        best_so_far = -10
+        children = search.Children(node, ply)
+        for children_node in children:
+            child_score = -Search(node, children_node, -beta, -alpha, ply+1)
+            if child_score > best_so_far or node not in search.best_children:
+                search.best_children[node] = children_node
+            best_so_far = max(best_so_far, child_score)
+            alpha = max(best_so_far, alpha)
+            search.scores[node] = best_so_far
+            search.trace.append(Event(UPDATE, node, children_node, best_so_far, alpha, beta))
+            if best_so_far > beta or (cutoff_at_beta and best_so_far >= beta):
+                search.cutoffs += 1
+                search.trace.append(Event(CUTOFF, node, children_node, best_so_far, alpha, beta))
+                search.Prune(node, children_node, children)
+                if ordering is not None:
+                    ordering.Cutoff(node, children_node, ply)
+                break
+
+        search.trace.append(Event(RETURN, parent, node, best_so_far, entry_alpha, beta))
+        return best_so_far
+
+    return search.Result(Search(0, node, alpha, beta, 0), node)
+
+def PVS(tree, node=1, alpha=-10, beta=10, compare=False, ordering=None):
+    #Principal variation search. The first child gets the full window and every later one a null window
+    #(alpha, alpha+1) that only asks whether it beats alpha. Scores are whole numbers, so a child that comes back
+    #at or below alpha is no better and one at or above beta cuts off straight away. Only one in between is searched
+    #again, with the window it's now known to be in.
+    #compare=True also runs AlphaBeta over the same tree, with the same ordering, for alphabeta_nodes
+    search = _Search(tree, ordering)
+    probes = {}
+
+    def Search(parent, node, alpha, beta, ply):
+        search.Enter(parent, node, alpha, beta)
+        if node not in search.edges_dict: #checks if node is a leaf
+            best_so_far = search.Leaf(parent, node, alpha, beta)
+            search.trace.append(Event(RETURN, parent, node, best_so_far, alpha, beta))
+            return best_so_far
+
+        entry_alpha = alpha
+        best_so_far = -10
+        children = search.Children(node, ply)
+        for index, children_node in enumerate(children):
+            if index == 0:
+                child_score = -Search(node, children_node, -beta, -alpha, ply+1)
+            else:
+                child_score = -Search(node, children_node, -alpha-1, -alpha, ply+1)
+                if alpha < child_score < beta:
+                    probes[children_node] = RESEARCH
+                    search.trace.append(Event(RESEARCH, node, children_node, child_score, alpha, beta))
+                    child_score = -Search(node, children_node, -beta, -child_score, ply+1)
+                else:
+                    probes[children_node] = PROBE
+                    search.trace.append(Event(PROBE, node, children_node, child_score, alpha, beta))
+            if child_score > best_so_far or node not in search.best_children:
+                search.best_children[node] = children_node
+            best_so_far = max(best_so_far, child_score)
+            alpha = max(best_so_far, alpha)
+            search.scores[node] = best_so_far
+            search.trace.append(Event(UPDATE, node, children_node, best_so_far, alpha, beta))
+            if best_so_far >= beta:
+                search.cutoffs += 1
+                search.trace.append(Event(CUTOFF, node, children_node, best_so_far, alpha, beta))
+                search.Prune(node, children_node, children)
+                if ordering is not None:
+                    ordering.Cutoff(node, children_node, ply)
+                break
+
+        search.trace.append(Event(RETURN, parent, node, best_so_far, entry_alpha, beta))
+        return best_so_far
+
+    value = Search(0, node, alpha, beta, 0)
+    if ordering is not None:
+        ordering.Reset()
+    alphabeta_nodes = AlphaBeta(tree, node, alpha, beta, ordering=ordering).nodes if compare else None
+    return PVSResult(*search.Result(value, node), probes, alphabeta_nodes)
+
+class MoveOrdering:
+    #Generation order, and the base for the other orderings. A search asks Order for node's children before looping
+    #over them and calls Cutoff when one of them causes a cutoff. Orderings that learn as they go (killers, history)
+    #start over on Reset
+    def __init__(self, tree):
+        self.edges_dict = tree.edges_dict
+
+    def Order(self, node, ply):
+        return self.edges_dict[node]
+
+    def Cutoff(self, node, children_node, ply):
+        pass
+
+    def Reset(self):
+        pass
+
+    def Move(self, node, children_node):
+        #Nodes in different subtrees have nothing else in common, so a move is the child's place among its siblings
+        return self.edges_dict[node].index(children_node)
+
+class StaticOrder(MoveOrdering):
+    #Children sorted by their true negamax value, best for the parent first, or worst first for the worst case.
+    #This is perfect ordering, which a real engine can only approximate
+    def __init__(self, tree, best_first=True):
+        super().__init__(tree)
+        self.best_first = best_first
+        self.values = dict(tree.scores)
+        self.values.update(Negamax(tree).scores)
+
+    def Order(self, node, ply):
+        #The parent gets the child's value negated, so its best child has the lowest value
+        return sorted(self.edges_dict[node], key=lambda children_node: self.values[children_node], reverse=not self.best_first)
+
+class KillerMoves(MoveOrdering):
+    #The last few moves that caused a cutoff at the same ply go first, most recent first
+    def __init__(self, tree, slots=2):
+        super().__init__(tree)
+        self.slots = slots
+        self.Reset()
+
+    def Reset(self):
+        self.killers = {}
+
+    def Order(self, node, ply):
+        children = self.edges_dict[node]
+        first = [children[move] for move in self.killers.get(ply, []) if move < len(children)]
+        return first + [children_node for children_node in children if children_node not in first]
+
+    def Cutoff(self, node, children_node, ply):
+        move = self.Move(node, children_node)
+        killers = [killer for killer in self.killers.get(ply, []) if killer != move]
+        self.killers[ply] = ([move] + killers)[:self.slots]
+
+class HistoryHeuristic(MoveOrdering):
+    #Moves are tried in order of how many cutoffs they've caused anywhere in the tree, each cutoff counting the
+    #square of the height of the subtree it cut, since cutoffs near the root save the most
+    def __init__(self, tree):
+        super().__init__(tree)
+        self.heights = {}
+        self.Reset()
+
+    def Reset(self):
+        self.history = Counter()
+
+    def Order(self, node, ply):
+        children = self.edges_dict[node]
+        return sorted(children, key=lambda children_node: -self.history[children.index(children_node)])
+
+    def Cutoff(self, node, children_node, ply):
+        self.history[self.Move(node, children_node)] += self._Height(node) ** 2
+
+    def _Height(self, node):
+        if node not in self.heights:
+            self.heights[node] = 1 + max((self._Height(children_node) for children_node in self.edges_dict.get(node, ())), default=-1)
+        return self.heights[node]
+
+class PVFirst(MoveOrdering):
+    #The principal variation of an earlier search is followed first, everything else keeps generation order.
+    #Iterative deepening hands each iteration's pv to the next one
+    def __init__(self, tree, pv=()):
+        super().__init__(tree)
+        self.SetPV(pv)
+
+    def SetPV(self, pv):
+        self.pv_children = dict(zip(pv, pv[1:]))
+
+    def Order(self, node, ply):
+        children = self.edges_dict[node]
+        pv_child = self.pv_children.get(node)
+        if pv_child not in children:
+            return children
+        return (pv_child,) + tuple(children_node for children_node in children if children_node != pv_child)
+
+ORDERINGS = {
+    "generation": MoveOrdering,
+    "best_first": StaticOrder,
+    "worst_first": lambda tree: StaticOrder(tree, best_first=False),
+    "killer": KillerMoves,
+    "history": HistoryHeuristic,
+    #Seeded from a search one ply short of the leaves, what iterative deepening's last iteration starts from, since a pv
+    #from the full search would already know the answer
+    "pv_first": lambda tree: PVFirst(tree, AlphaBeta(tree, depth=max(0, Height(tree) - 1)).pv),
+}
+
+def CompareOrderings(trees, orderings=None, algorithm=AlphaBeta):
+    #Total nodes and cutoffs for each ordering over trees, so the spread between best and worst first is the
+    #most ordering can matter. pv_first takes its pv from a search one ply shallower, like the last iteration of
+    #iterative deepening would
+    orderings = orderings or ORDERINGS
+    totals = {name: {"ordering": name, "trees": 0, "nodes": 0, "cutoffs": 0} for name in orderings}
+    for tree in trees:
+        for name, Ordering in orderings.items():
+            result = algorithm(tree, ordering=Ordering(tree))
+            totals[name]["trees"] += 1
+            totals[name]["nodes"] += result.nodes
+            totals[name]["cutoffs"] += result.cutoffs
+    return list(totals.values())
+
+def StaticEvaluation(tree, node):
+    #What a node at the depth limit is worth without searching under it. Synthetic trees only score their leaves,
+    #so an unscored node counts as level, 0, the way an engine's evaluation would call a quiet position
+    score = tree.scores.get(node)
+    return 0 if score is None else score
+
+def Height(tree, node=1):
+    #Plies from node down to its deepest leaf, from the depths kept at generation where the tree has them
+    depths = getattr(tree, "depths", None)
+    if depths is not None and node == 1:
+        return max(depths.values())
+    children = tree.edges_dict.get(node, ())
+    return 1 + max(Height(tree, children_node) for children_node in children) if children else 0
+
+Iteration = namedtuple("Iteration", ["depth", "value", "pv", "nodes", "cutoffs", "seconds", "branching_factor"])
+DeepeningResult = namedtuple("DeepeningResult", ["value", "pv", "iterations", "completed_depth"])
+
+def IterativeDeepening(tree, node=1, max_depth=None, time_budget=None, evaluate=None, pv_first=True):
+    #AlphaBeta to depth 1, 2, ... up to max_depth (the whole tree by default), each iteration following the one
+    #before's principal variation first. branching_factor is the effective one, this iteration's nodes over the last's.
+    #With a time_budget in seconds no iteration is started that the last one's time and branching factor say won't
+    #finish inside it, and the deepest finished iteration's answer is returned
+    max_depth = Height(tree, node) if max_depth is None else max_depth
+    ordering = PVFirst(tree) if pv_first else None
+    iterations = []
+    started = time.perf_counter()
+    #A tree that's only a root still gets one search, to score it
+    for depth in range(1, max(1, max_depth) + 1):
+        if time_budget is not None and iterations:
+            last = iterations[-1]
+            elapsed = time.perf_counter() - started
+            if elapsed + last.seconds * (last.branching_factor or 1) > time_budget:
+                break
+        iteration_started = time.perf_counter()
+        result = AlphaBeta(tree, node, ordering=ordering, depth=depth, evaluate=evaluate)
+        seconds = time.perf_counter() - iteration_started
+        branching_factor = result.nodes / iterations[-1].nodes if iterations else None
+        iterations.append(Iteration(depth, result.value, result.pv, result.nodes, result.cutoffs, seconds, branching_factor))
+        if ordering is not None:
+            ordering.SetPV(result.pv)
+
+    last = iterations[-1]
+    return DeepeningResult(last.value, last.pv, iterations, last.depth)
+
+FAIL_LOW = "fail_low"
+FAIL_HIGH = "fail_high"
+EXACT_SCORE = "exact_score"
+
+Attempt = namedtuple("Attempt", ["alpha", "beta", "value", "outcome", "nodes", "result"])
+AspirationResult = namedtuple("AspirationResult", ["value", "attempts", "nodes", "full_window_nodes"])
+
+def _Widen(delta, initial_delta, widening):
+    match widening:
+        case "linear":
+            return delta + initial_delta
+        case "exponential":
+            return 2 * delta
+        case "full":
+            return 20
+    raise ValueError(f"unknown widening policy {widening}")
+
+def Aspiration(tree, node=1, guess=0, window=1, widening="exponential", cutoff_at_beta=True, compare=False):
+    #Alpha-beta in a window of window either side of guess. A score at or below alpha fails low and one at or above
+    #beta fails high, and that side of the window is widened and searched again until the score lands inside it.
+    #widening is how far the failed side moves each time: "linear" by window more each re-search, "exponential" twice
+    #as far as last time, or "full" straight out to -10/10. nodes is the total over every attempt, and compare=True also
+    #runs the full window search to fill in full_window_nodes
+    if not window >= 1:
+        raise ValueError(f"aspiration window must be at least 1, got {window}")
+    guess = max(-10, min(10, guess))
+    alpha = max(-10, guess - window)
+    beta = min(10, guess + window)
+    low_delta = high_delta = window
+    attempts = []
+    while True:
+        result = AlphaBeta(tree, node, alpha, beta, cutoff_at_beta)
+        if result.value <= alpha and alpha > -10:
+            outcome = FAIL_LOW
+        elif result.value >= beta and beta < 10:
+            outcome = FAIL_HIGH
+        else:
+            outcome = EXACT_SCORE
+        attempts.append(Attempt(alpha, beta, result.value, outcome, result.nodes, result))
+        match outcome:
+            case "fail_low":
+                low_delta = _Widen(low_delta, window, widening)
+                alpha = max(-10, guess - low_delta)
+            case "fail_high":
+                high_delta = _Widen(high_delta, window, widening)
+                beta = min(10, guess + high_delta)
+            case _:
+                break
+
+    full_window_nodes = AlphaBeta(tree, node, cutoff_at_beta=cutoff_at_beta).nodes if compare else None
+    return AspirationResult(result.value, attempts, sum(attempt.nodes for attempt in attempts), full_window_nodes)
+
+class TreeModel:
+    #Position-keyed view of a Tree for TTNegamax. edges_dict can share children between parents, so a DAG of
+    #positions with transpositions works too. Anything with the same Key, Children and Value methods can be
+    #searched, where Value is the score of a position with no children for the side to move
+    def __init__(self, tree):
+        self.edges_dict = tree.edges_dict
+        self.scores = tree.scores
+
+    def Key(self, position):
+        return position
+
+    def Children(self, position):
+        return self.edges_dict.get(position, ())
+
+    def Value(self, position):
+        return self.scores[position]
+
+class TranspositionTable:
+    #Fixed number of slots indexed by the key's hash, like a chess engine's table. When two positions want the
+    #same slot, "depth" keeps whichever took more nodes to search (the closest thing to depth when every search
+    #runs to the leaves) and "always" keeps the newest
+    def __init__(self, size=1 << 16, replacement="depth"):
+        if replacement not in ("depth", "always"):
+            raise ValueError(f"unknown replacement policy {replacement}")
+        self.size = size
+        self.replacement = replacement
+        self.Clear()
+
+    def Clear(self):
+        self.slots = [None] * self.size
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0
+        self.rejected = 0
+
+    def Probe(self, key):
+        self.probes += 1
+        entry = self.slots[hash(key) % self.size]
+        if entry is None or entry.key != key:
+            return None
+        self.hits += 1
+        return entry
+
+    def Store(self, key, value, bound, best_child=None, work=0):
+        index = hash(key) % self.size
+        old_entry = self.slots[index]
+        if old_entry is not None and old_entry.key != key:
+            if self.replacement == "depth" and old_entry.work > work:
+                self.rejected += 1
+                return
+            self.overwrites += 1
+        self.stores += 1
+        self.slots[index] = TTEntry(key, value, bound, best_child, work)
+
+    def Stats(self):
+        used = sum(entry is not None for entry in self.slots)
+        return {
+            "probes": self.probes,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.probes if self.probes else 0,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "rejected": self.rejected,
+            "used": used,
+            "size": self.size,
+        }
+
+def TTNegamax(model, position=1, alpha=-10, beta=10, table=None, record_trace=True):
+    #Alpha-beta negamax that looks every position up in table before searching it and tries the stored best
+    #child first. model is a TreeModel or anything shaped like one, and a Tree gets wrapped in one. Scores and
+    #trace events use model.Key(position) for nodes. Pass a table to keep it, and its Stats(), between searches
+    model = TreeModel(model) if hasattr(model, "edges_dict") and not hasattr(model, "Children") else model
+    table = TranspositionTable() if table is None else table
+    search = _Search(model)
+    Trace = search.trace.append if record_trace else lambda event: None
+
+    def Search(parent, position, alpha, beta):
+        key = model.Key(position)
+        search.nodes += 1
+        Trace(Event(ENTER, parent, key, None, alpha, beta))
+        entry_alpha = alpha
+        entry = table.Probe(key)
+        if entry is not None:
+            if entry.bound == EXACT or (entry.bound == LOWER and entry.value >= beta) or (entry.bound == UPPER and entry.value <= alpha):
+                Trace(Event(HIT, parent, key, entry.value, alpha, beta))
+                Trace(Event(RETURN, parent, key, entry.value, alpha, beta))
+                return entry.value, 1
+            #Not enough to answer straight away, but it still narrows the window
+            if entry.bound == LOWER:
+                alpha = max(alpha, entry.value)
+            else:
+                beta = min(beta, entry.value)
+            if alpha >= beta:
+                Trace(Event(HIT, parent, key, entry.value, alpha, beta))
+                Trace(Event(RETURN, parent, key, entry.value, entry_alpha, beta))
+                return entry.value, 1
+        window_alpha = alpha
+
+        children = list(model.Children(position))
+        if not children:
+            best_so_far = model.Value(position)
+            Trace(Event(LEAF, parent, key, best_so_far, alpha, beta))
+            Trace(Event(RETURN, parent, key, best_so_far, entry_alpha, beta))
+            table.Store(key, best_so_far, EXACT, work=1)
+            return best_so_far, 1
+
+        if entry is not None and entry.best_child is not None:
+            best_keys = [model.Key(child) for child in children]
+            if entry.best_child in best_keys:
+                children.insert(0, children.pop(best_keys.index(entry.best_child)))
+
+        best_so_far = -10
+        best_child = None
+        work = 1
+        for index, child in enumerate(children):
+            child_score, child_work = Search(key, child, -beta, -alpha)
+            work += child_work
+            if -child_score > best_so_far or best_child is None:
+                best_so_far = max(best_so_far, -child_score)
+                best_child = model.Key(child)
+                search.best_children[key] = best_child
+            alpha = max(best_so_far, alpha)
+            search.scores[key] = best_so_far
+            Trace(Event(UPDATE, key, model.Key(child), best_so_far, alpha, beta))
+            if best_so_far >= beta:
+                search.cutoffs += 1
+                Trace(Event(CUTOFF, key, model.Key(child), best_so_far, alpha, beta))
+                for pruned in children[index+1:]:
+                    Trace(Event(PRUNE, key, model.Key(pruned)))
+                break
+
+        if best_so_far <= window_alpha:
+            bound = UPPER
+        elif best_so_far >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        table.Store(key, best_so_far, bound, best_child, work)
+        Trace(Event(RETURN, parent, key, best_so_far, entry_alpha, beta))
+        return best_so_far, work
+
+    value, _ = Search(0, position, alpha, beta)
+    return search.Result(value, model.Key(position))
+
+#Traces on disk are line-delimited JSON, gzipped when the path ends in .gz. The first line is a header with the
+#result, its type, and anything the caller wants to note (algorithm, tree, seed, ...), then every event is a
+#[kind, parent, node, value, alpha, beta] array on its own line, so long traces can be streamed back one event at a time
+def _Open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t")
+    return open(path, mode)
+
+def _Node(node):
+    #JSON turns tuple keys (TTNegamax over positions) into lists
+    return tuple(_Node(part) for part in node) if isinstance(node, list) else node
+
+def TreeFingerprint(tree):
+    #Changes whenever the edges or scores do, so a recorded trace can tell it belongs to another tree
+    edges_dict = getattr(tree, "edges_dict", {})
+    scores = getattr(tree, "scores", {})
+    return hashlib.sha256(json.dumps([sorted(edges_dict.items()), sorted(scores.items())], default=str).encode()).hexdigest()
+
+def WriteTrace(path, result, **metadata):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    header = {
+        "value": result.value,
+        "nodes": result.nodes,
+        "cutoffs": result.cutoffs,
+        "scores": [[node, score] for node, score in result.scores.items()],
+        "events": len(result.trace),
+        "pv": list(result.pv),
+        "result": type(result).__name__,
+        **metadata,
+    }
+    if isinstance(result, PVSResult):
+        header["probes"] = [[node, kind] for node, kind in result.probes.items()]
+        header["alphabeta_nodes"] = result.alphabeta_nodes
+    with _Open(path, "w") as file:
+        file.write(json.dumps(header) + "\n")
+        for event in result.trace:
+            file.write(json.dumps(list(event), separators=(",", ":")) + "\n")
+
+def ReadHeader(path):
+    with _Open(path, "r") as file:
+        return json.loads(file.readline())
+
+def StreamTrace(path):
+    #Events one at a time without holding the whole trace, for PlanAlphaBeta and DiffTraces
+    with _Open(path, "r") as file:
+        file.readline()
+        for line in file:
+            kind, parent, node, value, alpha, beta = json.loads(line)
+            yield Event(kind, _Node(parent), _Node(node), value, alpha, beta)
+
+def ReadTrace(path):
+    #Back as the type it was written from, so a PVS trace keeps its probes
+    header = ReadHeader(path)
+    scores = {_Node(node): score for node, score in header["scores"]}
+    result = SearchResult(header["value"], scores, list(StreamTrace(path)), header["nodes"], header["cutoffs"], tuple(_Node(node) for node in header.get("pv", ())))
+    if header.get("result") == "PVSResult":
+        probes = {_Node(node): kind for node, kind in header["probes"]}
+        return PVSResult(*result, probes, header["alphabeta_nodes"])
+    return result
+
+def DiffTraces(trace_a, trace_b, context=3):
+    #Where two traces (lists, generators or paths) first disagree, and how many events of each kind each one has
+    trace_a = StreamTrace(trace_a) if isinstance(trace_a, str) else trace_a
+    trace_b = StreamTrace(trace_b) if isinstance(trace_b, str) else trace_b
+    counts_a = Counter()
+    counts_b = Counter()
+    recent = []
+    first_difference = None
+    missing = object()
+    for index, (event_a, event_b) in enumerate(_ZipLongest(trace_a, trace_b, missing)):
+        if event_a is not missing:
+            counts_a[event_a.kind] += 1
+        if event_b is not missing:
+            counts_b[event_b.kind] += 1
+        if first_difference is None:
+            if event_a != event_b:
+                first_difference = {
+                    "index": index,
+                    "before": recent,
+                    "a": None if event_a is missing else event_a,
+                    "b": None if event_b is missing else event_b,
+                }
+            else:
+                recent = (recent + [event_a])[-context:]
+    return {
+        "identical": first_difference is None,
+        "first_difference": first_difference,
+        "counts": {kind: (counts_a[kind], counts_b[kind]) for kind in sorted(counts_a.keys() | counts_b.keys())},
+    }
+
+def _ZipLongest(trace_a, trace_b, missing):
+    iterator_a = iter(trace_a)
+    iterator_b = iter(trace_b)
+    while True:
+        event_a = next(iterator_a, missing)
+        event_b = next(iterator_b, missing)
+        if event_a is missing and event_b is missing:
+            return
+        yield event_a, event_b
+
+ALGORITHMS = {"minimax": Minimax, "negamax": Negamax, "alphabeta": AlphaBeta, "pvs": PVS, "ttnegamax": TTNegamax}
+
+def TracePath(name):
+    #Where a scene keeps the trace called name, only when TRACE_DIR is set
+    trace_dir = os.environ.get("TRACE_DIR")
+    return os.path.join(trace_dir, f"{name}.trace.gz") if trace_dir else None
+
+def CachedSearch(path, algorithm, tree, **kwargs):
+    #Replays the trace at path when it was recorded from the same tree and arguments, otherwise searches and records it
+    #there. With path=None this is just algorithm(tree, **kwargs). An ordering is given by its name in ORDERINGS, and
+    #every other argument has to be JSON, since the arguments are what the recording is matched on
+    if isinstance(kwargs.get("ordering"), MoveOrdering):
+        raise ValueError("CachedSearch takes an ordering by its name in ORDERINGS, not an ordering object")
+    if kwargs.get("ordering") is not None and kwargs["ordering"] not in ORDERINGS:
+        raise ValueError(f"unknown ordering {kwargs['ordering']}")
+    try:
+        arguments = json.loads(json.dumps(kwargs))
+    except TypeError as error:
+        raise ValueError(f"CachedSearch can only key JSON arguments: {error}") from None
+    search_kwargs = dict(kwargs)
+    if search_kwargs.get("ordering") is not None:
+        search_kwargs["ordering"] = ORDERINGS[search_kwargs["ordering"]](tree)
+    if path is None:
+        return algorithm(tree, **search_kwargs)
+    fingerprint = TreeFingerprint(tree)
+    if os.path.exists(path):
+        header = ReadHeader(path)
+        if header.get("algorithm") == algorithm.__name__ and header.get("tree") == fingerprint and header.get("arguments") == arguments and "result" in header:
+            return ReadTrace(path)
+    result = algorithm(tree, **search_kwargs)
+    WriteTrace(path, result, algorithm=algorithm.__name__, tree=fingerprint, arguments=arguments)
+    return result
+
+class CorpusTree:
+    #Just the views the searches read, so recording and the benchmark don't need manim's Tree
+    def __init__(self, array_tree):
+        self.edges_dict = array_tree.EdgesDict()
+        self.scores = array_tree.ScoresDict()
+        self.depths = {node+1: depth for node, depth in enumerate(array_tree.depth.tolist())}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record search traces for a tree corpus, or diff two recorded traces")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="search every tree in a corpus from arraytree.SaveCorpus")
+    record.add_argument("corpus")
+    record.add_argument("--algorithm", choices=ALGORITHMS.keys(), default="alphabeta")
+    record.add_argument("--output-dir", default="traces")
+    deepen = commands.add_parser("deepen", help="iterative deepening over one tree of a corpus, per depth")
+    deepen.add_argument("corpus")
+    deepen.add_argument("--index", type=int, default=0)
+    deepen.add_argument("--max-depth", type=int, default=None)
+    deepen.add_argument("--time-budget", type=float, default=None, help="seconds")
+    orderings = commands.add_parser("orderings", help="nodes and cutoffs for every move ordering over a corpus")
+    orderings.add_argument("corpus")
+    orderings.add_argument("--algorithm", choices=["alphabeta", "pvs"], default="alphabeta")
+    diff = commands.add_parser("diff", help="compare two trace files")
+    diff.add_argument("trace_a")
+    diff.add_argument("trace_b")
+    args = parser.parse_args()
+
+    match args.command:
+        case "record":
+            from arraytree import LoadCorpus
+            array_trees = LoadCorpus(args.corpus)
+            for index, array_tree in enumerate(array_trees):
+                tree = CorpusTree(array_tree)
+                result = ALGORITHMS[args.algorithm](tree)
+                WriteTrace(os.path.join(args.output_dir, f"{args.algorithm}_{index:05}.trace.gz"), result, algorithm=ALGORITHMS[args.algorithm].__name__, corpus=os.path.abspath(args.corpus), index=index, tree=TreeFingerprint(tree))
+            print(f"Recorded {len(array_trees)} {args.algorithm} traces in {args.output_dir}")
+        case "deepen":
+            from arraytree import LoadCorpus
+            tree = CorpusTree(LoadCorpus(args.corpus)[args.index])
+            deepening = IterativeDeepening(tree, max_depth=args.max_depth, time_budget=args.time_budget)
+            for iteration in deepening.iterations:
+                branching_factor = "" if iteration.branching_factor is None else f"{iteration.branching_factor:.2f}"
+                print(f"depth {iteration.depth:>2} {iteration.value:>3} {iteration.nodes:>9} nodes {iteration.seconds*1000:10.3f} ms  EBF {branching_factor}")
+        case "orderings":
+            from arraytree import LoadCorpus
+            trees = [CorpusTree(array_tree) for array_tree in LoadCorpus(args.corpus)]
+            for row in CompareOrderings(trees, algorithm=ALGORITHMS[args.algorithm]):
+                print(f"{row['ordering']:<12} {row['nodes']:>10} nodes {row['cutoffs']:>9} cutoffs over {row['trees']} trees")
+        case "diff":
+            print(json.dumps(DiffTraces(args.trace_a, args.trace_b), indent=2, default=str))
@@ -0,0 +1,132 @@
+import hashlib
+import inspect
+import os
+import pickle
+import random as Rand
+import numpy as np
+from manim import Scene, DefaultSectionType, config, logger
+
+#Mobjects with updaters (always_redraw, add_updater) hold lambdas, which only dill can serialize
+try:
+    import dill as serializer
+except ImportError:
+    serializer = pickle
+
+class SectionedScene(Scene):
+    #construct plays SECTIONS in order, each one the method of the same name, and anything a later section needs is kept
+    #on self. When snapshots are on, every next_section writes the scene's mobjects, those attributes, the play count and
+    #the RNG states to disk, so setting RESUME_SECTION (here or as an environment variable) restores that snapshot and
+    #starts right at the section. Snapshots pickle the whole scene, so an ordinary render doesn't write them: they're on
+    #when SNAPSHOTS is set here or as an environment variable (render.py's dry run does that), or when a RESUME_SECTION
+    #is asked for, so the next run can resume. Snapshots go to SNAPSHOT_DIR if that's set, otherwise media_dir/snapshots.
+    #A snapshot is only used while the code that ran before it is unchanged. For a section that starts inside a method,
+    #like beta_cutoff inside ab_tree, edits to that method aren't checked
+    SECTIONS = [] #(name, skip_animations)
+    RESUME_SECTION = None
+    SNAPSHOTS = False
+
+    def construct(self):
+        self.current_section = None
+        self.resumed_section = None
+        #Everything Scene has set on self so far, and whatever it sets while playing, isn't the sections' own state
+        self.scene_attributes = set(vars(self)) | {"scene_attributes"}
+        names = [name for name, _ in self.SECTIONS]
+
+        start = 0
+        resume = self.RESUME_SECTION or os.environ.get("RESUME_SECTION")
+        if resume:
+            method = self.Restore(resume)
+            if method is not None:
+                start = names.index(method)
+                self.resumed_section = resume
+
+        for name, skip_animations in self.SECTIONS[start:]:
+            #A section resumed from the middle of a method is opened again by that method
+            if self.resumed_section is None or self.resumed_section == name:
+                self.next_section(name, skip_animations=skip_animations)
+            self.current_section = name
+            getattr(self, name)()
+
+    def next_section(self, name="unnamed", section_type=DefaultSectionType.NORMAL, skip_animations=False):
+        if name == getattr(self, "resumed_section", None):
+            self.resumed_section = None
+        elif hasattr(self, "current_section") and self.WritesSnapshots():
+            self.Snapshot(name)
+        super().next_section(name, section_type, skip_animations)
+
+    def play(self, *args, **kwargs):
+        attributes = set(vars(self))
+        super().play(*args, **kwargs)
+        if hasattr(self, "scene_attributes"):
+            self.scene_attributes |= set(vars(self)) - attributes
+
+    def WritesSnapshots(self):
+        setting = os.environ.get("SNAPSHOTS")
+        if setting is not None:
+            return setting == "1"
+        return bool(self.SNAPSHOTS or self.RESUME_SECTION or os.environ.get("RESUME_SECTION"))
+
+    def SnapshotPath(self, name):
+        snapshot_dir = os.environ.get("SNAPSHOT_DIR") or os.path.join(config.get_dir("media_dir"), "snapshots")
+        return os.path.join(snapshot_dir, type(self).__name__, f"{name}.pkl")
+
+    def SceneClasses(self):
+        #Only the classes that declare SECTIONS count, so wrappers like render.py's SectionRecorder share snapshots
+        return [scene_class for scene_class in type(self).__mro__ if "SECTIONS" in vars(scene_class) and scene_class is not SectionedScene]
+
+    def Fingerprint(self, method):
+        #Source of every section that has run by the time method starts, plus the helpers they share
+        names = [name for name, _ in self.SECTIONS]
+        ran = names[:names.index(method)]
+        scene_classes = self.SceneClasses()
+        helpers = sorted({name for scene_class in scene_classes for name, value in vars(scene_class).items() if inspect.isfunction(value) and name not in names})
+        digest = hashlib.sha256()
+        for name in ran + helpers:
+            digest.update(inspect.getsource(getattr(type(self), name)).encode())
+        return digest.hexdigest()
+
+    def Snapshot(self, name):
+        method = name if name in dict(self.SECTIONS) else self.current_section
+        snapshot = {
+            "method": method,
+            "fingerprint": self.Fingerprint(method),
+            "mobjects": self.mobjects,
+            "foreground_mobjects": self.foreground_mobjects,
+            #Whatever the sections have put on self by now, however they set it
+            "attributes": {key: value for key, value in vars(self).items() if key not in self.scene_attributes},
+            "num_plays": self.renderer.num_plays,
+            "time": self.renderer.time,
+            "random": Rand.getstate(),
+            "numpy": np.random.get_state(),
+        }
+        path = self.SnapshotPath(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            with open(path, "wb") as file:
+                serializer.dump(snapshot, file)
+        except Exception as error:
+            logger.warning(f"Couldn't snapshot section {name}: {error}")
+            if os.path.exists(path):
+                os.remove(path)
+
+    def Restore(self, name):
+        path = self.SnapshotPath(name)
+        if not os.path.exists(path):
+            logger.warning(f"No snapshot for section {name}, playing the scene from the start")
+            return None
+        with open(path, "rb") as file:
+            snapshot = serializer.load(file)
+        if snapshot["fingerprint"] != self.Fingerprint(snapshot["method"]):
+            logger.warning(f"Snapshot for section {name} is out of date, playing the scene from the start")
+            return None
+
+        self.mobjects = snapshot["mobjects"]
+        self.foreground_mobjects = snapshot["foreground_mobjects"]
+        for key, value in snapshot["attributes"].items():
+            setattr(self, key, value)
+        self.renderer.num_plays = snapshot["num_plays"]
+        self.renderer.time = snapshot["time"]
+        Rand.setstate(snapshot["random"])
+        np.random.set_state(snapshot["numpy"])
+        logger.info(f"Resuming {type(self).__name__} at section {name} (play {snapshot['num_plays']})")
+        return snapshot["method"]
@@ -0,0 +1,135 @@
+from collections import namedtuple
+import search
+
+#Turns a search trace into the flat list of animation steps a scene plays, so the whole animation is
+#known (and can be timed, counted or merged) before anything renders. Scenes map step kinds to handlers
+#and can override single steps by (kind, node) instead of special casing nodes inside the search
+
+WINDOW = "window"                   #build the window for node, nothing is played
+UPDATED_WINDOW = "updated_window"   #build the window node will shrink to once a child returns
+ENTER = "enter"                     #move from parent down to node
+LEAF = "leaf"                       #show a leaf's score in its window
+OPEN = "open"                       #write the starting best so far above node
+EDGE = "edge"                       #point at the edge from parent to node before searching node
+COMPARE = "compare"                 #previous best so far vs the score that just came back
+BEST = "best"                       #settle on the new best so far
+SCORE = "score"                     #fade in node's final score
+CROSS = "cross"                     #cross out the pruned edge from parent to node
+RETURN = "return"                   #hand node's score back up to parent
+
+Step = namedtuple("Step", ["kind", "node", "parent", "value", "previous", "alpha", "beta", "exact", "run_time"], defaults=(None, None, None, None, None, False, 0))
+
+#Seconds each step takes on screen with the default handlers
+MINIMAX_RUN_TIMES = {OPEN: 1, EDGE: 1, COMPARE: 1.3, BEST: 1, RETURN: 2}
+ALPHABETA_RUN_TIMES = {WINDOW: 0, UPDATED_WINDOW: 0, ENTER: 1, LEAF: 1, SCORE: 1, CROSS: 1, RETURN: 1}
+
+def _RunTime(default_run_times, run_times, kind, node):
+    #A (kind, node) entry beats a kind entry, which beats the default
+    if (kind, node) in run_times:
+        return run_times[(kind, node)]
+    return run_times.get(kind, default_run_times.get(kind, 0))
+
+def PlanMinimax(trace, is_maximiser=True, compare=True, run_times=None):
+    #Steps for a trace from search.Minimax. With compare=False only the edges and final scores are shown
+    run_times = run_times or {}
+    steps = []
+    def Add(kind, node, **fields):
+        steps.append(Step(kind, node, run_time=_RunTime(MINIMAX_RUN_TIMES, run_times, kind, node), **fields))
+
+    maximisers = {}
+    best_so_far = {}
+    child_score = None
+    for index, event in enumerate(trace):
+        match event.kind:
+            case search.ENTER:
+                maximisers[event.node] = is_maximiser if event.parent == 0 else not maximisers[event.parent]
+                if event.parent != 0:
+                    Add(EDGE, event.node, parent=event.parent)
+                if trace[index+1].kind != search.LEAF:
+                    best_so_far[event.node] = -10 if maximisers[event.node] else 10
+                    if compare:
+                        Add(OPEN, event.node, value=best_so_far[event.node])
+            case search.UPDATE:
+                if compare:
+                    Add(COMPARE, event.parent, parent=event.node, value=child_score, previous=best_so_far[event.parent])
+                    Add(BEST, event.parent, value=event.value)
+                best_so_far[event.parent] = event.value
+            case search.RETURN:
+                child_score = event.value
+                if event.node in best_so_far:
+                    Add(RETURN, event.node, parent=event.parent, value=event.value)
+    return steps
+
+def PlanAlphaBeta(trace, run_times=None):
+    #Steps for a trace from search.AlphaBeta. A node's score is exact when it landed strictly inside
+    #the window it was searched with, i.e. it raised alpha and never failed high
+    run_times = run_times or {}
+    steps = []
+    def Add(kind, node, **fields):
+        steps.append(Step(kind, node, run_time=_RunTime(ALPHABETA_RUN_TIMES, run_times, kind, node), **fields))
+
+    frames = []
+    for event in trace:
+        match event.kind:
+            case search.ENTER:
+                frames.append({"alpha": event.alpha, "exact": False, "leaf": False, "scored": False})
+                Add(WINDOW, event.node, parent=event.parent, alpha=event.alpha, beta=event.beta)
+                Add(ENTER, event.node, parent=event.parent, alpha=event.alpha, beta=event.beta)
+            case search.LEAF:
+                frames[-1]["leaf"] = True
+                frames[-1]["exact"] = event.alpha < event.value < event.beta
+                Add(LEAF, event.node, parent=event.parent, value=event.value)
+                Add(UPDATED_WINDOW, event.parent, alpha=-event.value, beta=-event.alpha)
+            case search.UPDATE:
+                Add(UPDATED_WINDOW, event.parent, alpha=-event.value, beta=event.beta)
+                if event.alpha > frames[-1]["alpha"]:
+                    frames[-1]["alpha"] = event.alpha
+                    frames[-1]["exact"] = True
+            case search.CUTOFF:
+                frames[-1]["exact"] = False
+                frames[-1]["scored"] = True
+                Add(SCORE, event.parent, value=event.value)
+            case search.PRUNE:
+                Add(CROSS, event.node, parent=event.parent)
+            case search.RETURN:
+                frame = frames.pop()
+                if not frame["leaf"] and not frame["scored"]:
+                    Add(SCORE, event.node, value=event.value)
+                if event.parent != 0:
+                    Add(RETURN, event.node, parent=event.parent, value=event.value, exact=frame["exact"])
+    return steps
+
+def RunTime(steps):
+    return sum(step.run_time for step in steps)
+
+def FrameCount(steps, frame_rate=60):
+    return sum(round(step.run_time * frame_rate) for step in steps)
+
+def MergeSteps(steps, kinds):
+    #Collapses runs of adjacent steps of the given kinds into one step over a tuple of nodes, to be played together
+    merged = []
+    for step in steps:
+        if merged and step.kind in kinds and merged[-1].kind == step.kind:
+            previous = merged[-1]
+            merged[-1] = previous._replace(
+                node=previous.node + (step.node,),
+                parent=previous.parent + (step.parent,),
+                value=previous.value + (step.value,),
+                run_time=max(previous.run_time, step.run_time)
+            )
+        elif step.kind in kinds:
+            merged.append(step._replace(node=(step.node,), parent=(step.parent,), value=(step.value,)))
+        else:
+            merged.append(step)
+    return merged
+
+def PlayStep(step, handlers, overrides=None):
+    #Kinds without a handler are skipped, so a scene only has to handle what it shows
+    overrides = overrides or {}
+    handler = overrides.get((step.kind, step.node), handlers.get(step.kind))
+    if handler is not None:
+        handler(step)
+
+def PlaySteps(steps, handlers, overrides=None):
+    for step in steps:
+        PlayStep(step, handlers, overrides)
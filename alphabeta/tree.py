@@ -3,6 +3,13 @@ import numpy as np
 import random as Rand
 import math
 from collections import deque
+from collections.abc import Mapping
+from labels import Label
+from layout import TreeLayout
+from arraytree import ArrayTree, Evaluate, MinimaxLeaves, GenerateLeafBoundedTree
+from fixtures import FIXTURES, GenerateTree, RejectionTree
+import search
+from search import AlphaBeta, Aspiration
 
 def NumToStr(num):
     if num == 10:
@@ -12,186 +19,264 @@ def NumToStr(num):
     else:
         return str(num)
     
-def GenerateTree(avgBranchingFactor, max_depth, fixed_depth: bool):
-    edges_list = []
-    edges_dict = {}
-    children = []
-    node_counter = 2  # 1 is the root 1 is current node
-    queue = deque()
-    queue.append((1, 1))  # (nodeID, currentDepth)
-
-    #Generate edges
-    while queue:
-        parentID, depth = queue.popleft()
-
-        if depth >= max_depth:
-            continue
-
-        branchingFactor = np.random.poisson(avgBranchingFactor)
-
-        if fixed_depth:
-            while (branchingFactor == 0):
-                branchingFactor = np.random.poisson(avgBranchingFactor)
-
-        elif not fixed_depth:
-            while (branchingFactor == 1):
-                branchingFactor = np.random.poisson(avgBranchingFactor)
-
-        for _ in range(branchingFactor):
-            childID = node_counter
-            node_counter += 1
-            if parentID in edges_dict:
-                children.append(childID)
-            else:
-                children = [childID]
-            edges_dict[parentID] = children
-            edges_list.append((parentID, childID))
-            queue.append((childID, depth + 1))
-
-    for edge in edges_dict:
-        edges_dict[edge] = tuple(edges_dict[edge])
-
-    #Generate labels
-    labels = {}
-    scores = {}
-    if len(list(edges_dict.keys())) == 0:
-        return edges_list, edges_dict, {1: MathTex("")}, {1: None}
-    max_node = edges_dict[list(edges_dict.keys())[-1]][-1]
-    for nodeID in range(1, max_node+1):
-        if nodeID in edges_dict: #parent node
-            labels[nodeID] = MathTex("").flip(axis=UP)
-            scores[nodeID] = None
-        else: #child node
-            score = Rand.randint(-9, 9)
-            labels[nodeID] = MathTex(f"{score}").flip(axis=UP)
-            scores[nodeID] = score
-
-    return edges_list, edges_dict, labels, scores
-
 class Tree:
-    edges_list = [] 
-    edges_dict = {}
-    labels = {}
-    scores = {}
     size = 0
 
     def __init__(self, type="ab"):
-        match type:
-            case "minimax":
-                self.edges_list=[(1,2),(1,3),(2,4),(2,5),(3,6),(3,7)]
-                self.edges_dict = {1: (2, 3), 2: (4, 5), 3: (6, 7)}
-                self.labels = {1:MathTex('').flip(axis=UP),2:MathTex('').flip(axis=UP),3:MathTex('').flip(axis=UP),4:MathTex('6').flip(axis=UP),5:MathTex('-4').flip(axis=UP),6:MathTex('7').flip(axis=UP),7:MathTex('2').flip(axis=UP),}
-                self.scores = {1: None, 2: None, 3: None, 4: 6, 5: -4, 6: 7, 7: 2}
-                self.size = 8
-            case "ab":
-                self.edges_list = [(1, 2), (1, 3), (3, 4), (3, 5), (4, 6), (4, 7), (4, 8), (6, 9), (6, 10), (6, 11), (7, 12), (7, 13), (7, 14), (8, 15), (8, 16), (8, 17)] 
-                self.edges_dict = {1: (2, 3), 3: (4, 5), 4: (6, 7, 8), 6: (9, 10, 11), 7: (12, 13, 14), 8: (15, 16, 17)}
-                self.labels = {1:MathTex('').flip(axis=UP),2:MathTex('-6').flip(axis=UP),3:MathTex('').flip(axis=UP),4:MathTex('').flip(axis=UP),5:MathTex('3').flip(axis=UP),6:MathTex('').flip(axis=UP),7:MathTex('').flip(axis=UP),8:MathTex('').flip(axis=UP),9:MathTex('-4').flip(axis=UP),10:MathTex('9').flip(axis=UP),11:MathTex('7').flip(axis=UP),12:MathTex('7').flip(axis=UP),13:MathTex('-4').flip(axis=UP),14:MathTex('9').flip(axis=UP),15:MathTex('9').flip(axis=UP),16:MathTex('7').flip(axis=UP),17:MathTex('-4').flip(axis=UP),}
-                self.scores = {1: None, 2: -6, 3: None, 4: None, 5: 3, 6: None, 7: None, 8: None, 9: -4, 10: 9, 11: 7, 12: 7, 13: -4, 14: 9, 15: 9, 16: 7, 17: -4}
-                self.size = 18
-            case "asp":
-                self.edges_list = [(1, 2), (1, 3), (2, 4), (2, 5), (3, 6), (3, 7), (4, 8), (4, 9), (8, 10), (8, 11), (8, 12), (8, 13), (8, 14), (9, 15), (9, 16), (9, 17)] 
-                self.edges_dict = {1: (2, 3), 2: (4, 5), 3: (6, 7), 4: (8, 9), 8: (10, 11, 12, 13, 14), 9: (15, 16, 17)}
-                self.labels = {1: MathTex('').flip(axis=UP), 2: MathTex('').flip(axis=UP), 3: MathTex('').flip(axis=UP), 4: MathTex('').flip(axis=UP), 5: MathTex('-1').flip(axis=UP), 6: MathTex('6').flip(axis=UP), 7: MathTex('2').flip(axis=UP), 8: MathTex('').flip(axis=UP), 9: MathTex('').flip(axis=UP), 10: MathTex('3').flip(axis=UP), 11: MathTex('4').flip(axis=UP), 12: MathTex('-9').flip(axis=UP), 13: MathTex('7').flip(axis=UP), 14: MathTex('2').flip(axis=UP), 15: MathTex('-6').flip(axis=UP), 16: MathTex('6').flip(axis=UP), 17: MathTex('7').flip(axis=UP),}
-                self.scores = {1: None, 2: None, 3: None, 4: None, 5: -1, 6: 6, 7: 2, 8: None, 9: None, 10: 3, 11: 4, 12: -9, 13: 7, 14: 2, 15: -6, 16: 6, 17: 7}
-                self.size = 18
-
-    def RandomTree(self, avg_branching_factor, max_depth, fixed_depth=False):
-        num_leaves = 0
-        leaf_offset = max(0, max_depth - 4)
-        if fixed_depth:
-            leaf_offset = 0
-        while num_leaves < (8 + leaf_offset) or num_leaves > (10 + leaf_offset):
-            num_leaves = 0
-            self.edges_list, self.edges_dict, self.labels, self.scores = GenerateTree(avg_branching_factor, max_depth, fixed_depth)
-            for node in self.scores:
-                if self.scores[node] is not None:
-                    num_leaves += 1
+        self.core = None
+        self._edges_list = []
+        self._edges_dict = {}
+        self._scores = {}
+        self._depths = None
+        if type in FIXTURES:
+            #Copies, since the scenes write scores into their trees
+            fixture = FIXTURES[type]
+            self.edges_list = list(fixture["edges_list"])
+            self.edges_dict = dict(fixture["edges_dict"])
+            self.scores = dict(fixture["scores"])
+            self.size = len(self.scores) + 1
+
+    def RandomTree(self, avg_branching_factor, max_depth, fixed_depth=False, num_leaves=None, seed=None):
+        #Passing num_leaves (a count or a (low, high) range) or a seed builds the tree in one go from a
+        #seeded generator instead of retrying GenerateTree. Returns the number of nodes generated
+        if num_leaves is not None or seed is not None:
+            if num_leaves is None:
+                leaf_offset = 0 if fixed_depth else max(0, max_depth - 4)
+                num_leaves = (8 + leaf_offset, 10 + leaf_offset)
+            rng = np.random.default_rng(seed)
+            self.SetArrayTree(GenerateLeafBoundedTree(rng, num_leaves, max_depth, avg_branching_factor, fixed_depth))
+            return self.size - 1
+
+        self.edges_list, self.edges_dict, self.scores, depths = RejectionTree(avg_branching_factor, max_depth, fixed_depth)
+        self._depths = depths
         self.size = len(self.edges_list) + 2
+        return self.size - 1
+
+    #An ArrayTree core holds the tree as contiguous arrays, and the list/dict views are only built when read
+    @classmethod
+    def FromArrayTree(cls, core: ArrayTree):
+        tree = cls(type=None)
+        tree.SetArrayTree(core)
+        return tree
+
+    def SetArrayTree(self, core: ArrayTree):
+        self.core = core
+        self._edges_list = self._edges_dict = self._scores = self._depths = None
+        self.size = core.num_nodes + 1
+
+    def ToArrayTree(self):
+        if self.core is None:
+            self.core = ArrayTree.FromEdges(self.edges_dict, self.scores)
+        elif self._scores is not None:
+            self.core.SetScores(self._scores)
+        return self.core
+
+    def UpdateScores(self, values):
+        #Takes a full score array, e.g. from Evaluate, and lets the dict view be rebuilt from it
+        self.ToArrayTree().scores[:] = values
+        self._scores = None
+
+    def Detach(self):
+        #Materializes the views and drops the core, for when the edges are about to be replaced
+        if self.core is not None:
+            self._edges_list, self._edges_dict, self._scores = self.edges_list, self.edges_dict, self.scores
+            self.core = None
+
+    @property
+    def edges_list(self):
+        if self._edges_list is None:
+            self._edges_list = self.core.EdgesList()
+        return self._edges_list
+
+    @edges_list.setter
+    def edges_list(self, edges_list):
+        self.Detach()
+        self._edges_list = edges_list
+        self._depths = None
+
+    @property
+    def edges_dict(self):
+        if self._edges_dict is None:
+            self._edges_dict = self.core.EdgesDict()
+        return self._edges_dict
+
+    @edges_dict.setter
+    def edges_dict(self, edges_dict):
+        self.Detach()
+        self._edges_dict = edges_dict
+        self._depths = None
+
+    @property
+    def depths(self):
+        #Depth of every node with the root at 0. Generated trees keep the depths they were generated with, and
+        #fixtures get theirs worked out from edges_dict
+        if self._depths is None:
+            if self.core is not None:
+                self._depths = {node+1: depth for node, depth in enumerate(self.core.depth.tolist())}
+            else:
+                self._depths = {1: 0}
+                queue = deque([1])
+                while queue:
+                    node = queue.popleft()
+                    for children_node in self.edges_dict.get(node, ()):
+                        self._depths[children_node] = self._depths[node] + 1
+                        queue.append(children_node)
+        return self._depths
+
+    @property
+    def scores(self):
+        if self._scores is None:
+            self._scores = self.core.ScoresDict()
+        return self._scores
+
+    @scores.setter
+    def scores(self, scores):
+        self._scores = scores
+
+    @property
+    def labels(self):
+        #Labels are derived from scores and only built when a Graph asks for them
+        return self.Labels()
+
+    def Labels(self, flipped=True):
+        return {node: Label("" if score is None else NumToStr(score), flipped) for node, score in self.scores.items()}
 
     def __str__(self):
-        label_string = ""
-        open_brace = "{"
-        close_brace = "}"
-        for label in self.labels:
-            label_string += str(label) + ":" + str(self.labels[label]) + ","
-        return f"edges_list = {self.edges_list} \nedges_dict = {self.edges_dict} \nlabels = {open_brace}{label_string}{close_brace} \nscores = {self.scores} \nsize = {self.size}"
+        return f"edges_list = {self.edges_list} \nedges_dict = {self.edges_dict} \nscores = {self.scores} \nsize = {self.size}"
 
 def GetMinimaxTree(tree: Tree, side_to_move=1, current_node=1):
-    minimax_tree = tree
-    if current_node not in minimax_tree.edges_dict: #checks if current_node is a leaf
-        minimax_tree.scores[current_node] *= side_to_move
-        return minimax_tree
-    
-    for children_node in minimax_tree.edges_dict[current_node]:
-        GetMinimaxTree(minimax_tree, side_to_move*-1, children_node)
-    
-    max_node = minimax_tree.edges_dict[list(minimax_tree.edges_dict.keys())[-1]][-1]
-    for nodeID in range(1, max_node+1):
-        if nodeID in minimax_tree.edges_dict: #parent node
-            pass
-        else:
-            minimax_tree.labels[nodeID] = MathTex(f"{minimax_tree.scores[nodeID]}").flip(axis=UP)
-    return minimax_tree
-
-def FillTree(tree: Tree, is_minimax=False, alphabeta=False, PVS=False, side_to_move=1, current_node=1, alpha=-10, beta=10):
+    tree.UpdateScores(MinimaxLeaves(tree.ToArrayTree(), side_to_move, current_node))
+    return tree
+
+class TreePositions:
+    #Stand-ins for the vertices and edges of the displayed tree, for placing windows and crosses. Labels sit inside
+    #the fixed-radius vertices, so leaving them out doesn't move anything
+    def __init__(self, tree: Tree, layout_scale, vertex_config, shift):
+        layout = TreeLayout(tree.edges_list, layout_scale=layout_scale, flip=True, shift=shift)
+        self.vertices = {node: Dot(point, radius=vertex_config["radius"]) for node, point in layout.items()}
+        self.edges = {(u, v): Line(layout[u], layout[v]) for u, v in tree.edges_list}
+
+    def __getitem__(self, node):
+        return self.vertices[node]
+
+    def Edge(self, parent, child):
+        return self.edges[(parent, child)]
+
+class TreeEdges(Mapping):
+    #TreeMobject.edges. Every edge is drawn as part of one path until it's looked up, at which point its segment
+    #moves out of the path into a Line of its own so it can be animated on its own like a Graph edge
+    def __init__(self, tree_mobject, edges_list):
+        self.tree_mobject = tree_mobject
+        self.edges_list = list(edges_list)
+        self.edge_set = set(self.edges_list)
+        self.lines = {}
+
+    def __getitem__(self, edge):
+        if edge not in self.edge_set:
+            raise KeyError(edge)
+        if edge not in self.lines:
+            self.lines[edge] = self.tree_mobject.SplitEdge(edge)
+        return self.lines[edge]
+
+    def __iter__(self):
+        return iter(self.edges_list)
+
+    def __len__(self):
+        return len(self.edges_list)
+
+    def __contains__(self, edge):
+        return edge in self.edge_set
+
+class TreeMobject(VGroup):
+    #Graph replacement for big trees. The vertices are copies of one template dot and the edges start out as the
+    #segments of a single VMobject, so there's one stroke to draw instead of one per edge. It's laid out the right way
+    #up, so unlike a Graph it doesn't need flipping, and shift is where its centre goes.
+    #tree_mobject[node] and tree_mobject.edges[(u, v)] behave like they do on a Graph, and the members are in a Graph's
+    #order, vertices then edges, with the edges under the vertices through z_index like a Graph's.
+    #Create and Write reveal it the way they reveal a Graph, see TreeReveal
+    def __init__(self, tree: Tree, layout_scale, vertex_config, shift=ORIGIN, labels=None, edge_config=None, **kwargs):
+        layout = TreeLayout(tree.edges_list, layout_scale=layout_scale, flip=True, shift=shift)
+        labels = tree.Labels(flipped=False) if labels is None else labels
+
+        self.path_edges = list(tree.edges_list)
+        self.edge_path = VMobject(**(edge_config or {})).set_z_index(-1)
+        if self.path_edges:
+            starts = np.array([layout[u] for u, _ in self.path_edges])
+            ends = np.array([layout[v] for _, v in self.path_edges])
+            #Straight cubic segments, the same points Line(start, end) would have
+            self.edge_path.points = np.stack([starts, (2*starts + ends)/3, (starts + 2*ends)/3, ends], axis=1).reshape(-1, 3)
+        self.edges = TreeEdges(self, self.path_edges)
+
+        template = Dot(**vertex_config)
+        self.vertices = {}
+        for node in sorted(layout):
+            vertex = template.copy().shift(layout[node])
+            if node in labels:
+                vertex.add(labels[node].move_to(layout[node]))
+            self.vertices[node] = vertex
+        super().__init__(*self.vertices.values(), self.edge_path, **kwargs)
+
+    def __getitem__(self, node):
+        return self.vertices[node]
+
+    def SplitEdge(self, edge):
+        line = self.EdgeLine(edge)
+        index = 4*self.path_edges.index(edge)
+        self.edge_path.points = np.delete(self.edge_path.points, np.s_[index:index+4], axis=0)
+        self.path_edges.remove(edge)
+        self.add(line)
+        return line
+
+    def EdgeLine(self, edge):
+        #The edge as a Line of its own, the one it was split into or a new one from its segment of the path
+        if edge in self.edges.lines:
+            return self.edges.lines[edge]
+        index = 4*self.path_edges.index(edge)
+        segment = self.edge_path.points[index:index+4]
+        return Line(segment[0], segment[-1]).match_style(self.edge_path).set_z_index(-1)
+
+    @override_animation(Create)
+    def CreateReveal(self, **kwargs):
+        return TreeReveal(self, Create, **kwargs)
+
+    @override_animation(Write)
+    def WriteReveal(self, **kwargs):
+        return TreeReveal(self, Write, **kwargs)
+
+class TreeReveal(AnimationGroup):
+    #Create or Write on a TreeMobject. A single path would be drawn in one animation slot, so the vertices and a Line
+    #per edge are animated instead, in the order a Graph's would be, and every edge gets its own slot like on a Graph.
+    #Once it's done the stand-in lines make way for the TreeMobject itself
+    def __init__(self, tree_mobject, animation_class, **kwargs):
+        self.tree_mobject = tree_mobject
+        self.stand_in = VGroup(*tree_mobject.vertices.values(), *[tree_mobject.EdgeLine(edge) for edge in tree_mobject.edges])
+        super().__init__(animation_class(self.stand_in, **kwargs))
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        scene.remove(self.mobject, self.stand_in)
+        scene.add(self.tree_mobject)
+
+def FillTree(tree: Tree, is_minimax=False, alphabeta=False, PVS=False, side_to_move=1, current_node=1, alpha=-10, beta=10, aspiration=None):
     RADIUS = 0.35
     VERTEX_CONFIG = {"stroke_width": 2, "stroke_color": WHITE, "radius": RADIUS, "color":BLACK, "fill_opacity": 1}
     LAYOUT_SCALE = (6, 3.5)
 
     if is_minimax and not alphabeta:
-        def Minimax(internal_tree: Tree, current_node: int, is_maximiser: bool):
-
-            if current_node not in internal_tree.edges_dict: #checks if current_node is a leaf
-                internal_tree.labels[current_node] = MathTex(f"{internal_tree.scores[current_node]}").flip(axis=UP)
-                return internal_tree.scores[current_node]
-
-            if is_maximiser:
-                best_so_far = -10
-                for children_node in internal_tree.edges_dict[current_node]:
-                    best_so_far = max(best_so_far, Minimax(internal_tree, children_node, False))
-                    internal_tree.scores[current_node] = best_so_far
-                    internal_tree.labels[current_node] = MathTex(f"{best_so_far}").flip(axis=UP)
-            else:
-                best_so_far = 10
-                for children_node in internal_tree.edges_dict[current_node]:
-                    best_so_far = min(best_so_far, Minimax(internal_tree, children_node, True))
-                    internal_tree.scores[current_node] = best_so_far
-                    internal_tree.labels[current_node] = MathTex(f"{best_so_far}").flip(axis=UP)
-
-            return best_so_far
-        
-        Minimax(tree, current_node, True)
+        tree.UpdateScores(Evaluate(tree.ToArrayTree(), current_node, minimax=True))
         displayed_tree = Graph([i for i in range(1, tree.size)],
             tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=LAYOUT_SCALE,
+            layout=TreeLayout(tree.edges_list, layout_scale=LAYOUT_SCALE),
             vertex_config=VERTEX_CONFIG,
             labels=tree.labels
         ).flip(axis=UP).move_to(RIGHT*0.5)
         return displayed_tree
 
     elif not is_minimax and not alphabeta:
-        def Negamax(internal_tree: Tree, current_node: int, side_to_move: int):
-
-            if current_node not in internal_tree.edges_dict: #checks if current_node is a leaf
-                return internal_tree.scores[current_node] 
-
-            best_so_far = -10
-            for children_node in internal_tree.edges_dict[current_node]:
-                best_so_far = max(best_so_far, -Negamax(internal_tree, children_node, -side_to_move))
-                internal_tree.scores[current_node] = best_so_far
-                internal_tree.labels[current_node] = MathTex(f"{best_so_far}").flip(axis=UP)
-
-            return best_so_far
-        
-        Negamax(tree, current_node, side_to_move)
+        tree.UpdateScores(Evaluate(tree.ToArrayTree(), current_node))
         displayed_tree = Graph([i for i in range(1, tree.size)],
             tree.edges_list,
-            layout="tree",
-            layout_config={"root_vertex":1},
-            layout_scale=LAYOUT_SCALE,
+            layout=TreeLayout(tree.edges_list, layout_scale=LAYOUT_SCALE),
             vertex_config=VERTEX_CONFIG,
             labels=tree.labels
         ).flip(axis=UP).move_to(RIGHT*0.5)
@@ -224,75 +309,27 @@ def FillTree(tree: Tree, is_minimax=False, alphabeta=False, PVS=False, side_to_m
                 dot_tex = Tex(f"{best_so_far}", font_size=10, color=color).next_to(dot, LEFT)
                 return VGroup(dot, dot_tex)
 
-        def Negamax(internal_tree: Tree, current_node: int, side_to_move: int, alpha:int, beta:int):
-
-            displayed_tree_for_positioning = Graph([i for i in range(1, internal_tree.size)],
-                internal_tree.edges_list,
-                layout="tree",
-                layout_config={"root_vertex":1},
-                layout_scale=LAYOUT_SCALE,
-                vertex_config=VERTEX_CONFIG,
-                labels={1:MathTex(''), 2:MathTex(''), 3:MathTex(''), 4:MathTex(''), 5:MathTex('-1'), 6:MathTex('6'), 7:MathTex('2'), 8:MathTex(''), 9:MathTex(''), 10:MathTex('4'), 11:MathTex('3'), 12:MathTex('-9'), 13:MathTex('7'), 14:MathTex('2'), 15:MathTex('-6'), 16:MathTex('6'), 17:MathTex('7'),}
-            ).flip(axis=UP).move_to(RIGHT*0.5)
-            best_so_far = -10
-            displayed_node = displayed_tree_for_positioning[current_node]
-            beta_cutoff = False
-
-            windows_group.add(MakeWindow(displayed_node, internal_tree.scores[current_node], alpha, beta, initial=True))
-            if current_node not in internal_tree.edges_dict: #checks if current_node is a leaf
-                windows_group.add(MakeWindow(displayed_node, internal_tree.scores[current_node], alpha, beta))
-                best_so_far = max(best_so_far, internal_tree.scores[current_node])
-                return best_so_far
-
-            best_so_far = -10
-            for children_node in internal_tree.edges_dict[current_node]:
-                best_so_far = max(best_so_far, -Negamax(internal_tree, children_node, -side_to_move, -beta, -alpha))
-                alpha = max(best_so_far, alpha)
-                internal_tree.scores[current_node] = best_so_far
-                internal_tree.labels[current_node] = MathTex(f"{best_so_far}").flip(axis=UP)
-                windows_group.add(MakeWindow(displayed_node, best_so_far, alpha, beta))
-                if best_so_far > beta:
-                    beta_cutoff = True
-                    break
-
-            if beta_cutoff == True:
-                children_node += 1
-                while(children_node in internal_tree.edges_dict[current_node]):
-                    windows_group.add((Cross(scale_factor=RADIUS-0.1).move_to(displayed_tree_for_positioning.edges[(current_node, children_node)])))
-                    children_node += 1
-                return best_so_far
-
-            return best_so_far
-        
-        # if alpha == -10 and beta == 10:
-        Negamax(tree, current_node=current_node, side_to_move=side_to_move, alpha=alpha, beta=beta)
-        # else:
-        #     while True:
-        #         asp_tree = tree
-        #         score = Negamax(tree, current_node=current_node, side_to_move=side_to_move, alpha=alpha, beta=beta)
-        #         if score <= alpha:
-        #             alpha -= 1
-        #         elif score > beta:
-        #             beta += 1
-        #         else:
-        #             windows_group = VGroup(Circle(color=BLACK, fill_opacity=1).set_z_index(-100))
-        #             Negamax(asp_tree, current_node=current_node, side_to_move=side_to_move, alpha=alpha, beta=beta)
-        #             displayed_tree = Graph([i for i in range(1, tree.size)],
-        #                 tree.edges_list,
-        #                 layout="tree",
-        #                 layout_config={"root_vertex":1},
-        #                 layout_scale=LAYOUT_SCALE,
-        #                 vertex_config=VERTEX_CONFIG,
-        #                 labels=tree.labels
-        #             ).flip(axis=UP).move_to(RIGHT*0.5)
-
-        #            return VGroup(displayed_tree, windows_group)
+        positions = TreePositions(tree, LAYOUT_SCALE, VERTEX_CONFIG, RIGHT*0.5)
+        if aspiration is None:
+            result = AlphaBeta(tree, node=current_node, alpha=alpha, beta=beta, cutoff_at_beta=False)
+        else:
+            #Only the search that finally landed inside its window is drawn
+            result = Aspiration(tree, node=current_node, cutoff_at_beta=False, **aspiration).attempts[-1].result
+        for event in result.trace:
+            match event.kind:
+                case search.ENTER:
+                    windows_group.add(MakeWindow(positions[event.node], tree.scores[event.node], event.alpha, event.beta, initial=True))
+                case search.LEAF:
+                    windows_group.add(MakeWindow(positions[event.node], event.value, event.alpha, event.beta))
+                case search.UPDATE:
+                    windows_group.add(MakeWindow(positions[event.parent], event.value, event.alpha, event.beta))
+                case search.PRUNE:
+                    windows_group.add((Cross(scale_factor=RADIUS-0.1).move_to(positions.Edge(event.parent, event.node))))
+        tree.scores.update(result.scores)
             
         displayed_tree = Graph([i for i in range(1, tree.size)],
                 tree.edges_list,
-                layout="tree",
-                layout_config={"root_vertex":1},
-                layout_scale=LAYOUT_SCALE,
+                layout=TreeLayout(tree.edges_list, layout_scale=LAYOUT_SCALE),
                 vertex_config=VERTEX_CONFIG,
                 labels=tree.labels
             ).flip(axis=UP).move_to(RIGHT*0.5)
@@ -304,14 +341,12 @@ def FillTree(tree: Tree, is_minimax=False, alphabeta=False, PVS=False, side_to_m
 #Perfect move ordering (beta cutoff demo)
     # edges_list = [(1, 2), (1, 3), (3, 4), (3, 5), (4, 6), (4, 7), (5, 8), (5, 9), (6, 10), (6, 11), (7, 12), (7, 13), (7, 14), (9, 15), (9, 16)] 
     # edges_dict = {1: (2, 3), 3: (4, 5), 4: (6, 7), 5: (8, 9), 6: (10, 11), 7: (12, 13, 14), 9: (15, 16)}
-    # labels = {1:MathTex('').flip(axis=UP),2:MathTex('0').flip(axis=UP),3:MathTex('').flip(axis=UP),4:MathTex('').flip(axis=UP),5:MathTex('').flip(axis=UP),6:MathTex('').flip(axis=UP),7:MathTex('').flip(axis=UP),8:MathTex('8').flip(axis=UP),9:MathTex('').flip(axis=UP),10:MathTex('-9').flip(axis=UP),11:MathTex('-4').flip(axis=UP),12:MathTex('-4').flip(axis=UP),13:MathTex('6').flip(axis=UP),14:MathTex('1').flip(axis=UP),15:MathTex('-3').flip(axis=UP),16:MathTex('-7').flip(axis=UP),}
     # scores = {1: None, 2: 0, 3: None, 4: None, 5: None, 6: None, 7: None, 8: 8, 9: None, 10: -9, 11: -4, 12: -4, 13: 6, 14: 1, 15: -3, 16: -7}
     # size = 17
 
 #Perfect move ordering again
     # edges_list = [(1, 2), (1, 3), (3, 4), (3, 5), (4, 6), (4, 7), (4, 8), (4, 9), (6, 10), (6, 11), (6, 12), (8, 13), (8, 14), (8, 15), (9, 16), (9, 17)] 
     # edges_dict = {1: (2, 3), 3: (4, 5), 4: (6, 7, 8, 9), 6: (10, 11, 12), 8: (13, 14, 15), 9: (16, 17)}
-    # labels = {1:MathTex('').flip(axis=UP),2:MathTex('-6').flip(axis=UP),3:MathTex('').flip(axis=UP),4:MathTex('').flip(axis=UP),5:MathTex('3').flip(axis=UP),6:MathTex('').flip(axis=UP),7:MathTex('0').flip(axis=UP),8:MathTex('').flip(axis=UP),9:MathTex('').flip(axis=UP),10:MathTex('-8').flip(axis=UP),11:MathTex('1').flip(axis=UP),12:MathTex('-5').flip(axis=UP),13:MathTex('-2').flip(axis=UP),14:MathTex('8').flip(axis=UP),15:MathTex('6').flip(axis=UP),16:MathTex('-1').flip(axis=UP),17:MathTex('-6').flip(axis=UP),}
     # scores = {1: None, 2: -6, 3: None, 4: None, 5: 3, 6: None, 7: 0, 8: None, 9: None, 10: -8, 11: 1, 12: -5, 13: -2, 14: 8, 15: 6, 16: -1, 17: -6}
     # size = 18
 
@@ -321,20 +356,17 @@ class DisplayTree(Scene):
         # while True:
         internal_tree = Tree(type="asp")
         #internal_tree.RandomTree(1.5, 5)
-        ab_internal_tree = internal_tree
-        exact_asp_ab_internal_tree = internal_tree
-        non_exact_asp_ab_internal_tree = internal_tree
-
-        ab_displayed_tree = FillTree(ab_internal_tree, is_minimax=False, alphabeta=True)
-        exact_asp_ab_displayed_tree = FillTree(exact_asp_ab_internal_tree, is_minimax=False, alphabeta=True, alpha=-2, beta=3)
-        non_exact_asp_ab_displayed_tree = FillTree(non_exact_asp_ab_internal_tree, is_minimax=False, alphabeta=True, alpha=-8, beta=-7)
+        ab_displayed_tree = FillTree(internal_tree, is_minimax=False, alphabeta=True)
+        #Every window the aspiration search tries, ending with the one the score lands in
+        aspiration = Aspiration(internal_tree, guess=0, window=1, cutoff_at_beta=False)
 
         self.add(ab_displayed_tree)
         self.wait(2)
-        self.play(ReplacementTransform(ab_displayed_tree, exact_asp_ab_displayed_tree))
-        self.wait()
-        self.play(ReplacementTransform(exact_asp_ab_displayed_tree, non_exact_asp_ab_displayed_tree))
-        self.wait()
+        for attempt in aspiration.attempts:
+            attempt_displayed_tree = FillTree(internal_tree, is_minimax=False, alphabeta=True, alpha=attempt.alpha, beta=attempt.beta)
+            self.play(ReplacementTransform(ab_displayed_tree, attempt_displayed_tree))
+            self.wait()
+            ab_displayed_tree = attempt_displayed_tree
         print(internal_tree)
 
         # internal_tree = Tree()
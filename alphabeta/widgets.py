@@ -0,0 +1,136 @@
+import numpy as np
+from manim import *
+
+#Mobjects that follow ValueTrackers by changing their own points in place, instead of the always_redraw
+#pattern of building new Rectangles and MathTex every frame
+
+def _Value(value):
+    #A ValueTracker, something that returns a number, or just a number
+    if isinstance(value, ValueTracker):
+        return value.get_value()
+    if callable(value):
+        return value()
+    return value
+
+def _Fit(rectangle, unit_points, left, right, bottom, top):
+    #Writes the corners straight into the rectangle's points. They only get reallocated if an animation changed how many there are
+    if rectangle.points.shape != unit_points.shape:
+        rectangle.points = unit_points.copy()
+    points = rectangle.points
+    np.multiply(unit_points[:, 0], right-left, out=points[:, 0])
+    points[:, 0] += (left+right)/2
+    np.multiply(unit_points[:, 1], top-bottom, out=points[:, 1])
+    points[:, 1] += (bottom+top)/2
+
+class AlphaBetaWindow(VGroup):
+    #Green exact window from alpha to beta with the red non-exact windows above and below it, out to bottom and top.
+    #label_directions say which way the alpha and beta labels sit from the window's left corners, (LEFT, LEFT) puts
+    #them level with the corners and (DL, UL) outside them
+    def __init__(self, alpha, beta, x=0, width=3, bottom=-4, top=4, label_directions=(LEFT, LEFT), buff=MED_SMALL_BUFF, **kwargs):
+        self.alpha = alpha
+        self.beta = beta
+        self.x = x
+        self.window_width = width
+        self.bottom = bottom
+        self.top = top
+        self.label_directions = label_directions
+        self.buff = buff
+        self.exact_window = Rectangle(height=1, width=1, stroke_width=1, color=GREEN_E, fill_opacity=0.3)
+        self.non_exact_windows = VGroup(
+            Rectangle(height=1, width=1, stroke_width=1, color=RED, fill_opacity=0.2),
+            Rectangle(height=1, width=1, stroke_width=1, color=RED, fill_opacity=0.2)
+        )
+        self.alpha_tex = MathTex(r"\alpha", color=RED)
+        self.beta_tex = MathTex(r"\beta", color=BLUE)
+        super().__init__(self.exact_window, self.non_exact_windows, self.alpha_tex, self.beta_tex, **kwargs)
+
+        self.unit_points = self.exact_window.points.copy()
+        self.label_offsets = [
+            np.array(direction) * (buff + np.array([label.width/2, label.height/2, 0]))
+            for label, direction in zip((self.alpha_tex, self.beta_tex), label_directions)
+        ]
+        self.templates = [part.copy() for part in self.submobjects]
+        self.mangled = False
+        self.Reshape()
+        self.add_updater(lambda window: window.Reshape())
+
+    def Reshape(self):
+        if self.mangled:
+            self.Rebuild()
+        alpha = _Value(self.alpha)
+        beta = _Value(self.beta)
+        left = _Value(self.x) - self.window_width/2
+        right = left + self.window_width
+        for rectangle, (bottom, top) in zip(
+            (self.exact_window, *self.non_exact_windows),
+            ((alpha, beta), (beta, self.top), (self.bottom, alpha))
+        ):
+            #Parts being animated on their own (DrawBorderThenFill, Write, ...) are left to the animation
+            if not rectangle.updating_suspended:
+                _Fit(rectangle, self.unit_points, left, right, bottom, top)
+        for label, offset, y in zip((self.alpha_tex, self.beta_tex), self.label_offsets, (alpha, beta)):
+            if not label.updating_suspended:
+                label.shift(np.array([left, y, 0]) + offset - label.get_center())
+        return self
+
+    def Rebuild(self):
+        #Transforming the window into something else rewrites its points, colours and even its submobjects
+        self.submobjects = [self.exact_window, self.non_exact_windows, self.alpha_tex, self.beta_tex]
+        for part, template in zip(self.submobjects, self.templates):
+            part.become(template)
+        self.mangled = False
+
+    def align_data(self, *args, **kwargs):
+        #Only called on the window when it's the one being transformed, so it needs rebuilding before its next use
+        if self.mangled:
+            self.Rebuild()
+            self.Reshape()
+        self.mangled = True
+        return super().align_data(*args, **kwargs)
+
+    def copy(self):
+        #Transforming into the window copies it, which should copy the real window
+        if self.mangled:
+            self.Reshape()
+        return super().copy()
+
+    def Draw(self, **kwargs):
+        #The group keeps the window itself in the scene, otherwise its updater never runs
+        return AnimationGroup(
+            DrawBorderThenFill(self.exact_window),
+            DrawBorderThenFill(self.non_exact_windows),
+            Write(self.alpha_tex),
+            Write(self.beta_tex),
+            group=self,
+            **kwargs
+        )
+
+class ScoreStrip(VGroup):
+    #A column of score dots at x, green inside [alpha, beta) and red outside. The scores live in one array, so each
+    #frame is a single comparison against the window and only the dots that crossed an edge get recoloured.
+    #Dots split off into other groups (ReplacementTransform of a few of them, ...) take the strip out of the scene
+    #and stop being recoloured
+    def __init__(self, scores, alpha, beta, x=0, inside_color=GREEN, outside_color=RED, **dot_config):
+        self.scores = np.asarray(scores, dtype=float)
+        self.alpha = alpha
+        self.beta = beta
+        self.inside_color = inside_color
+        self.outside_color = outside_color
+        self.inside = np.zeros(len(self.scores), dtype=bool)
+        self.dots = [Dot((x, score, 0), color=outside_color, **dot_config) for score in self.scores]
+        super().__init__(*self.dots)
+        self.Recolour(force=True)
+        self.add_updater(lambda strip: strip.Recolour())
+
+    def Recolour(self, force=False):
+        inside = (_Value(self.alpha) <= self.scores) & (self.scores < _Value(self.beta))
+        changed = np.arange(len(self.scores)) if force else np.flatnonzero(inside != self.inside)
+        for index in changed:
+            dot = self.dots[index]
+            #A dot in the middle of its own animation keeps its old colour until the next frame after it
+            if dot.updating_suspended and not force:
+                inside[index] = self.inside[index]
+                continue
+            dot.set_color(self.inside_color if inside[index] else self.outside_color)
+        self.inside = inside
+        return self
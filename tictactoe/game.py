@@ -1,31 +1,57 @@
+#Squares are numbered 0..8 row by row, and square n is bit n of a 9-bit mask
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000, #rows
+    0b001001001, 0b010010010, 0b100100100, #columns
+    0b100010001, 0b001010100               #diagonals
+)
+#The lines through each square, since a move can only complete one of those
+SQUARE_WIN_MASKS = tuple(tuple(mask for mask in WIN_MASKS if mask >> square & 1) for square in range(9))
+FULL_MASK = 0b111111111
+
 class Board:
+    #One mask per player, masks[0] for player 1 and masks[1] for player -1. board is a 9-element list view
+    #built from them, with 1, -1 or 0 in each square like before
     def __init__(self):
-        self.board = [0 for _ in range(9)]
+        self.masks = [0, 0]
         self.player = 1
         self.gameOver = False
+        self.history = [] #(square, gameOver before the move)
 
-    def MakeMove(self, square):
-        self.board[square] = self.player
-        self.IsGameOver()
-        self.player *= -1
+    @property
+    def board(self):
+        return [1 if self.masks[0] >> square & 1 else -1 if self.masks[1] >> square & 1 else 0 for square in range(9)]
 
-    def IsGameOver(self):
-        for row in range(0,9,3):
-            rowSum = 0
-            for rowSquare in range(row, row+3):
-                rowSum += self.board[rowSquare]
-            if rowSum == 3 or rowSum == -3:
-                self.gameOver = True
+    def Occupied(self):
+        return self.masks[0] | self.masks[1]
+
+    def Moves(self):
+        empty = ~self.Occupied() & FULL_MASK
+        return [square for square in range(9) if empty >> square & 1]
 
-        for col in range(3):
-            colSum = 0
-            for colSquare in range(col,9,3):
-                colSum += self.board[colSquare]
-            if colSum == 3 or colSum == -3:
+    def IsFull(self):
+        return self.Occupied() == FULL_MASK
+
+    def Key(self):
+        #Whose turn it is follows from the masks, so they're enough to identify the position
+        return (self.masks[0], self.masks[1])
+
+    def MakeMove(self, square):
+        side = 0 if self.player == 1 else 1
+        self.history.append((square, self.gameOver))
+        self.masks[side] |= 1 << square
+        mask = self.masks[side]
+        for line in SQUARE_WIN_MASKS[square]:
+            if mask & line == line:
                 self.gameOver = True
+                break
+        self.player *= -1
 
-        if self.board[0] == self.board[4] == self.board[8] != 0:
-            self.gameOver = True
-        if self.board[2] == self.board[4] == self.board[6] != 0:
-            self.gameOver = True
+    def UnmakeMove(self):
+        square, self.gameOver = self.history.pop()
+        self.player *= -1
+        self.masks[0 if self.player == 1 else 1] &= ~(1 << square)
 
+    def IsGameOver(self):
+        #Full check of both players, for boards whose masks were set directly
+        self.gameOver = self.gameOver or any(mask & line == line for mask in self.masks for line in WIN_MASKS)
+        return self.gameOver
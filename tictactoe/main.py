@@ -1,6 +1,6 @@
 from manim import *
-import random as Rand
 import game
+import solver
 
 
 class Play(Scene):
@@ -22,9 +22,8 @@ class Play(Scene):
         internalBoard = game.Board()
         counter = 0
         while (not internalBoard.gameOver and counter < 9):
-            square = Rand.randint(0,8)
-            if internalBoard.board[square] != 0:
-                continue
+            #Any of the moves that keep the best result, so both sides play perfectly
+            square = solver.BestMove(internalBoard)
             internalBoard.MakeMove(square)
             counter += 1
 
@@ -45,12 +44,14 @@ class Play(Scene):
         self.play(Write(gameOverText))
                 
         winnerText = Tex(r"wins!")
-        if internalBoard.player == 1:
-            winner = circle.copy().scale(0.25)
-        elif internalBoard.player == -1:
-            winner = cross.copy().scale(0.25)
-        else:
+        if not internalBoard.gameOver:
             winnerText = Tex(r"Draw!")
-        winner.next_to(winnerText, LEFT, buff=0.25)
-        winnerGroup = VGroup(winner, winnerText).center().to_edge(DOWN, buff=0.25)
+            winnerGroup = VGroup(winnerText).center().to_edge(DOWN, buff=0.25)
+        else:
+            if internalBoard.player == 1:
+                winner = circle.copy().scale(0.25)
+            else:
+                winner = cross.copy().scale(0.25)
+            winner.next_to(winnerText, LEFT, buff=0.25)
+            winnerGroup = VGroup(winner, winnerText).center().to_edge(DOWN, buff=0.25)
         self.play(Create(winnerGroup))
\ No newline at end of file
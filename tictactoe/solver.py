@@ -0,0 +1,170 @@
+#Perfect play for tic-tac-toe. Solve walks every reachable position once, folding the 8 rotations and reflections
+#of the board into one canonical position, and stores each one's negamax value for the side to move. A win is
+#worth 1 plus the number of squares left empty, so quicker wins (and slower losses) score better, and a draw is 0.
+#The table is saved as JSON and loaded from there afterwards, so looking a position up is a dictionary access.
+#BoardModel hands the same positions to the alpha-beta engine's TTNegamax, whose transposition table is keyed on
+#CanonicalKey, for solving a single position without building the whole table.
+#Run from this folder to (re)build it: python solver.py
+import json
+import os
+import random as Rand
+import sys
+import time
+import game
+
+#The search engine lives with the alpha-beta scenes
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "alphabeta"))
+from search import TTNegamax, TranspositionTable
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solved.json")
+
+def _Symmetries():
+    #Each symmetry as the square every square moves to
+    rows_cols = [(square // 3, square % 3) for square in range(9)]
+    transforms = [
+        lambda row, col: (row, col),
+        lambda row, col: (col, 2-row),
+        lambda row, col: (2-row, 2-col),
+        lambda row, col: (2-col, row),
+        lambda row, col: (row, 2-col),
+        lambda row, col: (2-row, col),
+        lambda row, col: (col, row),
+        lambda row, col: (2-col, 2-row),
+    ]
+    return [[3*new_row + new_col for new_row, new_col in (transform(row, col) for row, col in rows_cols)] for transform in transforms]
+
+SYMMETRIES = _Symmetries()
+#Every 9-bit mask under every symmetry, so canonicalising a position is 16 lookups
+SYMMETRY_TABLES = [[sum(1 << permutation[square] for square in range(9) if mask >> square & 1) for mask in range(512)] for permutation in SYMMETRIES]
+
+def CanonicalKey(masks):
+    #Smallest of the position's 8 images, packed as player 1's mask in the low 9 bits and player -1's above them
+    return min(table[masks[0]] | table[masks[1]] << 9 for table in SYMMETRY_TABLES)
+
+def Solve():
+    board = game.Board()
+    table = {}
+
+    def Search():
+        key = CanonicalKey(board.masks)
+        if key in table:
+            return table[key]
+        empty = 9 - bin(board.Occupied()).count("1")
+        if board.gameOver:
+            #The player who just moved won
+            value = -(1 + empty)
+        elif empty == 0:
+            value = 0
+        else:
+            value = -10
+            for square in board.Moves():
+                board.MakeMove(square)
+                value = max(value, -Search())
+                board.UnmakeMove()
+        table[key] = value
+        return value
+
+    Search()
+    return table
+
+class BoardModel:
+    #game.Board for search.TTNegamax. A position is the (player 1 mask, player -1 mask) pair Board.Key gives, and the
+    #table key is its CanonicalKey, so the 8 symmetric copies of a position share one entry. Values are the same as
+    #Solve's for the side to move
+    def Key(self, position):
+        return CanonicalKey(position)
+
+    def Board(self, position):
+        board = game.Board()
+        board.masks = list(position)
+        board.player = 1 if bin(position[0]).count("1") == bin(position[1]).count("1") else -1
+        board.IsGameOver()
+        return board
+
+    def Children(self, position):
+        board = self.Board(position)
+        if board.gameOver:
+            return []
+        children = []
+        for square in board.Moves():
+            board.MakeMove(square)
+            children.append(board.Key())
+            board.UnmakeMove()
+        return children
+
+    def Value(self, position):
+        #Only asked for positions with no moves, a win for whoever just moved or a full board
+        board = self.Board(position)
+        empty = 9 - bin(board.Occupied()).count("1")
+        return -(1 + empty) if board.gameOver else 0
+
+def TTSolve(board=None, table=None):
+    #Value of board (the empty board by default) for the side to move through TTNegamax, without solving every position.
+    #Returns the search result and the table, whose Stats() has the hit rate
+    position = (0, 0) if board is None else board.Key()
+    table = TranspositionTable() if table is None else table
+    return TTNegamax(BoardModel(), position, table=table, record_trace=False), table
+
+def ReachablePositions():
+    #Every position a game can get to, without folding symmetries, and stopping at wins
+    board = game.Board()
+    positions = set()
+
+    def Visit():
+        if board.Key() in positions:
+            return
+        positions.add(board.Key())
+        if board.gameOver:
+            return
+        for square in board.Moves():
+            board.MakeMove(square)
+            Visit()
+            board.UnmakeMove()
+
+    Visit()
+    return positions
+
+def SaveTable(table, path=TABLE_PATH):
+    with open(path, "w") as file:
+        json.dump({str(key): value for key, value in table.items()}, file)
+
+def LoadTable(path=TABLE_PATH):
+    #Solves and saves the table the first time
+    if not os.path.exists(path):
+        table = Solve()
+        SaveTable(table, path)
+        return table
+    with open(path) as file:
+        return {int(key): value for key, value in json.load(file).items()}
+
+TABLE = None
+
+def Value(board, table=None):
+    global TABLE
+    if table is None:
+        TABLE = TABLE or LoadTable()
+        table = TABLE
+    return table[CanonicalKey(board.masks)]
+
+def BestMoves(board, table=None):
+    #Every move that keeps the best value for the side to move
+    values = {}
+    for square in board.Moves():
+        board.MakeMove(square)
+        values[square] = -Value(board, table)
+        board.UnmakeMove()
+    best = max(values.values(), default=None)
+    return [square for square, value in values.items() if value == best]
+
+def BestMove(board, table=None):
+    return Rand.choice(BestMoves(board, table))
+
+if __name__ == "__main__":
+    table = Solve()
+    SaveTable(table)
+    reachable = ReachablePositions()
+    print(f"Solved {len(reachable)} reachable positions as {len(table)} up to symmetry, the empty board is worth {table[0]}. Saved to {TABLE_PATH}")
+    started = time.perf_counter()
+    result, tt = TTSolve()
+    stats = tt.Stats()
+    print(f"TTNegamax: the empty board is worth {result.value}, {result.nodes} nodes in {(time.perf_counter() - started)*1000:.1f} ms, {stats['hit_rate']:.1%} of {stats['probes']} probes hit the table")